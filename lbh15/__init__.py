@@ -1,24 +1,58 @@
-"""__init__ module of lbh15 package"""
+"""__init__ module of lbh15 package. The public classes and modules are
+imported at first access, so that lightweight submodules, e.g.,
+:mod:`lbh15.client`, can be imported without importing the liquid metal
+classes and their dependencies."""
+import importlib
 
 __version__ = "2.1.0"
 __author__ = "Daniele Panico, Daniele Tomatis, Gabriele Ottino"
 __company__ = "newcleo"
 __date__ = "04 April 2024"
 
-from .lead import Lead
-from .bismuth import Bismuth
-from .lbe import LBE
-from .properties import lead_properties
-from .properties import bismuth_properties
-from .properties import lbe_properties
-from .properties.bismuth_thermochemical_properties import solubility_in_bismuth
-from .properties.bismuth_thermochemical_properties import diffusivity_in_bismuth
-from .properties.bismuth_thermochemical_properties import bismuth_thermochemical
-from .properties.lbe_thermochemical_properties import solubility_in_lbe
-from .properties.lbe_thermochemical_properties import diffusivity_in_lbe
-from .properties.lbe_thermochemical_properties import lbe_thermochemical
-from .properties.lbe_thermochemical_properties import lbe_oxygen_limits
-from .properties.lead_thermochemical_properties import solubility_in_lead
-from .properties.lead_thermochemical_properties import diffusivity_in_lead
-from .properties.lead_thermochemical_properties import lead_thermochemical
-from .properties.lead_thermochemical_properties import lead_oxygen_limits
\ No newline at end of file
+_BI_THERMO = '.properties.bismuth_thermochemical_properties'
+_LBE_THERMO = '.properties.lbe_thermochemical_properties'
+_LEAD_THERMO = '.properties.lead_thermochemical_properties'
+
+# Public names, each one with the module defining it (relative to the
+# package) and its attribute name in the module (None for modules)
+_PUBLIC = {
+    'Lead': ('.lead', 'Lead'),
+    'Bismuth': ('.bismuth', 'Bismuth'),
+    'LBE': ('.lbe', 'LBE'),
+    'lead_properties': ('.properties.lead_properties', None),
+    'bismuth_properties': ('.properties.bismuth_properties', None),
+    'lbe_properties': ('.properties.lbe_properties', None),
+    'lead_derived_properties': ('.properties.lead_derived_properties', None),
+    'bismuth_derived_properties': ('.properties.bismuth_derived_properties',
+                                   None),
+    'lbe_derived_properties': ('.properties.lbe_derived_properties', None),
+    'solubility_in_bismuth': (_BI_THERMO + '.solubility_in_bismuth', None),
+    'diffusivity_in_bismuth': (_BI_THERMO + '.diffusivity_in_bismuth', None),
+    'bismuth_thermochemical': (_BI_THERMO + '.bismuth_thermochemical', None),
+    'solubility_in_lbe': (_LBE_THERMO + '.solubility_in_lbe', None),
+    'diffusivity_in_lbe': (_LBE_THERMO + '.diffusivity_in_lbe', None),
+    'lbe_thermochemical': (_LBE_THERMO + '.lbe_thermochemical', None),
+    'lbe_oxygen_limits': (_LBE_THERMO + '.lbe_oxygen_limits', None),
+    'solubility_in_lead': (_LEAD_THERMO + '.solubility_in_lead', None),
+    'diffusivity_in_lead': (_LEAD_THERMO + '.diffusivity_in_lead', None),
+    'lead_thermochemical': (_LEAD_THERMO + '.lead_thermochemical', None),
+    'lead_oxygen_limits': (_LEAD_THERMO + '.lead_oxygen_limits', None),
+}
+
+__all__ = list(_PUBLIC)
+
+
+def __getattr__(name):
+    if name not in _PUBLIC:
+        raise AttributeError(f"module '{__name__}' has no attribute "
+                             f"'{name}'")
+    module_name, attribute = _PUBLIC[name]
+    value = importlib.import_module(module_name, __name__)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_PUBLIC))
@@ -0,0 +1,6 @@
+"""Module allowing the execution of lbh15 package as a script, i.e.,
+`python -m lbh15`, equivalent to the `lbh15` console command"""
+import sys
+from .cli import main
+
+sys.exit(main())
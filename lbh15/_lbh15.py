@@ -1,6 +1,5 @@
 """Module with the definition of liquid metal object base class,
 i.e., LiquidMetalInterface"""
-import warnings
 import sys
 import inspect
 import importlib
@@ -10,15 +9,19 @@ from abc import ABC
 from abc import abstractmethod
 from collections import defaultdict
 from functools import partial
+from time import perf_counter
 from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import Union
+import numpy as np
 from scipy.constants import atm
 from scipy.optimize import fsolve
 from .properties.interface import PropertyInterface
-
-warnings.simplefilter("always")
+from .properties.tph_common_interface import DerivedPropertyInterface
+from . import diagnostics
+from . import profiling
+from .snapshot import record_dtype
 
 
 class LiquidMetalInterface(ABC):
@@ -30,6 +33,13 @@ class LiquidMetalInterface(ABC):
     p : float, optional
         Pressure in [Pa], by default the atmospheric pressure value, i.e.,
         101325.0 Pa
+    T_guess : float, optional
+        Temperature in [K] the computation of the temperature starts from
+        when initializing from a property other than temperature, e.g.,
+        the temperature of the previous time step. The root selected by
+        :func:`~LiquidMetalInterface.set_root_to_use` is kept whatever
+        the guess value. By default, `None`, i.e., the default guess
+        values are adopted
     **kwargs : dict
         One-item dictionary that specifies the quantity which the object shall
         be initialized from. The default available ones are:
@@ -63,7 +73,8 @@ class LiquidMetalInterface(ABC):
     __p: float = 0
     __T: float = 0
 
-    def __init__(self, p: float = atm, **kwargs):
+    def __init__(self, p: float = atm, T_guess: Union[float, None] = None,
+                 **kwargs):
         if len(kwargs) != 1:
             raise ValueError("One and only one property at "
                              "time can be used for initialization. "
@@ -72,10 +83,11 @@ class LiquidMetalInterface(ABC):
         self.__properties: Dict[str, PropertyInterface] = {}
         self.__corr2use: Dict[str, str] = \
             copy.deepcopy(self.__class__._correlations_to_use)
+        self._follow_cp(self.__corr2use)
         self.__fill_instance_properties()
         self._set_constants()
         name, value = kwargs.popitem()
-        self.__fill_instance_attributes(name, value)
+        self.__fill_instance_attributes(name, value, T_guess)
 
     @property
     def T_m0(self) -> float:
@@ -189,29 +201,104 @@ class LiquidMetalInterface(ABC):
         """
         # Manage the case the property is not among the currently used ones
         if property_name not in self.__properties:
-            warnings.warn(f"'{property_name}' property not in use."
-                          "\nNothing to change.", stacklevel=5)
+            diagnostics.report(f"'{property_name}' property not in use."
+                               "\nNothing to change.", stacklevel=5)
             return
         # Manage the case the input correlation is already used
         if (self.__properties[property_name].correlation_name
                 == correlation_name):
-            warnings.warn(f"'{property_name}' property "
-                          f"implementing '{correlation_name}' correlation "
-                          "already in use. \nNothing to change.",
-                          stacklevel=5)
+            diagnostics.report(f"'{property_name}' property implementing "
+                               f"'{correlation_name}' correlation already "
+                               "in use. \nNothing to change.",
+                               stacklevel=5)
             return
         # Manage the case the input correlation not among the available ones
         key = property_name + "__" + correlation_name
         if key not in self._available_properties_dict:
-            warnings.warn(f"'{property_name}' property implementing "
-                          f"'{correlation_name}' correlation not among"
-                          "the available ones. \nNothing to change.",
-                          stacklevel=5)
+            diagnostics.report(f"'{property_name}' property implementing "
+                               f"'{correlation_name}' correlation not among"
+                               "the available ones. \nNothing to change.",
+                               stacklevel=5)
+            return
+        # Manage the case the property is derived from the specific heat
+        # capacity, whose correlation it follows
+        cp_corr = self.__properties['cp'].correlation_name \
+            if 'cp' in self.__properties else None
+        if property_name in self._derived_properties() \
+                and cp_corr is not None and correlation_name != cp_corr:
+            diagnostics.report(f"'{property_name}' property is derived from "
+                               "the specific heat capacity, whose "
+                               f"'{cp_corr}' correlation is in use. "
+                               "\nNothing to change.", stacklevel=5)
             return
         # If here, the input correlation is to apply
         self.__add_property(self._available_properties_dict[key])
         if property_name in self._default_corr_to_use:
             self.__corr2use[property_name] = correlation_name
+        if property_name == 'cp':
+            for name in self._derived_properties():
+                if correlation_name in self._available_correlations_dict[name]:
+                    self.__add_property(self._available_properties_dict[
+                        name + "__" + correlation_name])
+                    if name in self._default_corr_to_use:
+                        self.__corr2use[name] = correlation_name
+
+    def update(self, **kwargs) -> None:
+        """
+        Updates the liquid metal temperature from the value of one
+        property. The temperature is computed starting from the current
+        one, so that only a few iterations are needed when the property
+        value is close to the current one, e.g., when following
+        a transient.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            One-item dictionary that specifies the quantity which the
+            temperature shall be computed from, as for the initialization
+        """
+        if len(kwargs) != 1:
+            raise ValueError("One and only one property at "
+                             "time can be used for update. "
+                             f"{len(kwargs)} were provided")
+        name, value = kwargs.popitem()
+        self.__fill_instance_attributes(name, value, self.__T)
+
+    def snapshot(self, properties: Union[List[str], None] = None
+                 ) -> np.ndarray:
+        """
+        Returns the current state, i.e., temperature, pressure and
+        property values, as a structured record whose fields are named
+        after the properties. The units, the long names and the
+        correlations of the fields are stored in the metadata of its data
+        type, see :func:`lbh15.snapshot.record_dtype`. Records can be
+        logged by :class:`lbh15.snapshot.SnapshotLog`.
+
+        Parameters
+        ----------
+        properties : List[str] | None, optional
+            names of the properties to store; if `None`, all the
+            properties in use are stored, sorted by name. By default,
+            `None`
+
+        Returns
+        -------
+        np.ndarray
+            zero-dimensional structured array
+        """
+        if properties is None:
+            objects = dict(sorted(self.__properties.items()))
+        else:
+            not_found = [name for name in properties
+                         if name not in self.__properties]
+            if len(not_found) > 0:
+                raise ValueError(f"Required '{not_found}' properties not "
+                                 f"found for {type(self).__name__}!")
+            objects = {name: self.__properties[name] for name in properties}
+        return np.array((self.__T, self.__p,
+                         *[obj.correlation(self.__T, self.__p, True)
+                           for obj in objects.values()]),
+                        dtype=record_dtype(objects))
 
     def check_temperature(self, T: float) -> Tuple[bool, str]:
         """
@@ -306,9 +393,9 @@ class LiquidMetalInterface(ABC):
         props_not_avail = [
             pr for pr in properties if pr not in props_dict.keys()]
         if len(props_not_avail) > 0:
-            warnings.warn(f"Required '{props_not_avail}' properties not found!"
-                          "\nPlease check the property name(s) "
-                          "and try again!", stacklevel=5)
+            diagnostics.report(f"Required '{props_not_avail}' properties "
+                               "not found!\nPlease check the property name(s) "
+                               "and try again!", stacklevel=5)
 
         return {k: v for k, v in props_dict.items() if k in properties}
 
@@ -324,8 +411,24 @@ class LiquidMetalInterface(ABC):
             Name of the property
         correlation_name : str
             Name of the correlation
-        """
+
+        Notes
+        -----
+        The properties derived from the specific heat capacity, e.g., the
+        isochoric one, follow the correlation set for the latter, hence
+        setting a different correlation for them raises an error.
+        """
+        cls._fill_class_registry()
+        if property_name in cls._derived_properties():
+            cp_corr = cls._correlations_to_use.get('cp')
+            if cp_corr is not None and correlation_name != cp_corr:
+                raise ValueError(f"'{property_name}' property is derived "
+                                 "from the specific heat capacity, whose "
+                                 f"'{cp_corr}' correlation is in use: set "
+                                 "the 'cp' correlation instead")
         cls._correlations_to_use[property_name] = correlation_name
+        if property_name == 'cp':
+            cls._follow_cp(cls._correlations_to_use)
 
     @classmethod
     def set_root_to_use(cls, property_name: str, root_index: int) -> None:
@@ -361,9 +464,9 @@ class LiquidMetalInterface(ABC):
 
         # Exit if the file passed as argument does not exist
         if not norm_path.exists():
-            warnings.warn(f"'{norm_path}' provided file not found!"
-                          "\nPlease check the file path and try again!"
-                          "\nNo custom property added.", stacklevel=5)
+            diagnostics.report(f"'{norm_path}' provided file not found!"
+                               "\nPlease check the file path and try again!"
+                               "\nNo custom property added.", stacklevel=5)
             return
 
         # Add filename and the corresponding path to the class dict
@@ -373,6 +476,10 @@ class LiquidMetalInterface(ABC):
             cls._custom_properties_path[path] = [file_name]
         else:
             cls._custom_properties_path[path].append(file_name)
+        # Invalidate the class registry so that it is rebuilt
+        # including the new custom properties
+        cls._available_properties_dict = {}
+        cls._available_correlations_dict = {}
 
     @classmethod
     def correlations_to_use(cls) -> Dict[str, str]:
@@ -401,7 +508,151 @@ class LiquidMetalInterface(ABC):
         """
         return copy.deepcopy(cls._roots_to_use)
 
-    def __compute_T(self, input_value: float, input_property: str) -> float:
+    @classmethod
+    def _properties_to_use(cls,
+                           correlations: Union[Dict[str, str], None] = None
+                           ) -> Dict[str, PropertyInterface]:
+        """
+        Returns the property objects, keyed by property name, that are
+        adopted when evaluating the properties without building an
+        instance, i.e., by the functions of the :py:mod:`lbh15.batch`
+        module. The registry of the available property objects is built
+        once at class level and re-used by the subsequent calls.
+
+        Parameters
+        ----------
+        correlations : Dict[str, str] | None, optional
+            dictionary defining the correlation to use for the
+            corresponding property. It takes precedence over the
+            class-level choice made by
+            :func:`~LiquidMetalInterface.set_correlation_to_use`.
+            By default, `None`
+
+        Returns
+        -------
+        Dict[str, PropertyInterface]
+        """
+        cls._fill_class_registry()
+        corr2use = cls.correlations_to_use()
+        if correlations is not None:
+            for name, corr_name in correlations.items():
+                if name + "__" + corr_name not in \
+                        cls._available_properties_dict:
+                    raise ValueError(f"'{name}' property implementing "
+                                     f"'{corr_name}' correlation not among "
+                                     "the available ones")
+            corr2use.update(correlations)
+            cp_corr = corr2use.get('cp')
+            for name in cls._derived_properties():
+                if name in correlations and cp_corr is not None \
+                        and correlations[name] != cp_corr:
+                    raise ValueError(f"'{name}' property implementing "
+                                     f"'{correlations[name]}' correlation "
+                                     "is derived from the specific heat "
+                                     f"capacity, whose '{cp_corr}' "
+                                     "correlation is in use")
+            cls._follow_cp(corr2use)
+
+        properties = {}
+        for name, corr_names in cls._available_correlations_dict.items():
+            # Apply the chosen correlation, if available, otherwise
+            # restore the default one or the last loaded one, as done
+            # at instance level
+            if name in corr2use and corr2use[name] in corr_names:
+                corr_name = corr2use[name]
+            elif name in cls._default_corr_to_use:
+                corr_name = cls._default_corr_to_use[name]
+            else:
+                corr_name = corr_names[-1]
+            properties[name] = \
+                cls._available_properties_dict[name + "__" + corr_name]
+        return properties
+
+    @classmethod
+    def _property_correlations(cls, property_name: str
+                               ) -> Dict[str, PropertyInterface]:
+        """
+        Returns all the available property objects implementing the
+        property passed as argument, keyed by correlation name and
+        sorted alphabetically.
+
+        Parameters
+        ----------
+        property_name : str
+            Name of the property
+
+        Returns
+        -------
+        Dict[str, PropertyInterface]
+        """
+        cls._fill_class_registry()
+        if property_name not in cls._available_correlations_dict:
+            raise ValueError(f"Required '{property_name}' property "
+                             f"not found for {cls.__name__}!")
+        return {corr_name: cls._available_properties_dict[
+                    property_name + "__" + corr_name]
+                for corr_name in
+                sorted(cls._available_correlations_dict[property_name])}
+
+    @classmethod
+    def _fill_class_registry(cls) -> None:
+        """
+        Fills the class dict attribute storing all the property objects
+        loaded from the modules and the one storing all the corresponding
+        available correlations, if not already done.
+        """
+        if len(cls._available_properties_dict) > 0:
+            return
+        available_properties_list = cls.__load_properties()
+        available_properties_list += cls.__load_custom_properties()
+        cls._available_properties_dict = {e.name + '__' +
+                                          e.correlation_name: e for e in
+                                          available_properties_list}
+        cls._available_correlations_dict = \
+            cls.__extract_available_correlations(available_properties_list)
+        # pylint: disable=protected-access
+        if profiling._active is not None:
+            profiling._active.record_registry_build(cls.__name__)
+
+    @classmethod
+    def _derived_properties(cls) -> List[str]:
+        """
+        Returns the names of the properties derived from the specific heat
+        capacity, see
+        :class:`~lbh15.properties.tph_common_interface.DerivedPropertyInterface`.
+
+        Returns
+        -------
+        List[str]
+        """
+        cls._fill_class_registry()
+        return [name for name, corr_names
+                in cls._available_correlations_dict.items()
+                if isinstance(cls._available_properties_dict[
+                    name + "__" + corr_names[0]], DerivedPropertyInterface)]
+
+    @classmethod
+    def _follow_cp(cls, corr2use: Dict[str, str]) -> None:
+        """
+        Aligns in place the correlations of the properties derived from
+        the specific heat capacity to the one of the latter, if the
+        derived properties implement it.
+
+        Parameters
+        ----------
+        corr2use : Dict[str, str]
+            dictionary defining the correlation to use for the
+            corresponding property
+        """
+        cp_corr = corr2use.get('cp')
+        if cp_corr is None:
+            return
+        for name in cls._derived_properties():
+            if cp_corr in cls._available_correlations_dict[name]:
+                corr2use[name] = cp_corr
+
+    def __compute_T(self, input_value: float, input_property: str,
+                    T_guess: Union[float, None] = None) -> float:
         """
         Computes the temperature in [K] that is then set as value
         of the object property
@@ -412,6 +663,12 @@ class LiquidMetalInterface(ABC):
             value of the property used to compute the temperature
         input_property : str
             name of the property used to perform the calculation
+        T_guess : float, optional
+            temperature in [K] the Newton iterations start from; if `None`,
+            if they do not converge or if they converge to a root other
+            than the one selected by
+            :func:`~LiquidMetalInterface.set_root_to_use`, the root finder
+            starts from the default guess values. By default, `None`
         """
         # Manage the simplest case
         if input_property == 'T':
@@ -424,6 +681,26 @@ class LiquidMetalInterface(ABC):
                                     f"{input_property}! The temperature "
                                     "value can not be computed!")
 
+        # Warm start from the provided temperature, if any
+        if T_guess is not None:
+            try:
+                res, evaluations = _newton(
+                    self.__properties[input_property], input_value, T_guess,
+                    self.__p)
+            except RuntimeError:
+                pass
+            else:
+                # Roots on another branch than the selected one are
+                # discarded, the temperature being computed from scratch
+                if _on_branch(self.__properties[input_property], res,
+                              self._roots_to_use.get(input_property, 0)):
+                    # pylint: disable=protected-access
+                    if profiling._active is not None:
+                        profiling._active.record_solver(
+                            type(self).__name__, input_property, evaluations,
+                            False)
+                    return float(res)
+
         def function_to_solve(T: float, target: float) -> float:
             return function_of_T(T, self.__p) - target
 
@@ -436,16 +713,22 @@ class LiquidMetalInterface(ABC):
         # injectivity of the property correlation
         if self.__properties[input_property].is_injective:
             index = 0
-            res, _, ier, msg = fsolve(function_to_solve, x0=[self._guess],
-                                      args=(input_value), xtol=1e-10,
-                                      full_output=True)
+            res, info, ier, msg = fsolve(function_to_solve,
+                                         x0=[self._guess],
+                                         args=(input_value), xtol=1e-10,
+                                         full_output=True)
         else:
             index = (self._roots_to_use[input_property]
                      if input_property in self._roots_to_use else 0)
-            res, _, ier, msg = fsolve(function_to_solve,
-                                      x0=[self._guess, 3*self._guess],
-                                      args=(input_value), xtol=1e-10,
-                                      full_output=True)
+            res, info, ier, msg = fsolve(function_to_solve,
+                                         x0=[self._guess, 3*self._guess],
+                                         args=(input_value), xtol=1e-10,
+                                         full_output=True)
+        # pylint: disable=protected-access
+        if profiling._active is not None:
+            profiling._active.record_solver(type(self).__name__,
+                                            input_property, info['nfev'],
+                                            ier != 1)
         # Raise an exception in case the solver did not converge
         if ier == 0:
             raise RuntimeError(f"Error: {msg}\n"
@@ -459,20 +742,13 @@ class LiquidMetalInterface(ABC):
         """
         Fills instance properties.
         """
-        # Build the dict attribute storing all the property objects
-        # loaded from loaded modules and the dict attribute storing
-        # all the corresponding available correlations. Both these actions
-        # are performed only once, when an instance is built, that is,
-        # when the property dict attribute is empty.
-        if len(self._available_properties_dict) == 0:
-            available_properties_list = self.__load_properties()
-            available_properties_list += self.__load_custom_properties()
-            self._available_properties_dict = {e.name + '__' +
-                                               e.correlation_name: e for e in
-                                               available_properties_list}
-            self._available_correlations_dict = \
-                self.__extract_available_correlations(
-                    available_properties_list)
+        # Build the class dict attribute storing all the property objects
+        # loaded from loaded modules and the one storing all the
+        # corresponding available correlations. Both these actions are
+        # performed only once, when the first instance is built, that is,
+        # when the property dict attribute is empty, so that the following
+        # instances share them.
+        self._fill_class_registry()
 
         for key, property_object in self._available_properties_dict.items():
             name = key.split("__")[0]
@@ -486,7 +762,9 @@ class LiquidMetalInterface(ABC):
         self.__align_corrs_to_properties()
 
     def __fill_instance_attributes(self, property_name: str,
-                                   property_value: float) -> None:
+                                   property_value: float,
+                                   T_guess: Union[float, None] = None
+                                   ) -> None:
         """
         Fills all the class attributes.
 
@@ -498,6 +776,9 @@ class LiquidMetalInterface(ABC):
         property_value: float
             value of the property the liquid metal instance
             is initialized upon
+        T_guess : float, optional
+            temperature in [K] the computation of the temperature
+            starts from, by default `None`
         """
         valid_prop = set(['T'] + [p.split("__")[0] for p in
                                   self._available_properties_dict])
@@ -509,7 +790,8 @@ class LiquidMetalInterface(ABC):
                              f"the following properties:{list_to_print}"
                              f"{property_name} was provided")
 
-        temperature = self.__compute_T(property_value, property_name)
+        temperature = self.__compute_T(property_value, property_name,
+                                       T_guess)
         self.__assign_T(temperature)
 
     def __assign_T(self, T: float) -> None:
@@ -602,12 +884,13 @@ class LiquidMetalInterface(ABC):
 
             if key not in self.__properties:
                 if not is_in_default:
-                    warnings.warn(f"Could not find '{key}' property "
-                                  f"implementing '{corr_name}' correlation. "
-                                  f"\nGoing to restore {key} property from "
-                                  f"the {type(self)}-related modules, "
-                                  "if any.",
-                                  stacklevel=5)
+                    diagnostics.report(f"Could not find '{key}' property "
+                                       f"implementing '{corr_name}' "
+                                       "correlation. \nGoing to restore "
+                                       f"{key} property from the "
+                                       f"{type(self)}-related modules, "
+                                       "if any.",
+                                       stacklevel=5)
                     self.__remove_property(key)
                     if key in self._available_correlations_dict:
                         self.__add_property(
@@ -616,22 +899,23 @@ class LiquidMetalInterface(ABC):
                                 self._available_correlations_dict[key][-1]])
                 else:
                     def_corr_name = self._default_corr_to_use[key]
-                    warnings.warn(f"Could not find property '{key}' "
-                                  f"implementing '{corr_name}' correlation. "
-                                  "\nGoing to restore default correlation "
-                                  f"'{def_corr_name}'.",
-                                  stacklevel=5)
+                    diagnostics.report(f"Could not find property '{key}' "
+                                       f"implementing '{corr_name}' "
+                                       "correlation. \nGoing to restore "
+                                       "default correlation "
+                                       f"'{def_corr_name}'.",
+                                       stacklevel=5)
                     self.__corr2use[key] = def_corr_name
                     self.__add_property(
                         self._available_properties_dict[
                             key + "__" + def_corr_name])
             else:
                 if corr_name != self.__properties[key].correlation_name:
-                    warnings.warn(f"Could not find property '{key}' "
-                                  f"implementing '{corr_name}' correlation. "
-                                  "\nGoing to remove it from correlations "
-                                  "to use.",
-                                  stacklevel=5)
+                    diagnostics.report(f"Could not find property '{key}' "
+                                       f"implementing '{corr_name}' "
+                                       "correlation. \nGoing to remove it "
+                                       "from correlations to use.",
+                                       stacklevel=5)
                     if is_in_default:
                         self.__corr2use[key] = \
                             self.__properties[key].correlation_name
@@ -699,7 +983,8 @@ class LiquidMetalInterface(ABC):
         # Collect all valid properties neglecting duplicates
         mod = []
         for module in eff_modules:
-            mod += inspect.getmembers(sys.modules[module], is_valid)
+            mod += inspect.getmembers(importlib.import_module(module),
+                                      is_valid)
         mod_set = set(list(map(list, zip(*mod)))[1])
         # Build property instances and add them to the list to return
         prop_list = []
@@ -769,7 +1054,15 @@ class LiquidMetalInterface(ABC):
             raise AttributeError(f"'{type(self).__name__}' object "
                                  f"has no attribute '{name}'")
 
-        return self.__properties[name].correlation(self.__T, self.__p, True)
+        property_object = self.__properties[name]
+        # pylint: disable=protected-access
+        if profiling._active is None:
+            return property_object.correlation(self.__T, self.__p, True)
+        start = perf_counter()
+        value = property_object.correlation(self.__T, self.__p, True)
+        profiling._active.record_call(property_object,
+                                      perf_counter() - start)
+        return value
 
     def __str__(self) -> str:
         rvalue = (f"{type(self).__name__} liquid metal "
@@ -798,3 +1091,139 @@ class LiquidMetalInterface(ABC):
         rvalue = rvalue[:-2]
         rvalue += ")"
         return rvalue
+
+
+def _on_branch(property_object: PropertyInterface,
+               T: Union[float, np.ndarray], root_index: int) -> np.ndarray:
+    """
+    Checks whether the temperature values belong to the branch of the
+    property correlation selected by the root index, i.e., whether they
+    lie below its interior extremum for the first root and above it for
+    the second one. Always `True` for injective correlations.
+
+    Parameters
+    ----------
+    property_object : PropertyInterface
+        property object whose correlation is inverted
+    T : float | np.ndarray
+        temperature value(s) in [K]
+    root_index : int
+        index of the temperature root to use
+
+    Returns
+    -------
+    np.ndarray
+        `True` where the temperature belongs to the selected branch
+    """
+    if property_object.is_injective:
+        return np.ones(np.shape(T), dtype=bool)
+    if np.isnan(property_object.T_at_min):
+        property_object.compute_bounds()
+    # The interior extremum is the farthest from the validity range bounds
+    low, high = property_object.range
+    T_extremum = max([property_object.T_at_min, property_object.T_at_max],
+                     key=lambda T_e: min(T_e - low, high - T_e))
+    return (np.asarray(T) > T_extremum) == (root_index == 1)
+
+
+def _newton(property_object: PropertyInterface,
+            target: Union[float, np.ndarray],
+            T_guess: Union[float, np.ndarray],
+            p: Union[float, np.ndarray] = atm, xtol: float = 1e-10,
+            max_iter: int = 50, rtol: float = 1e-12, strict: bool = True
+            ) -> Tuple[np.ndarray, int]:
+    """
+    Computes the temperature at which the property correlation takes the
+    target value by Newton iterations, performed element-wise starting
+    from the guess values and adopting the derivative of the correlation.
+    From the second iteration on, the Newton increment is corrected at the
+    second order by the secant estimate of the second derivative of the
+    correlation, which requires no further evaluations. Each element
+    stops iterating as soon as its residual is within the relative
+    tolerance, e.g., at once for a guess value already at the solution.
+    Iterations stop as soon as the temperature increments, or the errors
+    estimated from the quadratic convergence of the last two increments,
+    once the previous ones are below 1% of the temperature, are within
+    the temperature tolerance.
+
+    Parameters
+    ----------
+    property_object : PropertyInterface
+        property object whose correlation is inverted
+    target : float | np.ndarray
+        target value(s) of the property
+    T_guess : float | np.ndarray
+        temperature guess value(s) in [K]
+    p : float | np.ndarray, optional
+        Pressure in [Pa], by default the atmospheric pressure value, i.e.,
+        101325.0 Pa
+    xtol : float, optional
+        relative tolerance on the temperature increment, by default `1e-10`
+    max_iter : int, optional
+        maximum number of iterations, by default `50`
+    rtol : float, optional
+        relative tolerance on the residual, i.e., on the difference
+        between the property value and the target one, by default `1e-12`
+    strict : bool, optional
+        `True` to raise an error if any element does not converge,
+        `False` to set the temperature of those elements to `nan`
+        instead. By default, `True`
+
+    Returns
+    -------
+    Tuple[np.ndarray, int]
+        temperature in [K] and number of correlation evaluations, the
+        derivative ones excluded
+    """
+    T = np.array(np.broadcast_to(T_guess, np.broadcast(T_guess, target,
+                                                       p).shape),
+                 dtype=float)
+    # Elements still iterating
+    active = np.ones(T.shape, dtype=bool)
+    previous = None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for it in range(max_iter + 1):
+            residual = property_object.correlation(T, p) - target
+            active &= ~(np.abs(residual) <= rtol * np.abs(target))
+            if not np.any(active):
+                return T, it + 1
+            if it == max_iter:
+                break
+            derivative = property_object.derivative(T, p)
+            increment = residual / derivative
+            if previous is not None:
+                T_old, derivative_old, increment_old = previous
+                curvature = (derivative - derivative_old) / (T - T_old)
+                corrected = increment * (1 + increment * curvature
+                                         / (2 * derivative))
+                # Corrections making the step longer than twice the
+                # Newton one are discarded
+                increment = np.where(np.isfinite(corrected)
+                                     & (np.abs(corrected)
+                                        < 2 * np.abs(increment)),
+                                     corrected, increment)
+            increment = np.where(active, increment, 0.0)
+            # Halve the temperature instead of making it non-positive
+            T_new = np.where(increment < T, T - increment, T / 2)
+            finite = np.isfinite(T_new)
+            if strict and not np.all(finite):
+                break
+            active &= finite
+            size = np.abs(increment)
+            converged = size <= xtol * np.abs(T_new)
+            if previous is not None:
+                # Error estimate trusted once close enough to the root
+                converged |= (size**3 <= xtol * np.abs(T_new)
+                              * np.square(increment_old)) \
+                    & (increment_old <= 1e-2 * np.abs(T_new))
+            if np.all(converged | ~active):
+                return T_new, it + 1
+            previous = (T, derivative, size)
+            T = T_new
+    if not strict:
+        T[active | ~np.isfinite(T)] = np.nan
+        return T, it + 1
+    raise RuntimeError("Error: the temperature value at which "
+                       f"'{property_object.name}' property takes the "
+                       "required value can not be computed by Newton "
+                       f"iterations within {max_iter} iterations")
@@ -0,0 +1,77 @@
+"""Module with the definition of the pool of scratch arrays supporting
+the in-place evaluation of the property correlations"""
+import copy
+from typing import Dict
+from typing import List
+from typing import Tuple
+import numpy as np
+
+
+class ScratchPool:
+    """
+    Pool of reusable scratch arrays. Arrays are allocated at the first
+    request of each index, shape and data type, and returned again at
+    the following requests, so that repeated evaluations over arrays of
+    the same shape do not allocate any memory.
+    """
+    def __init__(self):
+        self.__buffers: Dict[Tuple[Tuple[int, ...], str],
+                             List[np.ndarray]] = {}
+        self.__offset: int = 0
+
+    def get(self, index: int, like: np.ndarray) -> np.ndarray:
+        """
+        Returns the scratch array with the required index having the
+        same shape and data type of the array passed as argument.
+
+        Parameters
+        ----------
+        index : int
+            index of the scratch array
+        like : np.ndarray
+            array whose shape and data type are adopted
+
+        Returns
+        -------
+        np.ndarray
+            scratch array, whose content is undefined
+        """
+        key = (like.shape, like.dtype.str)
+        buffers = self.__buffers.setdefault(key, [])
+        index += self.__offset
+        while len(buffers) <= index:
+            buffers.append(np.empty_like(like))
+        return buffers[index]
+
+    def shifted(self, offset: int) -> "ScratchPool":
+        """
+        Returns a view of the pool whose indices are shifted by
+        `offset`, sharing the same scratch arrays. It is used for
+        nested evaluations not to overwrite the scratch arrays in use.
+
+        Parameters
+        ----------
+        offset : int
+            number of scratch arrays to skip
+
+        Returns
+        -------
+        ScratchPool
+        """
+        pool = copy.copy(self)
+        pool.__offset += offset
+        return pool
+
+    @property
+    def nbytes(self) -> int:
+        """
+        int : total number of bytes of the scratch arrays
+        """
+        return sum(array.nbytes for buffers in self.__buffers.values()
+                   for array in buffers)
+
+    def clear(self) -> None:
+        """
+        Releases all the scratch arrays.
+        """
+        self.__buffers.clear()
@@ -0,0 +1,867 @@
+"""Module with the functions evaluating the liquid metal properties over
+arrays of temperature values at once, i.e., without building one liquid
+metal instance per temperature value."""
+import threading
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from numpy.typing import DTypeLike
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from ._lbh15 import _newton
+from ._lbh15 import _on_branch
+from .properties.interface import PropertyInterface
+from .properties.tph_common_interface import DerivedPropertyInterface
+from .snapshot import record_dtype
+from ._scratch import ScratchPool
+from . import diagnostics
+from . import profiling
+
+# Policies adopted for the temperature values outside the liquid range
+LIQUID_POLICIES = ('raise', 'nan', 'clip', 'index')
+
+# Scratch arrays adopted by the evaluations into output arrays, one pool
+# per thread not to share them among concurrent evaluations
+_local = threading.local()
+
+
+def liquid_range(metal: Type[LiquidMetalInterface]) -> Tuple[float, float]:
+    """
+    Returns the melting and the boiling temperatures of the liquid metal
+    class passed as argument.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+
+    Returns
+    -------
+    Tuple[float, float]
+        melting and boiling temperatures in :math:`[K]`
+    """
+    # Constants are set at instance level by '_set_constants', hence
+    # an empty instance is used to read them without any initialization
+    probe = object.__new__(metal)
+    probe._set_constants()
+    return probe.T_m0, probe.T_b0
+
+
+def check_temperature(metal: Type[LiquidMetalInterface],
+                      T: Union[float, np.ndarray]) -> None:
+    """
+    Checks whether all the temperature values belong to the liquid
+    temperature range of the metal, raising the same error of the
+    liquid metal instances for the first invalid value, if any.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    """
+    T_m0, T_b0 = liquid_range(metal)
+    T = np.asarray(T)
+    # Reductions are checked first not to allocate any mask array
+    # when all the values are valid
+    if T.size == 0 or (T.min() > T_m0 and T.max() < T_b0):
+        return
+    invalid = ~((T > T_m0) & (T < T_b0))
+    if np.any(invalid):
+        temp = float(T[invalid].flat[0])
+        if temp >= T_b0:
+            error_message = ("Temperature must be smaller than "
+                             f"boiling temperature ({T_b0:.2f} [K]), "
+                             f"{temp:.2f} [K] was provided")
+        elif 0 < temp <= T_m0:
+            error_message = ("Temperature must be larger than "
+                             f"melting temperature ({T_m0:.2f} [K]), "
+                             f"{temp:.2f} [K] was provided")
+        else:
+            error_message = ("Temperature must be strictly positive, "
+                             f"{temp:.2f} [K] was provided")
+        raise ValueError(error_message)
+
+
+def validate_temperature(metal: Type[LiquidMetalInterface],
+                         T: Union[float, np.ndarray],
+                         policy: str = 'raise') -> np.ndarray:
+    """
+    Validates the temperature values against the liquid temperature range
+    of the metal, according to the policy:
+
+    - 'raise': the values are returned, after checking them as done by
+      :func:`check_temperature`;
+    - 'nan': the values are returned, with the invalid ones replaced by
+      `numpy.nan`;
+    - 'clip': the values are returned, with the invalid ones replaced by
+      the nearest bound, i.e., either the melting or the boiling
+      temperature;
+    - 'index': the indices of the invalid values in the flattened array
+      are returned, see :func:`numpy.unravel_index` for the
+      multi-dimensional ones.
+
+    When all the values are valid, the array passed as argument is
+    returned by all the policies but 'index', without copying it.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    policy : str, optional
+        policy adopted, by default 'raise'
+
+    Returns
+    -------
+    np.ndarray
+        validated temperature values in :math:`[K]`, or indices of the
+        invalid ones
+    """
+    if policy not in LIQUID_POLICIES:
+        raise ValueError(f"Policy must be one of {LIQUID_POLICIES}, "
+                         f"'{policy}' was provided")
+    T = np.asarray(T)
+    if T.dtype.kind != 'f':
+        T = T.astype(np.float64)
+    if policy == 'raise':
+        check_temperature(metal, T)
+        return T
+    T_m0, T_b0 = liquid_range(metal)
+    # Reductions are checked first not to allocate any mask array
+    # when all the values are valid
+    if T.size == 0 or (T.min() > T_m0 and T.max() < T_b0):
+        return np.empty(0, dtype=np.intp) if policy == 'index' else T
+    valid = (T > T_m0) & (T < T_b0)
+    if policy == 'index':
+        return np.flatnonzero(~valid)
+    if policy == 'nan':
+        return np.where(valid, T, np.nan).astype(T.dtype, copy=False)
+    return np.clip(T, T_m0, T_b0).astype(T.dtype, copy=False)
+
+
+def property_objects(metal: Type[LiquidMetalInterface],
+                     properties: Union[str, List[str], None] = None,
+                     correlations: Union[Dict[str, str], None] = None
+                     ) -> Dict[str, PropertyInterface]:
+    """
+    Returns the property objects adopted for evaluating the required
+    properties of the liquid metal class passed as argument.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None, optional
+        name(s) of the required property(ies). If `None`, all the
+        available properties are considered. By default, `None`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property; properties not specified here adopt the correlation set
+        at class level. By default, `None`
+
+    Returns
+    -------
+    Dict[str, PropertyInterface]
+    """
+    # pylint: disable=protected-access
+    available = metal._properties_to_use(correlations)
+    if properties is None:
+        return available
+    if isinstance(properties, str):
+        properties = [properties]
+    not_found = [name for name in properties if name not in available]
+    if len(not_found) > 0:
+        raise ValueError(f"Required '{not_found}' properties not found "
+                         f"for {metal.__name__}!")
+    return {name: available[name] for name in properties}
+
+
+def property_correlations(metal: Type[LiquidMetalInterface],
+                          property_name: str
+                          ) -> Dict[str, PropertyInterface]:
+    """
+    Returns all the available property objects implementing the
+    property passed as argument, keyed by correlation name and sorted
+    alphabetically.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    property_name : str
+        name of the property
+
+    Returns
+    -------
+    Dict[str, PropertyInterface]
+    """
+    # pylint: disable=protected-access
+    return metal._property_correlations(property_name)
+
+
+def evaluate(metal: Type[LiquidMetalInterface],
+             properties: Union[str, List[str], None],
+             T: Union[float, np.ndarray], p: Union[float, np.ndarray] = atm,
+             correlations: Union[Dict[str, str], None] = None,
+             out: Union[np.ndarray, Dict[str, np.ndarray], None] = None,
+             pool: Union[ScratchPool, None] = None,
+             dtype: DTypeLike = None,
+             invalid: str = 'raise') -> Dict[str, np.ndarray]:
+    """
+    Evaluates the required properties over arrays of temperature and
+    pressure values by applying the property correlations once per
+    property on the whole array.
+
+    If output arrays are provided, the property values are written into
+    them. The correlations of density, thermal expansion coefficient,
+    speed of sound, specific heat capacity, dynamic viscosity and thermal
+    conductivity are then applied by in-place operations on the output
+    arrays and on reusable scratch arrays, so that repeated evaluations
+    over arrays of the same shape do not allocate any memory; the values
+    of the other correlations are computed first and then copied.
+
+    Derived properties, e.g., the isochoric specific heat capacity, are
+    combined from the values of their base properties in one pass: each
+    base property is evaluated once, and shared by all the derived
+    properties and with the required base properties themselves.
+
+    Temperature values outside the validity ranges of the correlations
+    are not reported, see :func:`validity`, unless a collector of the
+    diagnostics is active, see :mod:`lbh15.diagnostics`: the values are
+    then recorded once per evaluated correlation.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None
+        name(s) of the property(ies) to evaluate. If `None`, all the
+        available properties are evaluated
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against `T`, by default
+        the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    out : np.ndarray | Dict[str, np.ndarray] | None, optional
+        output array, if only one property is required, or output arrays
+        keyed by property name, having the broadcast shape of `T` and `p`
+        and a floating point data type. By default, `None`, i.e., new
+        arrays are returned
+    pool : ScratchPool | None, optional
+        pool providing the scratch arrays adopted when `out` is provided;
+        if `None`, the pool of the calling thread is adopted.
+        By default, `None`
+    dtype : DTypeLike, optional
+        floating point data type the correlations are evaluated in, e.g.,
+        `numpy.float32`. By default, `None`, i.e., the data type of `T`
+        if floating point, `numpy.float64` otherwise
+    invalid : str, optional
+        policy adopted for the temperature values outside the liquid
+        range, see :func:`validate_temperature`: 'raise' to raise an
+        error, 'nan' to set the property values to `numpy.nan`, 'clip' to
+        evaluate the properties at the nearest bound of the range.
+        By default, 'raise'
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        property values keyed by property name, each one with the
+        broadcast shape of `T` and `p`
+    """
+    T, p = as_arrays(T, p, dtype)
+    if invalid == 'index':
+        raise ValueError("Policy 'index' does not apply to evaluation, "
+                         "see 'validate_temperature'")
+    T = validate_temperature(metal, T, invalid)
+    objects = property_objects(metal, properties, correlations)
+    # pylint: disable=protected-access
+    if diagnostics._active is not None:
+        for obj in objects.values():
+            diagnostics._active.record_range(obj, T, stacklevel=2)
+    derived = {name: obj for name, obj in objects.items()
+               if isinstance(obj, DerivedPropertyInterface)}
+    if out is None:
+        values = {name: apply(obj, T, p) for name, obj in objects.items()
+                  if name not in derived}
+        values.update(_derive(derived, T, p, objects, values))
+        return {name: values[name] for name in objects}
+    out = _outputs(out, objects, T, p)
+    if pool is None:
+        pool = _thread_pool()
+    for name, obj in objects.items():
+        if name not in derived:
+            _apply_into(obj, T, p, out[name], pool)
+    for name, value in _derive(derived, T, p, objects, out).items():
+        out[name][...] = value
+    return out
+
+
+def snapshot(metal: Type[LiquidMetalInterface],
+             T: Union[float, np.ndarray], p: Union[float, np.ndarray] = atm,
+             properties: Union[List[str], None] = None,
+             correlations: Union[Dict[str, str], None] = None,
+             dtype: DTypeLike = None) -> np.ndarray:
+    """
+    Evaluates the properties over arrays of temperature and pressure
+    values, returning them as a structured array of records, i.e., the
+    element-wise equivalent of
+    :meth:`~lbh15._lbh15.LiquidMetalInterface.snapshot`. The property
+    values are written directly into the fields of the records.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against `T`, by default
+        the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    properties : List[str] | None, optional
+        names of the properties to store; if `None`, all the available
+        properties are stored, sorted by name. By default, `None`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    dtype : DTypeLike, optional
+        floating point data type of the fields, by default `None`, i.e.,
+        the data type of `T` if floating point, `numpy.float64` otherwise
+
+    Returns
+    -------
+    np.ndarray
+        structured array with the broadcast shape of `T` and `p`
+    """
+    T, p = as_arrays(T, p, dtype)
+    objects = property_objects(metal, properties, correlations)
+    if properties is None:
+        objects = dict(sorted(objects.items()))
+    records = np.empty(np.broadcast_shapes(T.shape, p.shape),
+                       dtype=record_dtype(objects, T.dtype))
+    records['T'] = T
+    records['p'] = p
+    evaluate(metal, list(objects), T, p, correlations,
+             out={name: records[name] for name in objects})
+    return records
+
+
+def derivatives(metal: Type[LiquidMetalInterface],
+                properties: Union[str, List[str], None],
+                T: Union[float, np.ndarray],
+                p: Union[float, np.ndarray] = atm,
+                correlations: Union[Dict[str, str], None] = None,
+                dtype: DTypeLike = None) -> Dict[str, np.ndarray]:
+    """
+    Evaluates the derivatives of the required properties with respect to
+    the temperature over arrays of temperature and pressure values.
+    The analytic expressions are applied where implemented by the
+    property objects, otherwise central finite differences are adopted.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None
+        name(s) of the property(ies) whose derivatives are to evaluate.
+        If `None`, all the available properties are considered
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against `T`, by default
+        the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    dtype : DTypeLike, optional
+        floating point data type the derivatives are evaluated in.
+        By default, `None`, i.e., the data type of `T` if floating point,
+        `numpy.float64` otherwise
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        property derivatives keyed by property name, each one with the
+        broadcast shape of `T` and `p`
+    """
+    T, p = as_arrays(T, p, dtype)
+    check_temperature(metal, T)
+    objects = property_objects(metal, properties, correlations)
+    return {name: _broadcast(obj.derivative(T, p), T, p)
+            for name, obj in objects.items()}
+
+
+def integral(metal: Type[LiquidMetalInterface],
+             properties: Union[str, List[str], None],
+             T_1: Union[float, np.ndarray], T_2: Union[float, np.ndarray],
+             p: Union[float, np.ndarray] = atm,
+             correlations: Union[Dict[str, str], None] = None
+             ) -> Dict[str, np.ndarray]:
+    """
+    Evaluates the integrals of the required properties with respect to
+    the temperature over arrays of temperature intervals, at constant
+    pressure. The analytic antiderivatives are applied where implemented
+    by the property objects, otherwise the correlations are integrated by
+    adaptive Gauss-Legendre quadrature, see
+    :func:`~lbh15.properties.interface.PropertyInterface.integral`.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None
+        name(s) of the property(ies) to integrate. If `None`, all the
+        available properties are integrated
+    T_1 : float | np.ndarray
+        lower bounds of the intervals, i.e., temperature in :math:`[K]`
+    T_2 : float | np.ndarray
+        upper bounds of the intervals, i.e., temperature in :math:`[K]`,
+        broadcastable against `T_1`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against the bounds, by
+        default the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        property integrals keyed by property name, each one with the
+        broadcast shape of the bounds and of `p`
+    """
+    T_1, T_2, p = _bounds(metal, T_1, T_2, p)
+    objects = property_objects(metal, properties, correlations)
+    return {name: _broadcast(obj.integral(T_1, T_2, p), T_1, p)
+            for name, obj in objects.items()}
+
+
+def average(metal: Type[LiquidMetalInterface],
+            properties: Union[str, List[str], None],
+            T_1: Union[float, np.ndarray], T_2: Union[float, np.ndarray],
+            p: Union[float, np.ndarray] = atm,
+            correlations: Union[Dict[str, str], None] = None
+            ) -> Dict[str, np.ndarray]:
+    """
+    Evaluates the averages of the required properties over arrays of
+    temperature intervals, at constant pressure, i.e., their integrals,
+    see :func:`integral`, divided by the interval widths. The property
+    value is returned for the intervals of zero width.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None
+        name(s) of the property(ies) to average. If `None`, all the
+        available properties are averaged
+    T_1 : float | np.ndarray
+        lower bounds of the intervals, i.e., temperature in :math:`[K]`
+    T_2 : float | np.ndarray
+        upper bounds of the intervals, i.e., temperature in :math:`[K]`,
+        broadcastable against `T_1`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against the bounds, by
+        default the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        property averages keyed by property name, each one with the
+        broadcast shape of the bounds and of `p`
+    """
+    T_1, T_2, p = _bounds(metal, T_1, T_2, p)
+    values = integral(metal, properties, T_1, T_2, p, correlations)
+    width = _broadcast(T_2 - T_1, T_1, p)
+    empty = width == 0
+    width[empty] = 1
+    for value in values.values():
+        value /= width
+    if np.any(empty):
+        point = evaluate(metal, list(values), T_1, p, correlations)
+        for name, value in values.items():
+            value[empty] = _broadcast(point[name], T_1, p)[empty]
+    return values
+
+
+def validity(metal: Type[LiquidMetalInterface],
+             properties: Union[str, List[str], None],
+             T: Union[float, np.ndarray],
+             correlations: Union[Dict[str, str], None] = None
+             ) -> Dict[str, np.ndarray]:
+    """
+    Returns, for each required property, the element-wise mask telling
+    whether the temperature values belong to the validity range of the
+    adopted correlation.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str] | None
+        name(s) of the property(ies) to check. If `None`, all the
+        available properties are checked
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        boolean masks keyed by property name, `True` where the
+        temperature is inside the correlation validity range
+    """
+    T = np.asarray(T, dtype=float)
+    objects = property_objects(metal, properties, correlations)
+    return {name: in_range(obj, T) for name, obj in objects.items()}
+
+
+def temperature(metal: Type[LiquidMetalInterface], property_name: str,
+                values: Union[float, np.ndarray],
+                p: Union[float, np.ndarray] = atm,
+                T_guess: Union[float, np.ndarray, None] = None,
+                correlations: Union[Dict[str, str], None] = None,
+                xtol: float = 1e-10, max_iter: int = 50) -> np.ndarray:
+    """
+    Computes the temperature values at which the property takes the
+    values passed as argument, i.e., the element-wise equivalent of the
+    initialization of the liquid metal instances from a property other
+    than temperature. The correlation is inverted by Newton iterations
+    performed on the whole array, adopting the derivative of the
+    correlation. Providing the temperature values of the previous time
+    step as guess values, only one or two iterations are needed for
+    smooth time sequences. The values whose Newton iterations do not
+    converge, or converge to a root other than the one selected by
+    :func:`~lbh15._lbh15.LiquidMetalInterface.set_root_to_use`, are
+    computed by bisection over the liquid range instead.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    property_name : str
+        name of the property, e.g., 'h'
+    values : float | np.ndarray
+        values of the property
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against `values`, by
+        default the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    T_guess : float | np.ndarray | None, optional
+        Temperature guess values in :math:`[K]`, broadcastable against
+        `values`. If `None`, the same guess values of the liquid metal
+        instances are adopted. By default, `None`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    xtol : float, optional
+        Relative tolerance on the temperature increment of the Newton
+        iterations, by default `1e-10`
+    max_iter : int, optional
+        Maximum number of Newton iterations, by default `50`
+
+    Returns
+    -------
+    np.ndarray
+        Temperature in :math:`[K]`, with the broadcast shape of `values`,
+        `p` and `T_guess`
+    """
+    values, p = as_arrays(values, p)
+    if property_name == 'T':
+        T = _broadcast(values, values, p)
+    else:
+        obj = property_objects(metal, property_name,
+                               correlations)[property_name]
+        if T_guess is None:
+            T_guess = _default_guess(metal, property_name, obj, values)
+        T, evaluations = _newton(obj, values, T_guess, p, xtol, max_iter,
+                                 strict=False)
+        failed = np.isnan(T) | ~_on_branch(
+            obj, T, metal.roots_to_use().get(property_name, 0))
+        if np.any(failed):
+            T[failed], bisections = _bisect(
+                metal, property_name, obj,
+                np.broadcast_to(values, T.shape)[failed],
+                np.broadcast_to(p, T.shape)[failed], xtol)
+            evaluations += bisections
+        # pylint: disable=protected-access
+        if profiling._active is not None:
+            profiling._active.record_solver(metal.__name__, property_name,
+                                            evaluations, False)
+    check_temperature(metal, T)
+    return T
+
+
+def in_range(property_object: PropertyInterface,
+             T: np.ndarray) -> np.ndarray:
+    """
+    Returns the element-wise mask telling whether the temperature values
+    belong to the validity range of the property correlation.
+
+    Parameters
+    ----------
+    property_object : PropertyInterface
+        property object
+    T : np.ndarray
+        Temperature in :math:`[K]`
+
+    Returns
+    -------
+    np.ndarray
+    """
+    range_lim = property_object.range
+    return (T >= range_lim[0]) & (T <= range_lim[1])
+
+
+def as_arrays(T: Union[float, np.ndarray], p: Union[float, np.ndarray],
+              dtype: DTypeLike = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts temperature and pressure into arrays of the required
+    floating point data type, by default the one of the temperature,
+    if any, checking that pressure values are strictly positive. Useful
+    for converting the inputs once before several evaluations by
+    :func:`apply`.
+
+    Parameters
+    ----------
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray
+        Pressure in :math:`[Pa]`
+    dtype : DTypeLike, optional
+        floating point data type of the arrays; if `None`, the one of
+        the temperature, if any, otherwise `np.float64`. By default,
+        `None`
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        temperature and pressure arrays
+    """
+    if dtype is None:
+        dtype = np.asarray(T).dtype
+        if dtype.kind != 'f':
+            dtype = np.float64
+    elif np.dtype(dtype).kind != 'f':
+        raise ValueError("Data type must be a floating point one, "
+                         f"{np.dtype(dtype)} was provided")
+    T = np.asarray(T, dtype=dtype)
+    p = np.asarray(p, dtype=dtype)
+    if p.size > 0 and p.min() <= 0:
+        raise ValueError("Pressure must be strictly positive, "
+                         f"{float(p[p <= 0].flat[0]):.2f} [Pa] was provided")
+    return T, p
+
+
+def apply(property_object: PropertyInterface, T: np.ndarray,
+          p: np.ndarray) -> np.ndarray:
+    """
+    Applies the correlation of the property object on the whole arrays,
+    broadcasting the result to the shape of the inputs, and records the
+    call when profiling is active. Neither the liquid range nor the
+    pressure values are checked, see :func:`as_arrays` and
+    :func:`check_temperature`.
+
+    Parameters
+    ----------
+    property_object : PropertyInterface
+        property object, e.g., one of the ones returned by
+        :func:`property_objects`
+    T : np.ndarray
+        Temperature in :math:`[K]`
+    p : np.ndarray
+        Pressure in :math:`[Pa]`
+
+    Returns
+    -------
+    np.ndarray
+        property values
+    """
+    # pylint: disable=protected-access
+    if profiling._active is None:
+        return _broadcast(property_object.correlation(T, p), T, p)
+    start = perf_counter()
+    value = _broadcast(property_object.correlation(T, p), T, p)
+    profiling._active.record_call(property_object, perf_counter() - start,
+                                  value.size)
+    return value
+
+
+def _bounds(metal: Type[LiquidMetalInterface],
+            T_1: Union[float, np.ndarray], T_2: Union[float, np.ndarray],
+            p: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray,
+                                                  np.ndarray]:
+    """
+    Converts the bounds of the temperature intervals and pressure into
+    arrays, broadcasting the bounds against each other and checking that
+    they belong to the liquid temperature range.
+    """
+    T_1, p = as_arrays(T_1, p)
+    T_1, T_2 = np.broadcast_arrays(T_1, np.asarray(T_2, dtype=T_1.dtype))
+    check_temperature(metal, T_1)
+    check_temperature(metal, T_2)
+    return T_1, T_2, p
+
+
+def _default_guess(metal: Type[LiquidMetalInterface], property_name: str,
+                   property_object: PropertyInterface,
+                   values: np.ndarray) -> np.ndarray:
+    """
+    Returns the temperature guess values adopted by the liquid metal
+    instances, i.e., half the boiling temperature unless differently
+    suggested by the property initialization helper, and tripled for
+    the second root of non-injective correlations.
+    """
+    guess = np.full(values.shape, liquid_range(metal)[1] / 2)
+    if type(property_object).initialization_helper is not \
+            PropertyInterface.initialization_helper:
+        for index, value in np.ndenumerate(values):
+            helper_guess = property_object.initialization_helper(float(value))
+            if helper_guess:
+                guess[index] = helper_guess
+    if not property_object.is_injective \
+            and metal.roots_to_use().get(property_name, 0) == 1:
+        guess *= 3
+    return guess
+
+
+def _bisect(metal: Type[LiquidMetalInterface], property_name: str,
+            property_object: PropertyInterface, values: np.ndarray,
+            p: np.ndarray, xtol: float) -> Tuple[np.ndarray, int]:
+    """
+    Computes the temperature values at which the property takes the
+    values passed as argument by bisection. The roots are bracketed by
+    sampling the correlation over the liquid range, taking the first
+    sign change or, for the second root of non-injective correlations,
+    the last one. The number of correlation evaluations is returned
+    too.
+    """
+    grid = np.linspace(*liquid_range(metal), 65)
+    with np.errstate(invalid='ignore'):
+        residual = property_object.correlation(grid, p[:, None]) \
+            - values[:, None]
+    change = np.sign(residual[:, :-1]) * np.sign(residual[:, 1:]) <= 0
+    if not np.all(np.any(change, axis=1)):
+        raise RuntimeError("Error: the temperature value at which "
+                           f"'{property_name}' property takes the "
+                           f"{values[~np.any(change, axis=1)][0]:.6g} "
+                           "value can not be found within the liquid "
+                           "range")
+    if not property_object.is_injective \
+            and metal.roots_to_use().get(property_name, 0) == 1:
+        index = change.shape[1] - 1 - np.argmax(change[:, ::-1], axis=1)
+    else:
+        index = np.argmax(change, axis=1)
+    low, high = grid[index], grid[index + 1]
+    residual_low = np.take_along_axis(residual, index[:, None], axis=1)[:, 0]
+    evaluations = 1
+    while np.any(high - low > xtol * high):
+        evaluations += 1
+        middle = (low + high) / 2
+        residual_middle = property_object.correlation(middle, p) - values
+        lower = np.sign(residual_middle) == np.sign(residual_low)
+        low = np.where(lower, middle, low)
+        residual_low = np.where(lower, residual_middle, residual_low)
+        high = np.where(lower, high, middle)
+    return (low + high) / 2, evaluations
+
+
+def _derive(derived: Dict[str, DerivedPropertyInterface], T: np.ndarray,
+            p: np.ndarray, objects: Dict[str, PropertyInterface],
+            values: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Combines the derived properties from the values of their base
+    properties, evaluating each base property once, unless its values
+    are already available among the ones of the required properties.
+    """
+    computed = {type(objects[name]): value for name, value in values.items()
+                if name not in derived}
+    rvalue = {}
+    for name, obj in derived.items():
+        base = {}
+        for key, base_object in obj.base_properties.items():
+            if type(base_object) not in computed:
+                computed[type(base_object)] = apply(base_object, T, p)
+            base[key] = computed[type(base_object)]
+        rvalue[name] = _broadcast(obj.combine(T, **base), T, p)
+    return rvalue
+
+
+def _apply_into(property_object: PropertyInterface, T: np.ndarray,
+                p: np.ndarray, out: np.ndarray, pool: ScratchPool) -> None:
+    """
+    Applies the property correlation on the whole arrays, writing the
+    result into the output array.
+    """
+    # pylint: disable=protected-access
+    if profiling._active is None:
+        property_object.correlation_into(T, p, out, pool)
+        return
+    start = perf_counter()
+    property_object.correlation_into(T, p, out, pool)
+    profiling._active.record_call(property_object, perf_counter() - start,
+                                  out.size)
+
+
+def _outputs(out: Union[np.ndarray, Dict[str, np.ndarray]],
+             objects: Dict[str, PropertyInterface], T: np.ndarray,
+             p: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Checks the output arrays, returning them keyed by property name.
+    """
+    if isinstance(out, np.ndarray):
+        if len(objects) != 1:
+            raise ValueError("Output arrays must be provided as a "
+                             "dictionary when evaluating more than one "
+                             "property")
+        out = {name: out for name in objects}
+    shape = np.broadcast_shapes(T.shape, p.shape)
+    for name in objects:
+        if name not in out:
+            raise ValueError(f"Output array of '{name}' property "
+                             "not provided")
+        array = out[name]
+        if not isinstance(array, np.ndarray) or array.shape != shape \
+                or array.dtype.kind != 'f':
+            raise ValueError(f"Output array of '{name}' property must be a "
+                             f"floating point array of shape {shape}")
+        if np.may_share_memory(array, T) or np.may_share_memory(array, p):
+            raise ValueError(f"Output array of '{name}' property must not "
+                             "share memory with temperature or pressure")
+    return {name: out[name] for name in objects}
+
+
+def _thread_pool() -> ScratchPool:
+    """
+    Returns the pool of scratch arrays of the calling thread.
+    """
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = _local.pool = ScratchPool()
+    return pool
+
+
+def _broadcast(value: Union[float, np.ndarray], T: np.ndarray,
+               p: np.ndarray) -> np.ndarray:
+    """
+    Converts the value into an array having the data type of temperature
+    and the broadcast shape of temperature and pressure.
+    """
+    value = np.asarray(value, dtype=T.dtype)
+    shape = np.broadcast_shapes(T.shape, p.shape)
+    if value.shape != shape:
+        value = np.broadcast_to(value, shape).copy()
+    return value
@@ -36,6 +36,12 @@ class Bismuth(LiquidMetalInterface):
         - **u_s** (float) : speed of sound :math:`[m/s]`
         - **beta_s** (float) : isentropic compressibility :math:`[1/Pa]`
         - **cp** (float) : specific heat capacity :math:`[J/(kg \\cdot K)]`
+        - **cv** (float) : isochoric specific heat capacity \
+            :math:`[J/(kg \\cdot K)]`
+        - **beta_T** (float) : isothermal compressibility :math:`[1/Pa]`
+        - **gamma_G** (float) : Gruneisen parameter :math:`[-]`
+        - **rho_cp** (float) : volumetric heat capacity \
+            :math:`[J/(m^3 \\cdot K)]`
         - **h** (float) : specific enthalpy \
             (with respect to melting point) :math:`[J/kg]`
         - **mu** (float) : dynamic viscosity :math:`[Pa \\cdot s]`
@@ -74,7 +80,8 @@ class Bismuth(LiquidMetalInterface):
 .diffusivity_in_bismuth',
          'lbh15.properties.bismuth_thermochemical_properties\
 .bismuth_thermochemical',
-         'lbh15.properties.bismuth_properties']
+         'lbh15.properties.bismuth_properties',
+         'lbh15.properties.bismuth_derived_properties']
 
     def __init__(self, p: float = atm, **kwargs):
         self._guess = BISMUTH_BOILING_TEMPERATURE / 2.0
@@ -0,0 +1,334 @@
+"""Module with the cache of the property values computed at single
+temperature and pressure values, meant for scalar code querying the
+same conditions repeatedly, e.g., setpoint temperatures or sensor
+readings with a fixed resolution. Values are kept in a bounded
+least-recently-used cache keyed by liquid metal, property, correlation,
+temperature and pressure, the latter two possibly quantized."""
+import threading
+from collections import OrderedDict
+from typing import Dict
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from .properties.interface import PropertyInterface
+from . import batch
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a property cache.
+    """
+    hits: int
+    """Number of values returned from the cache"""
+    misses: int
+    """Number of values computed and stored in the cache"""
+    bypasses: int
+    """Number of values computed without using the cache, i.e., whose
+    temperature or pressure is farther than the tolerance from the
+    quantization grid, or whose temperature is closest to a grid point
+    outside the liquid range"""
+    evictions: int
+    """Number of values removed to respect the maximum size"""
+    currsize: int
+    """Number of values stored"""
+    maxsize: int
+    """Maximum number of values stored"""
+
+
+class PropertyCache:
+    """
+    Bounded least-recently-used cache of the property values. A single
+    size limit applies to all the stored values, whatever liquid metal,
+    property and correlation they refer to.
+
+    Temperature and pressure can be quantized, i.e., snapped to the
+    nearest point of a grid with the given resolution: values are then
+    computed at the grid points, and all the queries closer than the
+    tolerance to a grid point share the same value. Queries farther
+    than the tolerance, or closer to a grid point outside the liquid
+    range, are computed exactly without using the cache.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        maximum number of values stored, by default `4096`
+    T_resolution : float, optional
+        temperature quantization step in :math:`[K]`; if `0`,
+        temperatures are not quantized. By default, `0.0`
+    T_tolerance : float | None, optional
+        maximum distance of the temperature from the quantization grid
+        in :math:`[K]`; if `None`, half of the resolution, i.e., all the
+        temperatures are quantized. By default, `None`
+    p_resolution : float, optional
+        pressure quantization step in :math:`[Pa]`; if `0`, pressures
+        are not quantized. By default, `0.0`
+    p_tolerance : float | None, optional
+        maximum distance of the pressure from the quantization grid in
+        :math:`[Pa]`; if `None`, half of the resolution. By default,
+        `None`
+    """
+    def __init__(self, maxsize: int = 4096, T_resolution: float = 0.0,
+                 T_tolerance: Union[float, None] = None,
+                 p_resolution: float = 0.0,
+                 p_tolerance: Union[float, None] = None):
+        if maxsize < 0:
+            raise ValueError("Maximum size must be non-negative, "
+                             f"{maxsize} was provided")
+        self.__T_grid = _grid(T_resolution, T_tolerance, 'Temperature')
+        self.__p_grid = _grid(p_resolution, p_tolerance, 'Pressure')
+        self.__maxsize = maxsize
+        self.__lock = threading.Lock()
+        self.__values: OrderedDict = OrderedDict()
+        self.__objects: Dict[Tuple, Tuple[PropertyInterface,
+                                          Tuple[float, float]]] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__bypasses = 0
+        self.__evictions = 0
+
+    def value(self, metal: Type[LiquidMetalInterface], property_name: str,
+              T: float, p: float = atm,
+              correlation: Union[str, None] = None) -> float:
+        """
+        Returns the property value, computing it if not stored yet.
+
+        Parameters
+        ----------
+        metal : Type[LiquidMetalInterface]
+            liquid metal class, e.g., :class:`.Lead`
+        property_name : str
+            name of the property
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+        correlation : str | None, optional
+            name of the correlation to use; if `None`, the one set at
+            class level by
+            :func:`~lbh15._lbh15.LiquidMetalInterface.set_correlation_to_use`
+            is adopted. By default, `None`
+
+        Returns
+        -------
+        float
+        """
+        if correlation is None:
+            # pylint: disable=protected-access
+            correlation = metal._correlations_to_use.get(property_name)
+        T_key, T_grid = _snap(T, *self.__T_grid)
+        T_m0, T_b0 = self.__object(metal, property_name, correlation)[1]
+        if not T_m0 < T_grid < T_b0:
+            # Grid points outside the liquid range are not adopted
+            T_key = None
+        p_key, p_grid = _snap(p, *self.__p_grid)
+        if T_key is None or p_key is None:
+            with self.__lock:
+                self.__bypasses += 1
+            return self.__compute(metal, property_name, correlation, T, p)
+        key = (metal, property_name, correlation, T_key, p_key)
+        with self.__lock:
+            if key in self.__values:
+                self.__values.move_to_end(key)
+                self.__hits += 1
+                return self.__values[key]
+        rvalue = self.__compute(metal, property_name, correlation, T_grid,
+                                p_grid)
+        with self.__lock:
+            self.__misses += 1
+            if self.__maxsize > 0:
+                self.__values[key] = rvalue
+                self.__evict(self.__maxsize)
+        return rvalue
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+        """
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, self.__bypasses,
+                             self.__evictions, len(self.__values),
+                             self.__maxsize)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the maximum number of values stored, evicting the least
+        recently used ones if needed.
+
+        Parameters
+        ----------
+        maxsize : int
+            maximum number of values stored
+        """
+        if maxsize < 0:
+            raise ValueError("Maximum size must be non-negative, "
+                             f"{maxsize} was provided")
+        with self.__lock:
+            self.__maxsize = maxsize
+            self.__evict(maxsize)
+
+    def clear(self) -> None:
+        """
+        Removes all the stored values and resets the statistics. To be
+        called after changing the available properties, e.g., by
+        :func:`~lbh15._lbh15.LiquidMetalInterface.set_custom_properties_path`.
+        """
+        with self.__lock:
+            self.__values.clear()
+            self.__objects.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__bypasses = 0
+            self.__evictions = 0
+
+    def __evict(self, maxsize: int) -> None:
+        """
+        Removes the least recently used values exceeding the maximum
+        size, to be called holding the lock.
+        """
+        while len(self.__values) > maxsize:
+            self.__values.popitem(last=False)
+            self.__evictions += 1
+
+    def __object(self, metal: Type[LiquidMetalInterface],
+                 property_name: str, correlation: Union[str, None]
+                 ) -> Tuple[PropertyInterface, Tuple[float, float]]:
+        """
+        Returns the property object and the liquid range of the metal,
+        retrieving them only once.
+        """
+        key = (metal, property_name, correlation)
+        if key not in self.__objects:
+            # pylint: disable=protected-access
+            properties = metal._properties_to_use(
+                {property_name: correlation} if correlation else None)
+            if property_name not in properties:
+                raise ValueError(f"Required '{property_name}' property "
+                                 f"not found for {metal.__name__}!")
+            self.__objects[key] = (properties[property_name],
+                                   batch.liquid_range(metal))
+        return self.__objects[key]
+
+    def __compute(self, metal: Type[LiquidMetalInterface],
+                  property_name: str, correlation: Union[str, None],
+                  T: float, p: float) -> float:
+        """
+        Computes the property value, checking that the temperature
+        belongs to the liquid range.
+        """
+        property_object, (T_m0, T_b0) = self.__object(metal, property_name,
+                                                      correlation)
+        if not T_m0 < T < T_b0:
+            batch.check_temperature(metal, T)
+        if p <= 0:
+            raise ValueError("Pressure must be strictly positive, "
+                             f"{p:.2f} [Pa] was provided")
+        return float(property_object.correlation(T, p))
+
+
+def value(metal: Type[LiquidMetalInterface], property_name: str, T: float,
+          p: float = atm, correlation: Union[str, None] = None) -> float:
+    """
+    Returns the property value from the module-level cache, see
+    :meth:`PropertyCache.value`.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    property_name : str
+        name of the property
+    T : float
+        Temperature in :math:`[K]`
+    p : float, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlation : str | None, optional
+        name of the correlation to use, by default `None`
+
+    Returns
+    -------
+    float
+    """
+    return _cache.value(metal, property_name, T, p, correlation)
+
+
+def configure(maxsize: int = 4096, T_resolution: float = 0.0,
+              T_tolerance: Union[float, None] = None,
+              p_resolution: float = 0.0,
+              p_tolerance: Union[float, None] = None) -> PropertyCache:
+    """
+    Replaces the module-level cache with an empty one having the given
+    settings, see :class:`PropertyCache`.
+
+    Returns
+    -------
+    PropertyCache
+        the new module-level cache
+    """
+    global _cache  # pylint: disable=global-statement
+    _cache = PropertyCache(maxsize, T_resolution, T_tolerance,
+                           p_resolution, p_tolerance)
+    return _cache
+
+
+def info() -> CacheInfo:
+    """
+    Returns the statistics of the module-level cache.
+
+    Returns
+    -------
+    CacheInfo
+    """
+    return _cache.info()
+
+
+def clear() -> None:
+    """
+    Removes all the values stored in the module-level cache and resets
+    its statistics.
+    """
+    _cache.clear()
+
+
+def _grid(resolution: float, tolerance: Union[float, None],
+          quantity: str) -> Tuple[float, float]:
+    """
+    Checks the quantization settings and returns the resolution and the
+    tolerance.
+    """
+    if resolution < 0:
+        raise ValueError(f"{quantity} resolution must be non-negative, "
+                         f"{resolution} was provided")
+    if tolerance is None:
+        tolerance = resolution / 2
+    elif tolerance < 0:
+        raise ValueError(f"{quantity} tolerance must be non-negative, "
+                         f"{tolerance} was provided")
+    return resolution, tolerance
+
+
+def _snap(x: float, resolution: float,
+          tolerance: float) -> Tuple[Union[float, int, None], float]:
+    """
+    Returns the key of the value and the nearest grid point, or `None`
+    as key if the value is farther than the tolerance from the grid.
+    """
+    if resolution == 0:
+        return x, x
+    index = round(x / resolution)
+    grid_point = index * resolution
+    if abs(x - grid_point) > tolerance:
+        return None, x
+    return index, grid_point
+
+
+# Cache adopted by the module-level functions
+_cache = PropertyCache()
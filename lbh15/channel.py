@@ -0,0 +1,134 @@
+"""Module with the axial marching of the specific enthalpy along heated
+coolant channels, for many parallel channels at once. The energy balance
+of each axial node is integrated over all the channels and all the nodes
+by a cumulative sum, and the specific enthalpy is converted back into
+temperature by the vectorized inversion of :func:`lbh15.batch.temperature`
+instead of one liquid metal instance per node."""
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+# Properties evaluated along the channels by default
+DEFAULT_PROPERTIES = ['rho', 'cp', 'mu', 'k']
+
+
+class ChannelResult(NamedTuple):
+    """
+    Axial fields computed by :func:`march`. Fields are evaluated at the
+    boundaries of the axial nodes, the first axis running over the
+    channels and the second one over the axial positions, the first one
+    being the channel inlet.
+    """
+    z: np.ndarray
+    """Axial positions of the node boundaries in :math:`[m]`"""
+    h: np.ndarray
+    """Specific enthalpy in :math:`[J/kg]`"""
+    T: np.ndarray
+    """Temperature in :math:`[K]`"""
+    properties: Dict[str, np.ndarray]
+    """Property values keyed by property name"""
+
+
+def march(metal: Type[LiquidMetalInterface], q: np.ndarray,
+          dz: Union[float, np.ndarray], perimeter: Union[float, np.ndarray],
+          mass_flow: Union[float, np.ndarray],
+          T_in: Union[float, np.ndarray], p: Union[float, np.ndarray] = atm,
+          properties: Union[List[str], None] = None,
+          correlations: Union[Dict[str, str], None] = None,
+          xtol: float = 1e-10, max_iter: int = 50) -> ChannelResult:
+    """
+    Marches the specific enthalpy along the axis of heated channels, from
+    the inlet, i.e., :math:`h_{j+1} = h_j + q_j P \\Delta z_j / \\dot{m}`,
+    and computes the temperature and the property fields at the node
+    boundaries. All the channels and all the nodes are advanced at once:
+    the enthalpy rise is integrated by a cumulative sum, and the
+    temperature is computed by Newton iterations on the whole field,
+    starting from the guess given by the inlet specific heat capacity.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    q : np.ndarray
+        Wall heat flux in :math:`[W/m^2]`, positive if heating the
+        coolant, with shape `(channels, nodes)`
+    dz : float | np.ndarray
+        Axial length of the nodes in :math:`[m]`, either a single value
+        or one value per node
+    perimeter : float | np.ndarray
+        Heated perimeter in :math:`[m]`, either a single value or one
+        value per channel
+    mass_flow : float | np.ndarray
+        Mass flow rate in :math:`[kg/s]`, strictly positive, either a
+        single value or one value per channel
+    T_in : float | np.ndarray
+        Inlet temperature in :math:`[K]`, either a single value or one
+        value per channel
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against the
+        `(channels, nodes + 1)` fields, by default the atmospheric
+        pressure value, i.e., :math:`101325.0 Pa`
+    properties : List[str] | None, optional
+        names of the properties to evaluate along the channels; if
+        `None`, the ones in :data:`DEFAULT_PROPERTIES`. By default, `None`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    xtol : float, optional
+        Relative tolerance on the temperature increment of the Newton
+        iterations, by default `1e-10`
+    max_iter : int, optional
+        Maximum number of Newton iterations, by default `50`
+
+    Returns
+    -------
+    ChannelResult
+    """
+    q = np.asarray(q, dtype=float)
+    if q.ndim != 2:
+        raise ValueError("Heat flux must be a (channels, nodes) array, "
+                         f"{q.ndim} dimensions were provided")
+    n_channels, n_nodes = q.shape
+    dz = np.broadcast_to(np.asarray(dz, dtype=float), (n_nodes,))
+    perimeter = _per_channel(perimeter, n_channels, 'Heated perimeter')
+    mass_flow = _per_channel(mass_flow, n_channels, 'Mass flow rate')
+    if np.any(mass_flow <= 0):
+        raise ValueError("Mass flow rate must be strictly positive, "
+                         f"{mass_flow[mass_flow <= 0][0]:.2f} [kg/s] was "
+                         "provided")
+    T_in = _per_channel(T_in, n_channels, 'Inlet temperature')
+    batch.check_temperature(metal, T_in)
+
+    inlet = batch.evaluate(metal, ['h', 'cp'], T_in, correlations=correlations)
+    h = np.empty((n_channels, n_nodes + 1))
+    h[:, 0] = inlet['h']
+    np.cumsum(q * (perimeter / mass_flow)[:, None] * dz, axis=1,
+              out=h[:, 1:])
+    h[:, 1:] += h[:, :1]
+    T_guess = T_in[:, None] + (h - h[:, :1]) / inlet['cp'][:, None]
+    T = batch.temperature(metal, 'h', h, p, T_guess, correlations, xtol,
+                          max_iter)
+    if properties is None:
+        properties = DEFAULT_PROPERTIES
+    values = batch.evaluate(metal, properties, T, p, correlations) \
+        if properties else {}
+    z = np.concatenate(([0.0], np.cumsum(dz)))
+    return ChannelResult(z, h, T, values)
+
+
+def _per_channel(value: Union[float, np.ndarray], n_channels: int,
+                 quantity: str) -> np.ndarray:
+    """
+    Broadcasts the value to one value per channel.
+    """
+    value = np.asarray(value, dtype=float)
+    if value.ndim > 1 or (value.ndim == 1 and len(value) != n_channels):
+        raise ValueError(f"{quantity} must be a single value or one value "
+                         f"per channel, {value.shape} shape was provided")
+    return np.broadcast_to(value, (n_channels,))
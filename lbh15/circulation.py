@@ -0,0 +1,464 @@
+"""Module with the solvers of the natural circulation of heavy liquid
+metal loops, i.e., of the mass flow rate at which the buoyancy head
+generated by the heated and cooled sections balances the pressure losses
+at the steady state, and of its time evolution driven by the unbalance
+between them. Many loop configurations, e.g., the ones of a parametric
+sweep, are solved at once by Newton iterations performed on all of
+them."""
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from scipy.constants import g
+from ._lbh15 import LiquidMetalInterface
+from .heat_transfer import FRICTION_CORRELATIONS
+from .properties.interface import PropertyInterface
+from . import batch
+
+# Properties evaluated at the loop nodes by each Newton iteration
+_NAMES = ['h', 'cp', 'rho', 'mu']
+
+
+class CirculationResult(NamedTuple):
+    """
+    Steady-state natural circulation computed by :func:`solve`. The last
+    axis of the nodal quantities runs over the loop nodes, the remaining
+    ones over the loop configurations.
+    """
+    mass_flow: np.ndarray
+    """Mass flow rate in :math:`[kg/s]`"""
+    T: np.ndarray
+    """Temperature at the node centers in :math:`[K]`"""
+    rho: np.ndarray
+    """Density at the node centers in :math:`[kg/m^3]`"""
+    velocity: np.ndarray
+    """Flow velocity at the node centers in :math:`[m/s]`"""
+    Re: np.ndarray
+    """Reynolds number at the node centers :math:`[-]`"""
+    buoyancy: np.ndarray
+    """Buoyancy head driving the flow in :math:`[Pa]`"""
+    valid: np.ndarray
+    """`True` where Reynolds number belongs to the validity range of the
+    friction factor correlation"""
+    iterations: int
+    """Number of Newton iterations performed"""
+
+
+class CirculationTransient(NamedTuple):
+    """
+    Transient natural circulation computed by :func:`transient`. The
+    first axis runs over the time steps, the quantities being the ones
+    at the end of each step; the last axis of the nodal quantities runs
+    over the loop nodes, the remaining ones over the loop
+    configurations.
+    """
+    time: np.ndarray
+    """Time at the end of the time steps in :math:`[s]`"""
+    mass_flow: np.ndarray
+    """Mass flow rate in :math:`[kg/s]`"""
+    T: np.ndarray
+    """Temperature at the node centers in :math:`[K]`"""
+    buoyancy: np.ndarray
+    """Buoyancy head driving the flow in :math:`[Pa]`"""
+    iterations: np.ndarray
+    """Number of Newton iterations performed at each time step"""
+
+
+def solve(metal: Type[LiquidMetalInterface],
+          length: Union[float, np.ndarray], elevation: np.ndarray,
+          diameter: Union[float, np.ndarray], area: Union[float, np.ndarray],
+          power: Union[float, np.ndarray], heated: np.ndarray,
+          cooled: np.ndarray, T_in: Union[float, np.ndarray],
+          loss_coefficient: Union[float, np.ndarray] = 0.0,
+          correlation: str = 'blasius',
+          roughness: Union[float, np.ndarray] = 0.0,
+          p: Union[float, np.ndarray] = atm,
+          correlations: Union[Dict[str, str], None] = None,
+          xtol: float = 1e-10, max_iter: int = 50) -> CirculationResult:
+    """
+    Computes the steady-state natural circulation mass flow rate
+    :math:`\\dot{m}` of liquid metal loops, i.e., the one satisfying the
+    momentum balance over the loop nodes
+
+    :math:`-g \\sum_i \\rho_i \\Delta z_i = \\dot{m}^2 \\sum_i
+    \\left(f_i \\displaystyle\\frac{L_i}{D_i} + K_i\\right)
+    \\displaystyle\\frac{1}{2 \\rho_i A_i^2}`
+
+    together with the energy balance, the specific enthalpy at the node
+    centers being :math:`h_i = h_{in} + (\\sum_{j<i} Q_j + Q_i / 2) /
+    \\dot{m}`. Nodes are ordered along the flow, starting from the loop
+    inlet, where the temperature is set, e.g., the cooler outlet. The heat
+    input is distributed over the heated nodes and the same power is
+    removed from the cooled nodes, as required by the steady state.
+
+    Mass flow rate and nodal temperatures are solved together by Newton
+    iterations performed on all the configurations at once: each
+    iteration evaluates all the nodal properties by a single batch call,
+    updates the temperatures by one Newton step on the specific enthalpy,
+    and the mass flow rate by one Newton step on the momentum balance,
+    whose Jacobian accounts for the density changes by the analytic
+    derivative of the density correlation. The dependence of the dynamic
+    viscosity on the mass flow rate is neglected in the Jacobian only.
+
+    All the nodal arguments are broadcast against each other, their last
+    axis running over the loop nodes; the other arguments are broadcast
+    against the remaining axes, which run over the configurations.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    length : float | np.ndarray
+        Length of the nodes in :math:`[m]`
+    elevation : np.ndarray
+        Elevation change of the nodes along the flow in :math:`[m]`,
+        summing up to zero over the loop
+    diameter : float | np.ndarray
+        Hydraulic diameter of the nodes in :math:`[m]`
+    area : float | np.ndarray
+        Flow area of the nodes in :math:`[m^2]`
+    power : float | np.ndarray
+        Heat input in :math:`[W]`, strictly positive
+    heated : np.ndarray
+        Non-negative weights distributing the heat input over the nodes,
+        e.g., `1` for the heated nodes and `0` for the other ones
+    cooled : np.ndarray
+        Non-negative weights distributing the removed heat over the
+        nodes, e.g., `1` for the cooled nodes and `0` for the other ones
+    T_in : float | np.ndarray
+        Temperature at the loop inlet in :math:`[K]`
+    loss_coefficient : float | np.ndarray, optional
+        Concentrated pressure loss coefficient of the nodes :math:`[-]`,
+        by default `0.0`
+    correlation : str, optional
+        name of the Darcy friction factor correlation, see
+        :func:`lbh15.heat_transfer.friction_factor`. By default, 'blasius'
+    roughness : float | np.ndarray, optional
+        wall roughness in :math:`[m]`, by default `0.0`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    xtol : float, optional
+        Relative tolerance on the increments of the mass flow rate and
+        of the temperatures, by default `1e-10`
+    max_iter : int, optional
+        Maximum number of Newton iterations, by default `50`
+
+    Returns
+    -------
+    CirculationResult
+    """
+    loop = _setup(metal, length, elevation, diameter, area, power, heated,
+                  cooled, T_in, loss_coefficient, correlation, roughness, p,
+                  correlations)
+    # Guess value from the Boussinesq approximation with uniform
+    # properties and friction factor equal to 0.02
+    m_dot = np.cbrt(g * loop.inlet['alpha'] * loop.inlet['rho']**2
+                    * loop.head / loop.inlet['cp']
+                    / np.sum((0.02 * loop.L_D + loop.K) * loop.inv_2A2,
+                             axis=-1))
+    T = _temperature_guess(loop, m_dot)
+    for it in range(1, max_iter + 1):
+        residual, jacobian, T_increment, dT_dm, rho, Re = \
+            _balance(loop, m_dot, T)
+        m_new = np.maximum(m_dot - residual / jacobian, m_dot / 4)
+        increment = m_new - m_dot
+        m_dot = m_new
+        T = T + T_increment + dT_dm * increment[..., None]
+        if np.all(np.abs(increment) <= xtol * m_dot) \
+                and np.all(np.abs(T_increment) <= xtol * T):
+            break
+    else:
+        raise RuntimeError("Error when solving natural circulation. "
+                           "Newton iterations did not converge within "
+                           f"{max_iter} iterations")
+    batch.check_temperature(metal, T)
+    return CirculationResult(m_dot, T, rho, m_dot[..., None] / rho / area,
+                             Re, -g * np.sum(loop.elevation * rho, axis=-1),
+                             (Re >= loop.re_range[0])
+                             & (Re <= loop.re_range[1]), it)
+
+
+def transient(metal: Type[LiquidMetalInterface],
+              length: Union[float, np.ndarray], elevation: np.ndarray,
+              diameter: Union[float, np.ndarray],
+              area: Union[float, np.ndarray],
+              power: Union[float, np.ndarray], heated: np.ndarray,
+              cooled: np.ndarray, T_in: Union[float, np.ndarray],
+              mass_flow: Union[float, np.ndarray], time_step: float,
+              n_steps: int, loss_coefficient: Union[float, np.ndarray] = 0.0,
+              correlation: str = 'blasius',
+              roughness: Union[float, np.ndarray] = 0.0,
+              p: Union[float, np.ndarray] = atm,
+              correlations: Union[Dict[str, str], None] = None,
+              xtol: float = 1e-10,
+              max_iter: int = 50) -> CirculationTransient:
+    """
+    Computes the transient natural circulation of liquid metal loops
+    starting from the given mass flow rate, e.g., the steady-state one
+    of a different heat input computed by :func:`solve`, by integrating
+    the momentum balance over the loop nodes
+
+    :math:`\\sum_i \\displaystyle\\frac{L_i}{A_i}
+    \\frac{d\\dot{m}}{dt} = -g \\sum_i \\rho_i \\Delta z_i -
+    \\dot{m}^2 \\sum_i \\left(f_i \\displaystyle\\frac{L_i}{D_i} +
+    K_i\\right) \\displaystyle\\frac{1}{2 \\rho_i A_i^2}`
+
+    by the implicit Euler method. The nodal temperatures follow the mass
+    flow rate by the energy balance adopted by :func:`solve`, i.e., the
+    heat capacity of the liquid metal and of the structures is
+    neglected, so that the transient is driven by the inertia of the
+    liquid metal only.
+
+    Each time step is solved by Newton iterations performed on all the
+    configurations at once, adopting the residual and the Jacobian of
+    the momentum balance of :func:`solve` increased by the inertia term.
+    The method is unconditionally stable, and a single time step much
+    longer than the time constant of the loop yields the steady state.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    length : float | np.ndarray
+        Length of the nodes in :math:`[m]`
+    elevation : np.ndarray
+        Elevation change of the nodes along the flow in :math:`[m]`,
+        summing up to zero over the loop
+    diameter : float | np.ndarray
+        Hydraulic diameter of the nodes in :math:`[m]`
+    area : float | np.ndarray
+        Flow area of the nodes in :math:`[m^2]`
+    power : float | np.ndarray
+        Heat input in :math:`[W]`, strictly positive
+    heated : np.ndarray
+        Non-negative weights distributing the heat input over the nodes,
+        e.g., `1` for the heated nodes and `0` for the other ones
+    cooled : np.ndarray
+        Non-negative weights distributing the removed heat over the
+        nodes, e.g., `1` for the cooled nodes and `0` for the other ones
+    T_in : float | np.ndarray
+        Temperature at the loop inlet in :math:`[K]`
+    mass_flow : float | np.ndarray
+        Initial mass flow rate in :math:`[kg/s]`, strictly positive
+    time_step : float
+        Time step in :math:`[s]`, strictly positive
+    n_steps : int
+        Number of time steps, strictly positive
+    loss_coefficient : float | np.ndarray, optional
+        Concentrated pressure loss coefficient of the nodes :math:`[-]`,
+        by default `0.0`
+    correlation : str, optional
+        name of the Darcy friction factor correlation, see
+        :func:`lbh15.heat_transfer.friction_factor`. By default, 'blasius'
+    roughness : float | np.ndarray, optional
+        wall roughness in :math:`[m]`, by default `0.0`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    xtol : float, optional
+        Relative tolerance on the increments of the mass flow rate and
+        of the temperatures, by default `1e-10`
+    max_iter : int, optional
+        Maximum number of Newton iterations per time step, by default
+        `50`
+
+    Returns
+    -------
+    CirculationTransient
+    """
+    if time_step <= 0:
+        raise ValueError("Time step must be strictly positive, "
+                         f"{time_step} [s] was provided")
+    if n_steps < 1:
+        raise ValueError("Number of time steps must be strictly positive, "
+                         f"{n_steps} was provided")
+    loop = _setup(metal, length, elevation, diameter, area, power, heated,
+                  cooled, T_in, loss_coefficient, correlation, roughness, p,
+                  correlations)
+    m_dot = np.array(np.broadcast_to(mass_flow, loop.head.shape),
+                     dtype=float)
+    if np.any(m_dot <= 0):
+        raise ValueError("Initial mass flow rate must be strictly positive, "
+                         f"{m_dot[m_dot <= 0].flat[0]:.2f} [kg/s] was "
+                         "provided")
+    inertia = np.sum(np.broadcast_to(np.asarray(length) / area,
+                                     loop.L_D.shape), axis=-1) / time_step
+    history = CirculationTransient(
+        time_step * np.arange(1, n_steps + 1),
+        np.empty((n_steps,) + m_dot.shape),
+        np.empty((n_steps,) + loop.L_D.shape),
+        np.empty((n_steps,) + m_dot.shape),
+        np.empty(n_steps, dtype=int))
+    T = _temperature_guess(loop, m_dot)
+    for step in range(n_steps):
+        m_old = m_dot
+        for it in range(1, max_iter + 1):
+            residual, jacobian, T_increment, dT_dm, rho, _ = \
+                _balance(loop, m_dot, T)
+            m_new = np.maximum(
+                m_dot - (inertia * (m_dot - m_old) - residual)
+                / (inertia - jacobian), m_dot / 4)
+            increment = m_new - m_dot
+            m_dot = m_new
+            T = T + T_increment + dT_dm * increment[..., None]
+            if np.all(np.abs(increment) <= xtol * m_dot) \
+                    and np.all(np.abs(T_increment) <= xtol * T):
+                break
+        else:
+            raise RuntimeError("Error when solving natural circulation "
+                               f"transient at time step {step + 1}. "
+                               "Newton iterations did not converge within "
+                               f"{max_iter} iterations")
+        batch.check_temperature(metal, T)
+        history.mass_flow[step] = m_dot
+        history.T[step] = T
+        history.buoyancy[step] = -g * np.sum(loop.elevation * rho, axis=-1)
+        history.iterations[step] = it
+    return history
+
+
+class _Loop(NamedTuple):
+    """
+    Loop data shared by the iterations of the natural circulation
+    solvers.
+    """
+    metal: Type[LiquidMetalInterface]
+    p: np.ndarray
+    correlations: Union[Dict[str, str], None]
+    T_in: np.ndarray
+    elevation: np.ndarray
+    Q_center: np.ndarray
+    head: np.ndarray
+    L_D: np.ndarray
+    K: np.ndarray
+    inv_2A2: np.ndarray
+    eps: np.ndarray
+    Re_factor: np.ndarray
+    friction: Callable
+    re_range: Tuple[float, float]
+    rho_object: PropertyInterface
+    inlet: Dict[str, np.ndarray]
+
+
+def _setup(metal: Type[LiquidMetalInterface],
+           length: Union[float, np.ndarray], elevation: np.ndarray,
+           diameter: Union[float, np.ndarray], area: Union[float, np.ndarray],
+           power: Union[float, np.ndarray], heated: np.ndarray,
+           cooled: np.ndarray, T_in: Union[float, np.ndarray],
+           loss_coefficient: Union[float, np.ndarray], correlation: str,
+           roughness: Union[float, np.ndarray], p: Union[float, np.ndarray],
+           correlations: Union[Dict[str, str], None]) -> _Loop:
+    """
+    Checks the arguments and computes the loop data, i.e., the heat
+    released upstream of the node centers and the loss factors.
+    """
+    if correlation not in FRICTION_CORRELATIONS:
+        raise ValueError("Friction factor correlation must be one of "
+                         f"{list(FRICTION_CORRELATIONS)}, "
+                         f"'{correlation}' was provided")
+    friction, re_range = FRICTION_CORRELATIONS[correlation]
+    elevation = np.asarray(elevation, dtype=float)
+    if np.any(np.abs(elevation.sum(axis=-1))
+              > 1e-9 * np.abs(elevation).sum(axis=-1)):
+        raise ValueError("Elevation changes must sum up to zero over "
+                         "the loop")
+    power = np.asarray(power, dtype=float)
+    if np.any(power <= 0):
+        raise ValueError("Heat input must be strictly positive, "
+                         f"{power[power <= 0].flat[0]:.2f} [W] was "
+                         "provided")
+    T_in = np.asarray(T_in, dtype=float)
+    batch.check_temperature(metal, T_in)
+    p = np.asarray(p, dtype=float)
+
+    # Heat released by the nodes, and released upstream of their centers
+    Q = power[..., None] * (_weights(heated, 'Heated')
+                            - _weights(cooled, 'Cooled'))
+    shape = np.broadcast_shapes(Q.shape, elevation.shape, np.shape(length),
+                                np.shape(diameter), np.shape(area),
+                                np.shape(loss_coefficient),
+                                np.shape(roughness), T_in.shape + (1,),
+                                p.shape)
+    Q = np.broadcast_to(Q, shape)
+    Q_center = np.cumsum(Q, axis=-1) - Q / 2
+    head = np.sum(elevation * Q_center, axis=-1)
+    if np.any(head <= 0):
+        raise ValueError("Heated nodes must be lower than the cooled ones "
+                         "for the natural circulation to develop")
+    L_D = np.broadcast_to(np.asarray(length) / diameter, shape)
+    K = np.broadcast_to(loss_coefficient, shape)
+    inv_2A2 = 1 / 2 / np.square(area)
+    eps = np.asarray(roughness) / diameter
+    Re_factor = diameter / area
+
+    inlet = batch.evaluate(metal, _NAMES + ['alpha'], T_in,
+                           np.broadcast_to(p, shape)[..., 0], correlations)
+    rho_object = batch.property_objects(metal, 'rho', correlations)['rho']
+    return _Loop(metal, p, correlations, T_in, elevation, Q_center, head,
+                 L_D, K, inv_2A2, eps, Re_factor, friction, re_range,
+                 rho_object, inlet)
+
+
+def _temperature_guess(loop: _Loop, m_dot: np.ndarray) -> np.ndarray:
+    """
+    Guesses the nodal temperatures from the specific heat capacity at
+    the loop inlet.
+    """
+    return loop.T_in[..., None] + loop.Q_center / m_dot[..., None] \
+        / loop.inlet['cp'][..., None]
+
+
+def _balance(loop: _Loop, m_dot: np.ndarray, T: np.ndarray) -> Tuple:
+    """
+    Evaluates the nodal properties and computes the Newton increments
+    of the energy balance, i.e., the temperature increments and their
+    derivatives with respect to the mass flow rate, together with the
+    residual of the momentum balance and its derivative with respect to
+    the mass flow rate.
+    """
+    T = batch.validate_temperature(loop.metal, T, 'clip')
+    values = batch.evaluate(loop.metal, _NAMES, T, loop.p, loop.correlations)
+    rho, cp = values['rho'], values['cp']
+    m_col = m_dot[..., None]
+    # Energy balance: Newton step on the specific enthalpy
+    T_increment = (loop.inlet['h'][..., None] + loop.Q_center / m_col
+                   - values['h']) / cp
+    dT_dm = -loop.Q_center / np.square(m_col) / cp
+    # Momentum balance: residual and Jacobian
+    Re = m_col * loop.Re_factor / values['mu']
+    f = loop.friction(Re, loop.eps)
+    df_dRe = (loop.friction(Re * (1 + 1e-6), loop.eps)
+              - loop.friction(Re * (1 - 1e-6), loop.eps)) / (2e-6 * Re)
+    loss = (f * loop.L_D + loop.K) * loop.inv_2A2 / rho
+    d_rho = loop.rho_object.derivative(T, loop.p) * dT_dm
+    residual = -g * np.sum(loop.elevation * rho, axis=-1) \
+        - np.square(m_dot) * np.sum(loss, axis=-1)
+    jacobian = -g * np.sum(loop.elevation * d_rho, axis=-1) \
+        - np.sum(2 * m_col * loss + m_col * df_dRe * Re * loop.L_D
+                 * loop.inv_2A2 / rho - np.square(m_col) * loss * d_rho / rho,
+                 axis=-1)
+    return residual, jacobian, T_increment, dT_dm, rho, Re
+
+
+def _weights(weights: np.ndarray, section: str) -> np.ndarray:
+    """
+    Normalizes the weights distributing the heat over the nodes.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if np.any(weights < 0):
+        raise ValueError(f"{section} weights must be non-negative")
+    total = weights.sum(axis=-1, keepdims=True)
+    if np.any(total <= 0):
+        raise ValueError(f"{section} weights must not be all zero")
+    return weights / total
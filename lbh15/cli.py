@@ -0,0 +1,323 @@
+"""Module with the command line interface of lbh15 package, i.e., the
+`lbh15` console command generating property tables over temperature
+grids or appending the properties to the temperature values read from
+a file. Both modes process the values in chunks of fixed size, so that
+the memory usage does not depend on the number of values."""
+import argparse
+import asyncio
+import sys
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import TextIO
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import convert_temperature
+from ._lbh15 import LiquidMetalInterface
+from .lead import Lead
+from .lbe import LBE
+from .bismuth import Bismuth
+from . import batch
+
+# Liquid metal classes selectable from the command line
+METALS: Dict[str, Type[LiquidMetalInterface]] = {'lead': Lead, 'lbe': LBE,
+                                                 'bismuth': Bismuth}
+# Temperature units selectable from the command line
+UNITS: Dict[str, str] = {'K': 'Kelvin', 'C': 'Celsius', 'F': 'Fahrenheit'}
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """
+    Entry point of the `lbh15` console command.
+
+    Parameters
+    ----------
+    argv : List[str] | None, optional
+        command line arguments; if `None`, the ones of the current
+        process are adopted. By default, `None`
+
+    Returns
+    -------
+    int
+        exit status
+    """
+    args = _parser().parse_args(argv)
+    if args.mode == 'serve':
+        return _serve(args)
+    metal = METALS[args.metal]
+    try:
+        correlations = _correlations(args.correlation)
+        objects = batch.property_objects(metal, args.properties,
+                                         correlations)
+        with _open_output(args.output) as output:
+            if args.mode == 'table':
+                write_table(metal, list(objects), args.start, args.stop,
+                            args.step, output, args.unit, correlations,
+                            args.chunk_size, args.delimiter)
+            else:
+                with open(args.input, 'r', encoding='utf-8') as source:
+                    stream(metal, list(objects), source, output,
+                           args.column, args.unit, correlations,
+                           args.chunk_size)
+    except (ValueError, OSError) as error:
+        print(f"lbh15: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def write_table(metal: Type[LiquidMetalInterface], properties: List[str],
+                start: float, stop: float, step: float, output: TextIO,
+                unit: str = 'K',
+                correlations: Union[Dict[str, str], None] = None,
+                chunk_size: int = 65536, delimiter: str = '\t') -> None:
+    """
+    Writes the table of the properties over the temperature grid
+    going from `start` to `stop` (included, if on the grid) by `step`.
+    The grid is generated and evaluated chunk by chunk.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : List[str]
+        names of the properties to write
+    start : float
+        first temperature of the grid in `unit`
+    stop : float
+        last temperature of the grid in `unit`
+    step : float
+        temperature step of the grid in `unit`
+    output : TextIO
+        text stream the table is written to
+    unit : str, optional
+        temperature unit, i.e., one of 'K', 'C' and 'F'. By default, 'K'
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    chunk_size : int, optional
+        number of rows evaluated at once, by default `65536`
+    delimiter : str, optional
+        column delimiter, by default the tab character
+    """
+    if step <= 0:
+        raise ValueError("Temperature step must be strictly positive, "
+                         f"{step} was provided")
+    n_rows = int(np.floor((stop - start) / step * (1 + 1e-12))) + 1
+    output.write(_header(metal, properties, correlations, unit,
+                         delimiter))
+    for first in range(0, max(n_rows, 0), chunk_size):
+        T = start + step * np.arange(first, min(first + chunk_size, n_rows))
+        values = _evaluate(metal, properties, T, unit, correlations)
+        np.savetxt(output, np.column_stack([T, values]), fmt='%.10g',
+                   delimiter=delimiter)
+
+
+def stream(metal: Type[LiquidMetalInterface], properties: List[str],
+           source: TextIO, output: TextIO, column: int = 0,
+           unit: str = 'K',
+           correlations: Union[Dict[str, str], None] = None,
+           chunk_size: int = 65536) -> None:
+    """
+    Reads the temperature values from a comma-separated or
+    whitespace-separated text stream, e.g., a sensor log, and writes
+    each line followed by the corresponding property values. Lines are
+    processed chunk by chunk; comment lines, i.e., starting with '#',
+    and blank lines are copied as they are.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : List[str]
+        names of the properties to write
+    source : TextIO
+        text stream the temperature values are read from
+    output : TextIO
+        text stream the lines with the property values are written to
+    column : int, optional
+        index of the column storing the temperature values, by default `0`
+    unit : str, optional
+        temperature unit, i.e., one of 'K', 'C' and 'F'. By default, 'K'
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    chunk_size : int, optional
+        number of lines evaluated at once, by default `65536`
+    """
+    output.write(_header(metal, properties, correlations, unit, '\t',
+                         column=column))
+    for lines, T in _chunks(source, column, chunk_size):
+        values = _evaluate(metal, properties, T, unit, correlations)
+        rows = iter(values)
+        for line in lines:
+            if line.lstrip().startswith('#') or not line.strip():
+                output.write(line)
+                continue
+            delimiter = ',' if ',' in line else '\t'
+            output.write(line.rstrip() + delimiter
+                         + delimiter.join(f"{v:.10g}" for v in next(rows))
+                         + '\n')
+
+
+def _chunks(source: TextIO, column: int,
+            chunk_size: int) -> Iterator[Tuple[List[str], np.ndarray]]:
+    """
+    Yields the lines of the text stream together with the temperature
+    values they store, holding at most `chunk_size` data lines at once.
+    """
+    lines, temperatures = [], []
+    for number, line in enumerate(source, 1):
+        lines.append(line)
+        if not line.lstrip().startswith('#') and line.strip():
+            fields = line.split(',') if ',' in line else line.split()
+            try:
+                temperatures.append(float(fields[column]))
+            except (IndexError, ValueError) as error:
+                raise ValueError(f"Line {number}: unable to read the "
+                                 f"temperature in column {column}") \
+                    from error
+            if len(temperatures) == chunk_size:
+                yield lines, np.array(temperatures)
+                lines, temperatures = [], []
+    if len(lines) > 0:
+        yield lines, np.array(temperatures)
+
+
+def _evaluate(metal: Type[LiquidMetalInterface], properties: List[str],
+              T: np.ndarray, unit: str,
+              correlations: Union[Dict[str, str], None]) -> np.ndarray:
+    """
+    Evaluates the properties over the temperature values expressed in
+    `unit`, returning one column per property.
+    """
+    values = batch.evaluate(metal, properties,
+                            convert_temperature(T, UNITS[unit], 'Kelvin'),
+                            correlations=correlations)
+    return np.column_stack([values[name] for name in properties]) \
+        .reshape(len(T), len(properties))
+
+
+def _header(metal: Type[LiquidMetalInterface], properties: List[str],
+            correlations: Union[Dict[str, str], None], unit: str,
+            delimiter: str, column: Union[int, None] = None) -> str:
+    """
+    Returns the comment lines describing the written columns.
+    """
+    objects = batch.property_objects(metal, properties, correlations)
+    names = [f"{name} {obj.units} ({obj.correlation_name})"
+             for name, obj in objects.items()]
+    if column is None:
+        return (f"# {metal.__name__} properties\n# T [{unit}]{delimiter}"
+                + delimiter.join(names) + "\n")
+    return (f"# {metal.__name__} properties computed from temperature "
+            f"[{unit}] in column {column}, appended as: "
+            + ", ".join(names) + "\n")
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """
+    Runs the local property service until interrupted.
+    """
+    from . import service  # pylint: disable=import-outside-toplevel
+    try:
+        asyncio.run(service.serve(args.socket, args.host, args.port,
+                                  args.window, args.max_batch_size))
+    except KeyboardInterrupt:
+        pass
+    except (ValueError, OSError) as error:
+        print(f"lbh15: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _correlations(pairs: Union[List[str], None]) -> Dict[str, str]:
+    """
+    Converts the 'property=correlation' pairs into a dictionary.
+    """
+    correlations = {}
+    for pair in pairs or []:
+        name, sep, corr_name = pair.partition('=')
+        if not sep or not name or not corr_name:
+            raise ValueError("Correlations must be provided as "
+                             f"'property=correlation', '{pair}' was "
+                             "provided")
+        correlations[name] = corr_name
+    return correlations
+
+
+@contextmanager
+def _open_output(file_name: Union[str, None]) -> Iterator[TextIO]:
+    """
+    Opens the output file, or provides the standard output if no file
+    name is provided.
+    """
+    if file_name is None:
+        yield sys.stdout
+        return
+    with open(file_name, 'w', encoding='utf-8') as output:
+        yield output
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    Returns the parser of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='lbh15', description="Liquid metal properties from the "
+        "Handbook on Lead-bismuth Eutectic Alloy and Lead Properties")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-m', '--metal', choices=list(METALS),
+                        default='lead', help="liquid metal, "
+                        "by default 'lead'")
+    common.add_argument('-p', '--properties', nargs='+', default=None,
+                        help="properties to compute, by default all the "
+                        "available ones")
+    common.add_argument('-c', '--correlation', action='append',
+                        metavar='PROPERTY=CORRELATION',
+                        help="correlation to use for a property, "
+                        "can be repeated")
+    common.add_argument('-u', '--unit', choices=list(UNITS), default='K',
+                        help="temperature unit, by default 'K'")
+    common.add_argument('-o', '--output', default=None,
+                        help="output file, by default the standard output")
+    common.add_argument('--chunk-size', type=int, default=65536,
+                        help="number of values evaluated at once, "
+                        "by default 65536")
+    modes = parser.add_subparsers(dest='mode', required=True)
+    table = modes.add_parser('table', parents=[common],
+                             help="write the properties over a "
+                             "temperature grid")
+    table.add_argument('start', type=float, help="first temperature")
+    table.add_argument('stop', type=float, help="last temperature")
+    table.add_argument('step', type=float, help="temperature step")
+    table.add_argument('-d', '--delimiter', default='\t',
+                       help="column delimiter, by default the tab "
+                       "character")
+    stream_mode = modes.add_parser('stream', parents=[common],
+                                   help="append the properties to the "
+                                   "temperatures read from a file")
+    stream_mode.add_argument('input', help="comma-separated or "
+                             "whitespace-separated input file")
+    stream_mode.add_argument('--column', type=int, default=0,
+                             help="index of the temperature column, "
+                             "by default 0")
+    serve = modes.add_parser('serve', help="run the local property "
+                             "service, see lbh15.service")
+    serve.add_argument('--socket', default=None,
+                       help="path of the Unix socket to listen on")
+    serve.add_argument('--host', default='127.0.0.1',
+                       help="host to listen on if no socket is provided, "
+                       "by default '127.0.0.1'")
+    serve.add_argument('--port', type=int, default=0,
+                       help="port to listen on if no socket is provided, "
+                       "by default a free one")
+    serve.add_argument('--window', type=float, default=0.002,
+                       help="time window requests are coalesced within "
+                       "in seconds, by default 0.002")
+    serve.add_argument('--max-batch-size', type=int, default=1000000,
+                       help="number of values triggering a coalesced "
+                       "call, by default 1000000")
+    return parser
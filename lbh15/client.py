@@ -0,0 +1,313 @@
+"""Module with the clients of the local property service, see
+:mod:`lbh15.service`. The module only depends on the Python standard
+library, so that tools querying the service do not pay the import of
+the liquid metal classes, NumPy and SciPy. Values can be passed as
+numbers, as (nested) sequences of numbers or as any object providing
+a `tolist` method, e.g., NumPy arrays; results are returned as numbers
+or as (nested) lists having the same shape."""
+import asyncio
+import itertools
+import json
+import socket
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+# Atmospheric pressure value in [Pa]
+ATM = 101325.0
+
+
+class ServiceError(RuntimeError):
+    """
+    Error reported by the property service while processing a request.
+    """
+
+
+class Client:
+    """
+    Blocking client of the property service. Requests are sent one at
+    a time; concurrent requests from several threads or processes
+    should adopt one client each, or :class:`AsyncClient`.
+
+    Parameters
+    ----------
+    path : str | None, optional
+        path of the Unix socket the service listens on; if `None`,
+        `host` and `port` are adopted. By default, `None`
+    host : str, optional
+        host the service listens on, by default '127.0.0.1'
+    port : int | None, optional
+        port the service listens on, mandatory if `path` is `None`.
+        By default, `None`
+    timeout : float | None, optional
+        timeout of the socket operations in :math:`[s]`, by default
+        `None`, i.e., no timeout
+    """
+    def __init__(self, path: Union[str, None] = None,
+                 host: str = '127.0.0.1', port: Union[int, None] = None,
+                 timeout: Union[float, None] = None):
+        if path is not None:
+            self.__socket = socket.socket(socket.AF_UNIX,
+                                          socket.SOCK_STREAM)
+            self.__socket.settimeout(timeout)
+            self.__socket.connect(path)
+        else:
+            _check_port(port)
+            self.__socket = socket.create_connection((host, port), timeout)
+        self.__file = self.__socket.makefile('rwb')
+        self.__ids = itertools.count()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self.__file.close()
+        self.__socket.close()
+
+    def evaluate(self, metal: str, properties: Union[str, List[str], None],
+                 T: Any, p: Any = ATM,
+                 correlations: Union[Dict[str, str], None] = None
+                 ) -> Dict[str, Any]:
+        """
+        Evaluates the properties, see :func:`lbh15.batch.evaluate`.
+
+        Parameters
+        ----------
+        metal : str
+            liquid metal, i.e., one of 'lead', 'lbe' and 'bismuth'
+        properties : str | List[str] | None
+            name or names of the properties to evaluate; if `None`,
+            all the available ones are evaluated
+        T : Any
+            Temperature in :math:`[K]`
+        p : Any, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+        correlations : Dict[str, str] | None, optional
+            dictionary defining the correlation to use for the
+            corresponding property, by default `None`
+
+        Returns
+        -------
+        Dict[str, Any]
+            property values keyed by property name
+        """
+        return self.__request(_evaluate_request(metal, properties, T, p,
+                                                correlations))
+
+    def temperature(self, metal: str, property_name: str, values: Any,
+                    p: Any = ATM, T_guess: Any = None,
+                    correlations: Union[Dict[str, str], None] = None
+                    ) -> Any:
+        """
+        Computes the temperature values at which the property takes the
+        values passed as argument, see :func:`lbh15.batch.temperature`.
+
+        Parameters
+        ----------
+        metal : str
+            liquid metal, i.e., one of 'lead', 'lbe' and 'bismuth'
+        property_name : str
+            name of the property
+        values : Any
+            property values
+        p : Any, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+        T_guess : Any, optional
+            initial guess of the temperature in :math:`[K]`, by default
+            `None`
+        correlations : Dict[str, str] | None, optional
+            dictionary defining the correlation to use for the
+            corresponding property, by default `None`
+
+        Returns
+        -------
+        Any
+            Temperature in :math:`[K]`
+        """
+        return self.__request(_temperature_request(
+            metal, property_name, values, p, T_guess, correlations))['T']
+
+    def __request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends the request and returns the result of its response.
+        """
+        request['id'] = next(self.__ids)
+        self.__file.write(_encode(request))
+        self.__file.flush()
+        line = self.__file.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the service")
+        return _result(json.loads(line))
+
+
+class AsyncClient:
+    """
+    Asyncio client of the property service. Several requests can be
+    awaited concurrently, e.g., by :func:`asyncio.gather`, so that the
+    service can coalesce them. Clients are built by :meth:`connect`.
+    """
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        self.__writer = writer
+        self.__ids = itertools.count()
+        self.__pending: Dict[int, asyncio.Future] = {}
+        self.__receiver = asyncio.ensure_future(self.__receive(reader))
+
+    @classmethod
+    async def connect(cls, path: Union[str, None] = None,
+                      host: str = '127.0.0.1',
+                      port: Union[int, None] = None) -> "AsyncClient":
+        """
+        Connects to the property service.
+
+        Parameters
+        ----------
+        path : str | None, optional
+            path of the Unix socket the service listens on; if `None`,
+            `host` and `port` are adopted. By default, `None`
+        host : str, optional
+            host the service listens on, by default '127.0.0.1'
+        port : int | None, optional
+            port the service listens on, mandatory if `path` is `None`.
+            By default, `None`
+
+        Returns
+        -------
+        AsyncClient
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            _check_port(port)
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        self.__writer.close()
+        await self.__writer.wait_closed()
+        self.__receiver.cancel()
+
+    async def evaluate(self, metal: str,
+                       properties: Union[str, List[str], None], T: Any,
+                       p: Any = ATM,
+                       correlations: Union[Dict[str, str], None] = None
+                       ) -> Dict[str, Any]:
+        """
+        Evaluates the properties, see :meth:`Client.evaluate`.
+        """
+        return await self.__request(_evaluate_request(
+            metal, properties, T, p, correlations))
+
+    async def temperature(self, metal: str, property_name: str,
+                          values: Any, p: Any = ATM, T_guess: Any = None,
+                          correlations: Union[Dict[str, str], None] = None
+                          ) -> Any:
+        """
+        Computes the temperature values at which the property takes the
+        values passed as argument, see :meth:`Client.temperature`.
+        """
+        return (await self.__request(_temperature_request(
+            metal, property_name, values, p, T_guess, correlations)))['T']
+
+    async def __request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends the request and waits for its response.
+        """
+        request['id'] = next(self.__ids)
+        future = asyncio.get_running_loop().create_future()
+        self.__pending[request['id']] = future
+        self.__writer.write(_encode(request))
+        await self.__writer.drain()
+        return _result(await future)
+
+    async def __receive(self, reader: asyncio.StreamReader) -> None:
+        """
+        Dispatches the responses to the pending requests.
+        """
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.__pending.pop(response.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self.__pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError("Connection closed by the service"))
+        self.__pending.clear()
+
+
+def _check_port(port: Union[int, None]) -> None:
+    """
+    Checks that the port is provided.
+    """
+    if port is None:
+        raise ValueError("Either the socket path or the port must be "
+                         "provided")
+
+
+def _plain(value: Any) -> Any:
+    """
+    Converts array-like objects into lists.
+    """
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def _evaluate_request(metal: str, properties: Union[str, List[str], None],
+                      T: Any, p: Any,
+                      correlations: Union[Dict[str, str], None]
+                      ) -> Dict[str, Any]:
+    """
+    Builds the message of a property evaluation request.
+    """
+    return {'op': 'evaluate', 'metal': metal, 'properties': properties,
+            'T': _plain(T), 'p': _plain(p), 'correlations': correlations}
+
+
+def _temperature_request(metal: str, property_name: str, values: Any,
+                         p: Any, T_guess: Any,
+                         correlations: Union[Dict[str, str], None]
+                         ) -> Dict[str, Any]:
+    """
+    Builds the message of a temperature computation request.
+    """
+    return {'op': 'temperature', 'metal': metal, 'property': property_name,
+            'values': _plain(values), 'p': _plain(p),
+            'T_guess': _plain(T_guess), 'correlations': correlations}
+
+
+def _encode(request: Dict[str, Any]) -> bytes:
+    """
+    Encodes the request as a JSON line.
+    """
+    return json.dumps(request).encode() + b'\n'
+
+
+def _result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the result of the response, raising the reported error,
+    if any.
+    """
+    if 'error' in response:
+        raise ServiceError(response['error'])
+    return response['result']
@@ -0,0 +1,142 @@
+"""Module with the comparative evaluation of the properties of several
+liquid metals over the same temperature values, e.g., for design trade
+studies. The input arrays are converted once, and each liquid metal is
+evaluated by a single batch call writing into the rows of stacked
+output arrays, the liquid metals being evaluated concurrently."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from .lead import Lead
+from .bismuth import Bismuth
+from .lbe import LBE
+from . import batch
+
+
+class Comparison(NamedTuple):
+    """
+    Property values of several liquid metals. Stacked arrays have one
+    row per liquid metal; the remaining axes follow the broadcast shape
+    of temperature and pressure.
+    """
+    metals: List[str]
+    """Names of the liquid metals, in the order of the rows"""
+    values: Dict[str, np.ndarray]
+    """Stacked property values keyed by property name, `nan` where the
+    temperature is outside the liquid range of the metal"""
+    liquid: np.ndarray
+    """`True` where the temperature belongs to the liquid range of the
+    metal"""
+    valid: Dict[str, np.ndarray]
+    """`True` where the temperature belongs to the liquid range of the
+    metal and to the validity range of the correlation, keyed by
+    property name"""
+
+
+def common_properties(metals: List[Type[LiquidMetalInterface]]
+                      ) -> List[str]:
+    """
+    Returns the names of the properties available for all the liquid
+    metals, in the order of the first one.
+
+    Parameters
+    ----------
+    metals : List[Type[LiquidMetalInterface]]
+        liquid metal classes, e.g., :class:`.Lead`
+
+    Returns
+    -------
+    List[str]
+    """
+    names = list(batch.property_objects(metals[0]))
+    for metal in metals[1:]:
+        available = batch.property_objects(metal)
+        names = [name for name in names if name in available]
+    return names
+
+
+def compare(T: Union[float, np.ndarray],
+            properties: Union[str, List[str], None] = None,
+            p: Union[float, np.ndarray] = atm,
+            metals: Union[List[Type[LiquidMetalInterface]], None] = None,
+            correlations: Union[Dict[str, Dict[str, str]], None] = None,
+            workers: Union[int, None] = None) -> Comparison:
+    """
+    Evaluates the required properties of several liquid metals over the
+    same arrays of temperature and pressure values. Temperature and
+    pressure are converted and checked once; then each liquid metal is
+    evaluated by a single call to :func:`lbh15.batch.evaluate`, writing
+    into its row of the stacked output arrays, with the temperature
+    values outside its liquid range masked. Liquid metals are evaluated
+    in parallel by a pool of threads, as *numpy* releases the GIL while
+    operating on large arrays, or one after the other if only one worker
+    is available.
+
+    Parameters
+    ----------
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    properties : str | List[str] | None, optional
+        name(s) of the property(ies) to evaluate. If `None`, the ones
+        available for all the liquid metals, see
+        :func:`common_properties`. By default, `None`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, broadcastable against `T`, by default
+        the atmospheric pressure value, i.e., :math:`101325.0 Pa`
+    metals : List[Type[LiquidMetalInterface]] | None, optional
+        liquid metal classes; if `None`, :class:`.Lead`,
+        :class:`.Bismuth` and :class:`.LBE`. By default, `None`
+    correlations : Dict[str, Dict[str, str]] | None, optional
+        dictionaries defining the correlation to use for the
+        corresponding property, keyed by liquid metal class name, e.g.,
+        'Lead'. By default, `None`
+    workers : int | None, optional
+        maximum number of threads; if `None`, one per liquid metal, up
+        to the number of CPUs. By default, `None`
+
+    Returns
+    -------
+    Comparison
+    """
+    if metals is None:
+        metals = [Lead, Bismuth, LBE]
+    if correlations is None:
+        correlations = {}
+    if properties is None:
+        properties = common_properties(metals)
+    elif isinstance(properties, str):
+        properties = [properties]
+    T, p = batch.as_arrays(T, p)
+    shape = (len(metals),) + np.broadcast_shapes(T.shape, p.shape)
+    values = {name: np.empty(shape, dtype=T.dtype) for name in properties}
+    valid = {name: np.empty(shape, dtype=bool) for name in properties}
+    liquid = np.empty(shape, dtype=bool)
+
+    def evaluate(index: int) -> None:
+        metal = metals[index]
+        metal_correlations = correlations.get(metal.__name__)
+        T_m0, T_b0 = batch.liquid_range(metal)
+        liquid[index, ...] = (T > T_m0) & (T < T_b0)
+        batch.evaluate(metal, properties, T, p, metal_correlations,
+                       out={name: values[name][index, ...]
+                            for name in properties}, invalid='nan')
+        for name, mask in batch.validity(metal, properties, T,
+                                         metal_correlations).items():
+            np.logical_and(mask, liquid[index], out=valid[name][index, ...])
+
+    if workers is None:
+        workers = min(len(metals), os.cpu_count() or 1)
+    if workers <= 1:
+        for index in range(len(metals)):
+            evaluate(index)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(evaluate, range(len(metals))))
+    return Comparison([metal.__name__ for metal in metals], values, liquid,
+                      valid)
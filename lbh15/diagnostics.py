@@ -0,0 +1,333 @@
+"""Module with the handling of the validity diagnostics issued while
+evaluating the liquid metal properties, i.e., temperature values outside
+the validity range of the correlations and messages about the
+properties and correlations in use. Without an active collector, each
+diagnostic is issued as a warning, subject to the filters of the
+:mod:`warnings` module, which this package does not change. With an
+active collector, diagnostics are aggregated per property and
+correlation, and handled according to the collector policy."""
+import threading
+import warnings
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import NamedTuple
+from typing import Tuple
+from typing import Union
+import numpy as np
+
+# Policies of the collectors
+POLICIES = ('ignore', 'collect', 'warn_once', 'raise')
+
+# Collector of the diagnostics, if any. Instrumented code checks this
+# attribute only, so that the overhead is negligible when disabled
+_active: Union["Diagnostics", None] = None
+
+
+class Violation(NamedTuple):
+    """
+    Aggregated violations of the validity range of a correlation.
+    """
+    long_name: str
+    """Long name of the property"""
+    range: Tuple[float, float]
+    """Validity range of the correlation in :math:`[K]`"""
+    calls: int
+    """Number of evaluations with at least one temperature value outside
+    the validity range"""
+    count: int
+    """Number of temperature values outside the validity range"""
+    T_min: float
+    """Minimum temperature value outside the validity range in
+    :math:`[K]`"""
+    T_max: float
+    """Maximum temperature value outside the validity range in
+    :math:`[K]`"""
+
+
+class Diagnostics:
+    """
+    Collector of the diagnostics issued while it is active. Violations of
+    the validity ranges are keyed by `(module, property, correlation)`,
+    where `module` is the name of the module defining the property
+    object, e.g., 'lead_properties'; the other messages are keyed by
+    their text. Diagnostics are handled according to the policy:
+
+    - 'ignore': diagnostics are discarded;
+    - 'collect': diagnostics are aggregated only;
+    - 'warn_once': diagnostics are aggregated, and a warning is issued at
+      the first occurrence of each key only;
+    - 'raise': a :class:`ValueError` is raised at the first diagnostic.
+
+    Parameters
+    ----------
+    policy : str, optional
+        policy adopted, by default 'collect'
+    """
+    def __init__(self, policy: str = 'collect'):
+        if policy not in POLICIES:
+            raise ValueError(f"Policy must be one of {POLICIES}, "
+                             f"'{policy}' was provided")
+        self.__policy = policy
+        self.__lock = threading.Lock()
+        self.__violations: Dict[Tuple[str, str, str], list] = {}
+        self.__messages: Dict[str, int] = {}
+
+    @property
+    def policy(self) -> str:
+        """
+        str : policy adopted
+        """
+        return self.__policy
+
+    @property
+    def violations(self) -> Dict[Tuple[str, str, str], Violation]:
+        """
+        Dict[Tuple[str, str, str], Violation] : aggregated violations of
+        the validity ranges keyed by `(module, property, correlation)`
+        """
+        with self.__lock:
+            return {key: Violation(*values)
+                    for key, values in self.__violations.items()}
+
+    @property
+    def messages(self) -> Dict[str, int]:
+        """
+        Dict[str, int] : number of occurrences of the other messages,
+        keyed by message
+        """
+        with self.__lock:
+            return dict(self.__messages)
+
+    def record_range(self, property_object, T: Union[float, np.ndarray],
+                     stacklevel: int = 1) -> None:
+        """
+        Records the temperature values outside the validity range of the
+        property correlation, if any.
+
+        Parameters
+        ----------
+        property_object : PropertyInterface
+            property object whose correlation was evaluated
+        T : float | np.ndarray
+            Temperature in :math:`[K]`
+        stacklevel : int, optional
+            stack level of the warning issued by the 'warn_once' policy,
+            relative to the caller, by default `1`
+        """
+        if self.__policy == 'ignore':
+            return
+        violation = _violation(property_object, T)
+        if violation is None:
+            return
+        key = (type(property_object).__module__.rsplit('.', 1)[-1],
+               property_object.name, property_object.correlation_name)
+        with self.__lock:
+            first = key not in self.__violations
+            if first:
+                self.__violations[key] = list(violation)
+            else:
+                values = self.__violations[key]
+                values[2] += 1
+                values[3] += violation.count
+                values[4] = min(values[4], violation.T_min)
+                values[5] = max(values[5], violation.T_max)
+        self.__handle(_range_message(violation), first, stacklevel + 1)
+
+    def record_message(self, message: str, stacklevel: int = 1) -> None:
+        """
+        Records a message about the properties and correlations in use.
+
+        Parameters
+        ----------
+        message : str
+            text of the message
+        stacklevel : int, optional
+            stack level of the warning issued by the 'warn_once' policy,
+            relative to the caller, by default `1`
+        """
+        if self.__policy == 'ignore':
+            return
+        with self.__lock:
+            first = message not in self.__messages
+            self.__messages[message] = self.__messages.get(message, 0) + 1
+        self.__handle(message, first, stacklevel + 1)
+
+    def reset(self) -> None:
+        """
+        Clears all the collected diagnostics.
+        """
+        with self.__lock:
+            self.__violations.clear()
+            self.__messages.clear()
+
+    def summary(self) -> str:
+        """
+        Returns the collected diagnostics as a printable table.
+
+        Returns
+        -------
+        str
+        """
+        rvalue = "Validity range violations:\n"
+        for key, violation in self.violations.items():
+            rvalue += (f"\t{'.'.join(key)}: {violation.count} values in "
+                       f"{violation.calls} calls, "
+                       f"[{violation.T_min:.2f}, {violation.T_max:.2f}] K "
+                       "outside validity range "
+                       f"[{violation.range[0]:.2f}, "
+                       f"{violation.range[1]:.2f}] K\n")
+        rvalue += "Messages:\n"
+        for message, count in self.messages.items():
+            message = message.replace('\n', ' ')
+            rvalue += f"\t{count} times: {message}\n"
+        return rvalue
+
+    def __handle(self, message: str, first: bool, stacklevel: int) -> None:
+        """
+        Applies the policy to a recorded diagnostic.
+        """
+        if self.__policy == 'raise':
+            raise ValueError(message)
+        if self.__policy == 'warn_once' and first:
+            warnings.warn(message, stacklevel=stacklevel + 1)
+
+
+def check_range(property_object, T: Union[float, np.ndarray],
+                stacklevel: int = 1) -> None:
+    """
+    Checks whether the temperature values belong to the validity range of
+    the property correlation, passing them to the active collector, if
+    any, or issuing a warning otherwise.
+
+    Parameters
+    ----------
+    property_object : PropertyInterface
+        property object whose correlation is evaluated
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    stacklevel : int, optional
+        stack level of the warning, relative to the caller, by default `1`
+    """
+    if _active is not None:
+        _active.record_range(property_object, T, stacklevel + 1)
+        return
+    violation = _violation(property_object, T)
+    if violation is not None:
+        warnings.warn(_range_message(violation), stacklevel=stacklevel + 1)
+
+
+def report(message: str, stacklevel: int = 1) -> None:
+    """
+    Passes the message to the active collector, if any, or issues it as a
+    warning otherwise.
+
+    Parameters
+    ----------
+    message : str
+        text of the message
+    stacklevel : int, optional
+        stack level of the warning, relative to the caller, by default `1`
+    """
+    if _active is not None:
+        _active.record_message(message, stacklevel + 1)
+        return
+    warnings.warn(message, stacklevel=stacklevel + 1)
+
+
+def enable(policy: Union[str, Diagnostics] = 'collect') -> Diagnostics:
+    """
+    Enables the collection of the diagnostics.
+
+    Parameters
+    ----------
+    policy : str | Diagnostics, optional
+        policy adopted by a new collector, or the collector itself,
+        by default 'collect'
+
+    Returns
+    -------
+    Diagnostics
+        collector of the diagnostics
+    """
+    global _active  # pylint: disable=global-statement
+    _active = policy if isinstance(policy, Diagnostics) \
+        else Diagnostics(policy)
+    return _active
+
+
+def disable() -> Union[Diagnostics, None]:
+    """
+    Disables the collection of the diagnostics, restoring the warnings.
+
+    Returns
+    -------
+    Diagnostics | None
+        collector that was active, if any
+    """
+    global _active  # pylint: disable=global-statement
+    diagnostics, _active = _active, None
+    return diagnostics
+
+
+@contextmanager
+def collect(policy: Union[str, Diagnostics] = 'collect'
+            ) -> Iterator[Diagnostics]:
+    """
+    Context manager enabling the collection of the diagnostics within its
+    scope. The previous collector, if any, is restored at exit.
+
+    Parameters
+    ----------
+    policy : str | Diagnostics, optional
+        policy adopted by a new collector, or the collector itself,
+        by default 'collect'
+
+    Yields
+    ------
+    Diagnostics
+        collector of the diagnostics
+    """
+    global _active  # pylint: disable=global-statement
+    previous = _active
+    try:
+        yield enable(policy)
+    finally:
+        _active = previous
+
+
+def _violation(property_object, T: Union[float, np.ndarray]
+               ) -> Union[Violation, None]:
+    """
+    Returns the violation of the validity range of the property
+    correlation by the temperature values, or `None` if all of them
+    belong to the validity range.
+    """
+    range_lim = tuple(property_object.range)
+    if np.ndim(T) == 0:
+        if not (T < range_lim[0] or T > range_lim[1]):
+            return None
+        return Violation(property_object.long_name, range_lim, 1, 1,
+                         float(T), float(T))
+    T = np.asarray(T)
+    outside = T[(T < range_lim[0]) | (T > range_lim[1])]
+    if outside.size == 0:
+        return None
+    return Violation(property_object.long_name, range_lim, 1, outside.size,
+                     float(outside.min()), float(outside.max()))
+
+
+def _range_message(violation: Violation) -> str:
+    """
+    Returns the message describing the violation.
+    """
+    range_lim = violation.range
+    if violation.count == 1:
+        values = f"temperature value of {violation.T_min:.2f} K that is"
+    else:
+        values = (f"{violation.count} temperature values in "
+                  f"[{violation.T_min:.2f}, {violation.T_max:.2f}] K "
+                  "that are")
+    return (f"The {violation.long_name} is requested at {values} "
+            "not in validity range "
+            f"[{range_lim[0]:.2f}, {range_lim[1]:.2f}] K")
@@ -0,0 +1,131 @@
+"""Module with the functions computing the dimensionless groups of
+liquid metal flows over arrays of temperature values, flow velocities
+and geometrical lengths."""
+from typing import Dict
+from typing import NamedTuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from scipy.constants import g
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+# Properties the dimensionless groups are computed from
+PROPERTIES = ['rho', 'mu', 'cp', 'k', 'alpha']
+
+
+class DimensionlessGroups(NamedTuple):
+    """
+    Dimensionless groups evaluated element-wise. The groups depending on
+    buoyancy are `None` if no temperature difference is provided.
+    """
+    Re: np.ndarray
+    """Reynolds number :math:`[-]`"""
+    Pr: np.ndarray
+    """Prandtl number :math:`[-]`"""
+    Pe: np.ndarray
+    """Péclet number :math:`[-]`, i.e., :math:`Re \\cdot Pr`"""
+    Gr: Union[np.ndarray, None]
+    """Grashof number :math:`[-]`"""
+    Ra: Union[np.ndarray, None]
+    """Rayleigh number :math:`[-]`, i.e., :math:`Gr \\cdot Pr`"""
+    Ri: Union[np.ndarray, None]
+    """Richardson number :math:`[-]`, i.e., :math:`Gr / Re^2`"""
+
+
+def dimensionless_groups(metal: Type[LiquidMetalInterface],
+                         T: Union[float, np.ndarray],
+                         velocity: Union[float, np.ndarray],
+                         length: Union[float, np.ndarray],
+                         delta_T: Union[float, np.ndarray, None] = None,
+                         buoyancy_length: Union[float, np.ndarray,
+                                                None] = None,
+                         p: Union[float, np.ndarray] = atm,
+                         correlations: Union[Dict[str, str], None] = None
+                         ) -> DimensionlessGroups:
+    """
+    Computes the dimensionless groups of the liquid metal flow. The
+    properties they depend on, i.e., density, dynamic viscosity, specific
+    heat capacity, thermal conductivity and thermal expansion
+    coefficient, are evaluated once per element by a single batch call.
+    All the arguments are broadcast against each other.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    velocity : float | np.ndarray
+        Flow velocity in :math:`[m/s]`
+    length : float | np.ndarray
+        Characteristic length of the flow, e.g., the hydraulic diameter,
+        in :math:`[m]`
+    delta_T : float | np.ndarray | None, optional
+        Temperature difference driving buoyancy in :math:`[K]`; if `None`,
+        the groups depending on buoyancy are not computed.
+        By default, `None`
+    buoyancy_length : float | np.ndarray | None, optional
+        Characteristic length of buoyancy in :math:`[m]`; if `None`,
+        `length` is adopted. By default, `None`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    DimensionlessGroups
+    """
+    values = batch.evaluate(metal, PROPERTIES, T, p, correlations)
+    return groups_from_properties(values, velocity, length, delta_T,
+                                  buoyancy_length)
+
+
+def groups_from_properties(values: Dict[str, np.ndarray],
+                           velocity: Union[float, np.ndarray],
+                           length: Union[float, np.ndarray],
+                           delta_T: Union[float, np.ndarray, None] = None,
+                           buoyancy_length: Union[float, np.ndarray,
+                                                  None] = None
+                           ) -> DimensionlessGroups:
+    """
+    Computes the dimensionless groups from already evaluated properties.
+
+    Parameters
+    ----------
+    values : Dict[str, np.ndarray]
+        values of 'rho', 'mu', 'cp' and 'k' properties, together with
+        'alpha' if `delta_T` is provided, e.g., as returned by
+        :func:`lbh15.batch.evaluate`
+    velocity : float | np.ndarray
+        Flow velocity in :math:`[m/s]`
+    length : float | np.ndarray
+        Characteristic length of the flow in :math:`[m]`
+    delta_T : float | np.ndarray | None, optional
+        Temperature difference driving buoyancy in :math:`[K]`,
+        by default `None`
+    buoyancy_length : float | np.ndarray | None, optional
+        Characteristic length of buoyancy in :math:`[m]`, by default `None`
+
+    Returns
+    -------
+    DimensionlessGroups
+    """
+    rho, mu = values['rho'], values['mu']
+    nu = mu / rho
+    Re = np.abs(velocity) * length / nu
+    Pr = values['cp'] * mu / values['k']
+    Pe = Re * Pr
+    if delta_T is None:
+        return DimensionlessGroups(Re, Pr, Pe, None, None, None)
+    if buoyancy_length is None:
+        buoyancy_length = length
+    Gr = g * values['alpha'] * np.abs(delta_T) \
+        * np.power(buoyancy_length, 3) / nu / nu
+    with np.errstate(divide='ignore'):
+        Ri = Gr / Re / Re
+    return DimensionlessGroups(Re, Pr, Pe, Gr, Gr * Pr, Ri)
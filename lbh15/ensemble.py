@@ -0,0 +1,80 @@
+"""Module with the functions evaluating all the available correlations
+of a property over arrays of temperature values, together with the
+envelopes of the obtained values."""
+from typing import List
+from typing import NamedTuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+
+class Ensemble(NamedTuple):
+    """
+    Values of all the correlations of a property. Arrays of values and
+    masks have one row per correlation; the remaining axes follow the
+    shape of the temperature array. Envelopes have the shape of the
+    temperature array and are `nan` where no correlation is considered.
+    """
+    correlations: List[str]
+    """Names of the correlations, in the order of the rows"""
+    values: np.ndarray
+    """Property values computed by each correlation"""
+    valid: np.ndarray
+    """`True` where the temperature belongs to the validity range
+    of the correlation"""
+    min: np.ndarray
+    """Minimum value among the considered correlations"""
+    max: np.ndarray
+    """Maximum value among the considered correlations"""
+    spread: np.ndarray
+    """Difference between the maximum and the minimum values"""
+
+
+def ensemble(metal: Type[LiquidMetalInterface], property_name: str,
+             T: Union[float, np.ndarray], p: Union[float, np.ndarray] = atm,
+             valid_only: bool = True) -> Ensemble:
+    """
+    Evaluates all the available correlations of the property over arrays
+    of temperature and pressure values, and computes the envelopes of the
+    obtained values.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    property_name : str
+        name of the property, e.g., 'o_pp'
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    valid_only : bool, optional
+        `True` for computing the envelopes considering only the
+        correlations whose validity range contains the temperature,
+        `False` for considering all of them. By default, `True`
+
+    Returns
+    -------
+    Ensemble
+    """
+    objects = batch.property_correlations(metal, property_name)
+    T, p = batch.as_arrays(T, p)
+    batch.check_temperature(metal, T)
+    T_full = np.broadcast_to(T, np.broadcast_shapes(T.shape, p.shape))
+    values = np.stack([batch.apply(obj, T, p) for obj in objects.values()])
+    valid = np.stack([batch.in_range(obj, T_full)
+                      for obj in objects.values()])
+    considered = valid if valid_only else np.ones_like(valid)
+    any_considered = np.any(considered, axis=0)
+    lower = np.where(any_considered,
+                     np.min(np.where(considered, values, np.inf), axis=0),
+                     np.nan)
+    upper = np.where(any_considered,
+                     np.max(np.where(considered, values, -np.inf), axis=0),
+                     np.nan)
+    return Ensemble(list(objects), values, valid, lower, upper,
+                    upper - lower)
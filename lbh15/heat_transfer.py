@@ -0,0 +1,289 @@
+"""Module with the functions computing the heat transfer coefficients and
+the pressure drops of heavy liquid metal flows over arrays of
+temperature values and flow conditions, by means of the correlations
+commonly adopted for heavy liquid metals."""
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from .dimensionless import groups_from_properties
+from . import batch
+
+
+def _lyon(Pe: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Lyon correlation, circular pipe with uniform heat flux"""
+    return 7.0 + 0.025 * np.power(Pe, 0.8)
+
+
+def _seban_shimazaki(Pe: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Seban-Shimazaki correlation, circular pipe with uniform
+    wall temperature"""
+    return 5.0 + 0.025 * np.power(Pe, 0.8)
+
+
+def _ushakov(Pe: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Ushakov correlation, rod bundle with triangular lattice"""
+    return 7.55 * x - 20 * np.power(x, -13) \
+        + 3.67 / 90 / x / x * np.power(Pe, 0.56 + 0.19 * x)
+
+
+def _mikityuk(Pe: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Mikityuk correlation, rod bundle with triangular lattice"""
+    return 0.047 * (1 - np.exp(-3.8 * (x - 1))) \
+        * (np.power(Pe, 0.77) + 250)
+
+
+# Nusselt number correlations: function of Péclet number and
+# pitch-to-diameter ratio, validity range in Péclet number and
+# validity range in pitch-to-diameter ratio (None for pipes)
+NUSSELT_CORRELATIONS: Dict[str, Tuple[Callable, Tuple[float, float],
+                                      Union[Tuple[float, float], None]]] = {
+    'lyon': (_lyon, (100.0, 1e4), None),
+    'seban_shimazaki': (_seban_shimazaki, (100.0, 1e4), None),
+    'ushakov': (_ushakov, (1.0, 4000.0), (1.3, 2.0)),
+    'mikityuk': (_mikityuk, (30.0, 5000.0), (1.1, 1.95)),
+}
+
+
+def _laminar(Re: np.ndarray, eps: np.ndarray) -> np.ndarray:
+    """Hagen-Poiseuille friction factor, laminar flow"""
+    return 64 / Re
+
+
+def _blasius(Re: np.ndarray, eps: np.ndarray) -> np.ndarray:
+    """Blasius friction factor, turbulent flow in smooth pipes"""
+    return 0.316 * np.power(Re, -0.25)
+
+
+def _mcadams(Re: np.ndarray, eps: np.ndarray) -> np.ndarray:
+    """McAdams friction factor, turbulent flow in smooth pipes"""
+    return 0.184 * np.power(Re, -0.2)
+
+
+def _haaland(Re: np.ndarray, eps: np.ndarray) -> np.ndarray:
+    """Haaland friction factor, turbulent flow in rough pipes"""
+    inv_sqrt = -1.8 * np.log10(np.power(eps / 3.7, 1.11) + 6.9 / Re)
+    return 1 / inv_sqrt / inv_sqrt
+
+
+# Darcy friction factor correlations: function of Reynolds number and
+# relative roughness, and validity range in Reynolds number
+FRICTION_CORRELATIONS: Dict[str, Tuple[Callable, Tuple[float, float]]] = {
+    'laminar': (_laminar, (0.0, 2300.0)),
+    'blasius': (_blasius, (4e3, 1e5)),
+    'mcadams': (_mcadams, (3e4, 1e6)),
+    'haaland': (_haaland, (4e3, 1e8)),
+}
+
+
+class HeatTransfer(NamedTuple):
+    """
+    Heat transfer quantities evaluated element-wise.
+    """
+    Nu: np.ndarray
+    """Nusselt number :math:`[-]`"""
+    htc: np.ndarray
+    """Heat transfer coefficient :math:`[W/(m^2 \\cdot K)]`"""
+    Pe: np.ndarray
+    """Péclet number :math:`[-]`"""
+    valid: np.ndarray
+    """`True` where both Péclet number and pitch-to-diameter ratio
+    belong to the validity ranges of the correlation"""
+
+
+class PressureDrop(NamedTuple):
+    """
+    Pressure drop quantities evaluated element-wise.
+    """
+    f: np.ndarray
+    """Darcy friction factor :math:`[-]`"""
+    dp: np.ndarray
+    """Frictional pressure drop :math:`[Pa]`"""
+    Re: np.ndarray
+    """Reynolds number :math:`[-]`"""
+    valid: np.ndarray
+    """`True` where Reynolds number belongs to the validity range
+    of the correlation"""
+
+
+def nusselt(Pe: Union[float, np.ndarray], correlation: str = 'lyon',
+            pitch_to_diameter: Union[float, np.ndarray, None] = None
+            ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Nusselt number from the Péclet number.
+
+    Parameters
+    ----------
+    Pe : float | np.ndarray
+        Péclet number :math:`[-]`
+    correlation : str, optional
+        name of the correlation, i.e., one of 'lyon', 'seban_shimazaki'
+        (circular pipes), 'ushakov' and 'mikityuk' (rod bundles).
+        By default, 'lyon'
+    pitch_to_diameter : float | np.ndarray | None, optional
+        pitch-to-diameter ratio of the rod bundle, mandatory for the rod
+        bundle correlations. By default, `None`
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Nusselt number and validity mask
+    """
+    if correlation not in NUSSELT_CORRELATIONS:
+        raise ValueError("Nusselt number correlation must be one of "
+                         f"{list(NUSSELT_CORRELATIONS)}, "
+                         f"'{correlation}' was provided")
+    function, pe_range, x_range = NUSSELT_CORRELATIONS[correlation]
+    Pe = np.asarray(Pe, dtype=float)
+    valid = (Pe >= pe_range[0]) & (Pe <= pe_range[1])
+    if x_range is None:
+        x = np.ones_like(Pe)
+    else:
+        if pitch_to_diameter is None:
+            raise ValueError("Pitch-to-diameter ratio is needed by "
+                             f"'{correlation}' correlation")
+        x = np.asarray(pitch_to_diameter, dtype=float)
+        valid = valid & (x >= x_range[0]) & (x <= x_range[1])
+    value = function(Pe, x)
+    return value, np.broadcast_to(valid, value.shape).copy()
+
+
+def friction_factor(Re: Union[float, np.ndarray],
+                    correlation: str = 'blasius',
+                    relative_roughness: Union[float, np.ndarray] = 0.0
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Darcy friction factor from the Reynolds number.
+
+    Parameters
+    ----------
+    Re : float | np.ndarray
+        Reynolds number :math:`[-]`
+    correlation : str, optional
+        name of the correlation, i.e., one of 'laminar', 'blasius',
+        'mcadams' and 'haaland'. By default, 'blasius'
+    relative_roughness : float | np.ndarray, optional
+        wall roughness divided by the hydraulic diameter, used by the
+        'haaland' correlation only. By default, `0.0`
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Darcy friction factor and validity mask
+    """
+    if correlation not in FRICTION_CORRELATIONS:
+        raise ValueError("Friction factor correlation must be one of "
+                         f"{list(FRICTION_CORRELATIONS)}, "
+                         f"'{correlation}' was provided")
+    function, re_range = FRICTION_CORRELATIONS[correlation]
+    Re = np.asarray(Re, dtype=float)
+    value = function(Re, np.asarray(relative_roughness, dtype=float))
+    valid = (Re >= re_range[0]) & (Re <= re_range[1])
+    return value, np.broadcast_to(valid, value.shape).copy()
+
+
+def heat_transfer(metal: Type[LiquidMetalInterface],
+                  T: Union[float, np.ndarray],
+                  velocity: Union[float, np.ndarray],
+                  diameter: Union[float, np.ndarray],
+                  correlation: str = 'lyon',
+                  pitch_to_diameter: Union[float, np.ndarray, None] = None,
+                  p: Union[float, np.ndarray] = atm,
+                  correlations: Union[Dict[str, str], None] = None
+                  ) -> HeatTransfer:
+    """
+    Computes the Nusselt number and the heat transfer coefficient of the
+    liquid metal flow. The needed properties are evaluated once per
+    element by a single batch call. All the arguments are broadcast
+    against each other.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    velocity : float | np.ndarray
+        Flow velocity in :math:`[m/s]`
+    diameter : float | np.ndarray
+        Hydraulic diameter in :math:`[m]`
+    correlation : str, optional
+        name of the Nusselt number correlation, see :func:`nusselt`.
+        By default, 'lyon'
+    pitch_to_diameter : float | np.ndarray | None, optional
+        pitch-to-diameter ratio of the rod bundle, by default `None`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    HeatTransfer
+    """
+    values = batch.evaluate(metal, ['rho', 'mu', 'cp', 'k'], T, p,
+                            correlations)
+    groups = groups_from_properties(values, velocity, diameter)
+    Nu, valid = nusselt(groups.Pe, correlation, pitch_to_diameter)
+    return HeatTransfer(Nu, Nu * values['k'] / diameter, groups.Pe, valid)
+
+
+def pressure_drop(metal: Type[LiquidMetalInterface],
+                  T: Union[float, np.ndarray],
+                  velocity: Union[float, np.ndarray],
+                  diameter: Union[float, np.ndarray],
+                  length: Union[float, np.ndarray],
+                  correlation: str = 'blasius',
+                  roughness: Union[float, np.ndarray] = 0.0,
+                  p: Union[float, np.ndarray] = atm,
+                  correlations: Union[Dict[str, str], None] = None
+                  ) -> PressureDrop:
+    """
+    Computes the Darcy friction factor and the frictional pressure drop
+    :math:`\\Delta p = f \\cdot L / D \\cdot \\rho v^2 / 2` of the
+    liquid metal flow. The needed properties are evaluated once per
+    element by a single batch call. All the arguments are broadcast
+    against each other.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    velocity : float | np.ndarray
+        Flow velocity in :math:`[m/s]`
+    diameter : float | np.ndarray
+        Hydraulic diameter in :math:`[m]`
+    length : float | np.ndarray
+        Length of the channel in :math:`[m]`
+    correlation : str, optional
+        name of the friction factor correlation, see
+        :func:`friction_factor`. By default, 'blasius'
+    roughness : float | np.ndarray, optional
+        wall roughness in :math:`[m]`, by default `0.0`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    PressureDrop
+    """
+    values = batch.evaluate(metal, ['rho', 'mu'], T, p, correlations)
+    rho = values['rho']
+    Re = rho * np.abs(velocity) * diameter / values['mu']
+    f, valid = friction_factor(Re, correlation,
+                               np.asarray(roughness) / diameter)
+    dp = f * length / diameter * rho * velocity * np.abs(velocity) / 2
+    return PressureDrop(f, dp, Re, valid)
@@ -36,6 +36,12 @@ class Lead(LiquidMetalInterface):
         - **u_s** (float) : speed of sound :math:`[m/s]`
         - **beta_s** (float) : isentropic compressibility :math:`[1/Pa]`
         - **cp** (float) : specific heat capacity :math:`[J/(kg \\cdot K)]`
+        - **cv** (float) : isochoric specific heat capacity \
+            :math:`[J/(kg \\cdot K)]`
+        - **beta_T** (float) : isothermal compressibility :math:`[1/Pa]`
+        - **gamma_G** (float) : Gruneisen parameter :math:`[-]`
+        - **rho_cp** (float) : volumetric heat capacity \
+            :math:`[J/(m^3 \\cdot K)]`
         - **h** (float) : specific enthalpy \
             (with respect to melting point) :math:`[J/kg]`
         - **mu** (float) : dynamic viscosity :math:`[Pa \\cdot s]`
@@ -90,7 +96,9 @@ class Lead(LiquidMetalInterface):
     144.660062
     """
     _default_corr_to_use: Dict[str, str] = \
-        {'cp': 'sobolev2011', 'cr_sol': "gosse2014",
+        {'cp': 'sobolev2011', 'cv': 'sobolev2011', 'beta_T': 'sobolev2011',
+         'gamma_G': 'sobolev2011', 'rho_cp': 'sobolev2011',
+         'cr_sol': "gosse2014",
          'o_pp': "alcock1964", 'o_dif': "gromov1996",
          'lim_cr': "gosse2014"}
     _correlations_to_use: Dict[str, str] = copy.deepcopy(_default_corr_to_use)
@@ -103,7 +111,8 @@ class Lead(LiquidMetalInterface):
          'lbh15.properties.lead_thermochemical_properties.diffusivity_in_lead',
          'lbh15.properties.lead_thermochemical_properties.lead_thermochemical',
          'lbh15.properties.lead_thermochemical_properties.lead_oxygen_limits',
-         'lbh15.properties.lead_properties']
+         'lbh15.properties.lead_properties',
+         'lbh15.properties.lead_derived_properties']
 
     def __init__(self, p: float = atm, **kwargs):
         self._guess = LEAD_BOILING_TEMPERATURE / 2.0
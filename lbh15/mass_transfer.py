@@ -0,0 +1,229 @@
+"""Module with the functions estimating the mass transfer of oxygen and of
+the corrosion products between the structural walls and heavy liquid metal
+flows over the temperature profile of a loop, by means of the Sherwood
+number correlations commonly adopted for liquid metal corrosion. The
+properties of all the species are evaluated by a single batch call."""
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+# Species whose mass transfer can be estimated: the solubility and the
+# diffusivity are the '<species>_sol' and '<species>_dif' properties
+SPECIES = ('fe', 'cr', 'ni', 'o')
+
+
+def _berger_hau(Re: np.ndarray, Sc: np.ndarray) -> np.ndarray:
+    """Berger-Hau correlation, turbulent flow in circular pipes"""
+    return 0.0165 * np.power(Re, 0.86) * np.power(Sc, 0.33)
+
+
+def _harriott_hamilton(Re: np.ndarray, Sc: np.ndarray) -> np.ndarray:
+    """Harriott-Hamilton correlation, turbulent flow in circular pipes"""
+    return 0.0096 * np.power(Re, 0.913) * np.power(Sc, 0.346)
+
+
+def _linton_sherwood(Re: np.ndarray, Sc: np.ndarray) -> np.ndarray:
+    """Linton-Sherwood correlation, turbulent flow in circular pipes"""
+    return 0.023 * np.power(Re, 0.83) * np.cbrt(Sc)
+
+
+# Sherwood number correlations: function of Reynolds and Schmidt numbers,
+# validity range in Reynolds number and validity range in Schmidt number
+SHERWOOD_CORRELATIONS: Dict[str, Tuple[Callable, Tuple[float, float],
+                                       Tuple[float, float]]] = {
+    'berger_hau': (_berger_hau, (8e3, 2e5), (1e3, 6e3)),
+    'harriott_hamilton': (_harriott_hamilton, (1e4, 4e5), (430.0, 1e5)),
+    'linton_sherwood': (_linton_sherwood, (4e3, 7e4), (1e3, 2.3e3)),
+}
+
+
+class MassTransfer(NamedTuple):
+    """
+    Mass transfer quantities evaluated element-wise, keyed by species.
+    """
+    Re: np.ndarray
+    """Reynolds number :math:`[-]`"""
+    Sc: Dict[str, np.ndarray]
+    """Schmidt number :math:`[-]`"""
+    Sh: Dict[str, np.ndarray]
+    """Sherwood number :math:`[-]`"""
+    K: Dict[str, np.ndarray]
+    """Mass transfer coefficient :math:`[m/s]`"""
+    C_sat: Dict[str, np.ndarray]
+    """Solubility, i.e., concentration at the wall, :math:`[wt.\\%]`"""
+    C_bulk: Dict[str, np.ndarray]
+    """Concentration in the bulk of the flow :math:`[wt.\\%]`"""
+    flux: Dict[str, np.ndarray]
+    """Mass flux potential :math:`[kg/(m^2 \\cdot s)]`, positive where the
+    species dissolves from the walls into the flow and negative where it
+    deposits onto the walls"""
+    valid: Dict[str, np.ndarray]
+    """`True` where the temperature belongs to the validity ranges of the
+    solubility and diffusivity correlations, and Reynolds and Schmidt
+    numbers to the ones of the Sherwood number correlation"""
+    property_valid: Dict[str, np.ndarray]
+    """`True` where the temperature belongs to the validity range of the
+    property correlation, keyed by property name"""
+
+
+def sherwood(Re: Union[float, np.ndarray], Sc: Union[float, np.ndarray],
+             correlation: str = 'berger_hau'
+             ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Sherwood number from the Reynolds and Schmidt numbers.
+
+    Parameters
+    ----------
+    Re : float | np.ndarray
+        Reynolds number :math:`[-]`
+    Sc : float | np.ndarray
+        Schmidt number :math:`[-]`
+    correlation : str, optional
+        name of the correlation, i.e., one of 'berger_hau',
+        'harriott_hamilton' and 'linton_sherwood'. By default,
+        'berger_hau'
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Sherwood number and validity mask
+    """
+    if correlation not in SHERWOOD_CORRELATIONS:
+        raise ValueError("Sherwood number correlation must be one of "
+                         f"{list(SHERWOOD_CORRELATIONS)}, "
+                         f"'{correlation}' was provided")
+    function, re_range, sc_range = SHERWOOD_CORRELATIONS[correlation]
+    Re = np.asarray(Re, dtype=float)
+    Sc = np.asarray(Sc, dtype=float)
+    value = function(Re, Sc)
+    valid = (Re >= re_range[0]) & (Re <= re_range[1]) \
+        & (Sc >= sc_range[0]) & (Sc <= sc_range[1])
+    return value, np.broadcast_to(valid, value.shape).copy()
+
+
+def mass_transfer(metal: Type[LiquidMetalInterface],
+                  T: Union[float, np.ndarray],
+                  velocity: Union[float, np.ndarray],
+                  diameter: Union[float, np.ndarray],
+                  species: Union[List[str], None] = None,
+                  concentration: Union[Dict[str, Union[float, np.ndarray]],
+                                       None] = None,
+                  area: Union[float, np.ndarray] = 1.0,
+                  correlation: str = 'berger_hau',
+                  diffusivities: Union[Dict[str, Union[float, np.ndarray]],
+                                       None] = None,
+                  p: Union[float, np.ndarray] = atm,
+                  correlations: Union[Dict[str, str], None] = None
+                  ) -> MassTransfer:
+    """
+    Computes the mass transfer coefficients :math:`K = Sh \\cdot D / d`
+    and the mass flux potentials
+    :math:`J = K \\cdot \\rho \\cdot (C_{sat} - C_{bulk}) / 100` of the
+    species over the nodes of a loop. Density, dynamic viscosity,
+    solubilities and diffusivities of all the species are evaluated once
+    per node by a single batch call. All the arguments are broadcast
+    against each other.
+
+    If the bulk concentration of a species is not provided, the one
+    giving no net mass transfer over the loop is adopted, i.e., the
+    average of the solubility weighted by the mass transfer coefficient,
+    by the density and by the wetted area of the nodes: the species then
+    dissolves in the hot part of the loop and deposits in the cold one.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    velocity : float | np.ndarray
+        Flow velocity in :math:`[m/s]`
+    diameter : float | np.ndarray
+        Hydraulic diameter in :math:`[m]`
+    species : List[str] | None, optional
+        species among :data:`SPECIES`; if `None`, all the species whose
+        solubility and diffusivity are available. By default, `None`
+    concentration : Dict[str, float | np.ndarray] | None, optional
+        bulk concentration in :math:`[wt.\\%]` keyed by species, by
+        default `None`
+    area : float | np.ndarray, optional
+        wetted area of the nodes in :math:`[m^2]`, weighting the
+        no net mass transfer balance only. By default, `1.0`
+    correlation : str, optional
+        name of the Sherwood number correlation, see :func:`sherwood`.
+        By default, 'berger_hau'
+    diffusivities : Dict[str, float | np.ndarray] | None, optional
+        diffusivity in :math:`[m^2/s]` keyed by species, replacing the
+        diffusivity correlation, mandatory for the species whose
+        diffusivity is not available. By default, `None`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    MassTransfer
+    """
+    if concentration is None:
+        concentration = {}
+    if diffusivities is None:
+        diffusivities = {}
+    available = batch.property_objects(metal, None, correlations)
+    if species is None:
+        species = [name for name in SPECIES
+                   if f"{name}_sol" in available
+                   and (f"{name}_dif" in available or name in diffusivities)]
+    properties = ['rho', 'mu']
+    for name in species:
+        if name not in SPECIES:
+            raise ValueError(f"Species must be among {SPECIES}, "
+                             f"'{name}' was provided")
+        if f"{name}_sol" not in available:
+            raise ValueError(f"Solubility of '{name}' not found for "
+                             f"{metal.__name__}")
+        properties.append(f"{name}_sol")
+        if name not in diffusivities:
+            if f"{name}_dif" not in available:
+                raise ValueError(f"Diffusivity of '{name}' not found for "
+                                 f"{metal.__name__}, it must be provided")
+            properties.append(f"{name}_dif")
+    values = batch.evaluate(metal, properties, T, p, correlations)
+    property_valid = batch.validity(metal, properties[2:], T, correlations)
+    rho = values['rho']
+    nu = values['mu'] / rho
+    Re = np.abs(velocity) * diameter / nu
+    result = MassTransfer(Re, {}, {}, {}, {}, {}, {}, {}, property_valid)
+    for name in species:
+        D = diffusivities[name] if name in diffusivities \
+            else values[f"{name}_dif"]
+        Sc = nu / D
+        Sh, valid = sherwood(Re, Sc, correlation)
+        K = Sh * D / diameter
+        C_sat = values[f"{name}_sol"]
+        if name in concentration:
+            C_bulk = np.asarray(concentration[name], dtype=float)
+        else:
+            weights = np.broadcast_to(K * rho * area, C_sat.shape)
+            C_bulk = np.asarray(np.sum(weights * C_sat) / np.sum(weights))
+        valid &= property_valid[f"{name}_sol"]
+        if name not in diffusivities:
+            valid &= property_valid[f"{name}_dif"]
+        result.Sc[name] = Sc
+        result.Sh[name] = Sh
+        result.K[name] = K
+        result.C_sat[name] = C_sat
+        result.C_bulk[name] = C_bulk
+        result.flux[name] = K * rho * (C_sat - C_bulk) / 100
+        result.valid[name] = valid
+    return result
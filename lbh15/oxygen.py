@@ -0,0 +1,274 @@
+"""Module with the functions computing the Oxygen concentration window
+the protective oxide layer formation is assured within, evaluated over
+arrays of temperature values, and converting the signals of Oxygen
+sensors into Oxygen concentration."""
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from scipy.constants import R
+from scipy.constants import physical_constants
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+# Exponent of the impurity concentration each lower limit
+# of Oxygen concentration is multiplied by
+IMPURITY_EXPONENTS: Dict[str, float] = {'lim_fe': 3 / 4, 'lim_cr': 2 / 3,
+                                        'lim_ni': 1.0, 'lim_si': 1 / 2}
+
+# Faraday constant in [C/mol]
+_F = physical_constants['Faraday constant'][0]
+
+
+class OxygenWindow(NamedTuple):
+    """
+    Oxygen concentration window evaluated element-wise. All the
+    concentrations are expressed in :math:`[wt.\\%]`.
+    """
+    upper: np.ndarray
+    """Upper limit of Oxygen concentration, i.e., Oxygen solubility"""
+    lower: np.ndarray
+    """Lower limit of Oxygen concentration"""
+    setpoint: np.ndarray
+    """Oxygen concentration set-point"""
+    valid: np.ndarray
+    """`True` where the temperature belongs to the validity range of
+    all the adopted correlations"""
+
+
+def oxygen_window(metal: Type[LiquidMetalInterface],
+                  T: Union[float, np.ndarray],
+                  p: Union[float, np.ndarray] = atm,
+                  lower_limit: str = 'lim_fe_sat',
+                  concentration: Union[float, np.ndarray, None] = None,
+                  setpoint: Union[str, float] = 'arithmetic',
+                  correlations: Union[Dict[str, str], None] = None
+                  ) -> OxygenWindow:
+    """
+    Computes the Oxygen concentration window over arrays of temperature
+    values. The upper limit is given by the Oxygen solubility (`o_sol`),
+    while the lower limit is given by the chosen `lim_*_sat` property or,
+    for the `lim_*` properties, by the property value divided by the
+    impurity concentration raised to the corresponding exponent.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, i.e., :class:`.Lead` or :class:`.LBE`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    lower_limit : str, optional
+        name of the property providing the lower limit of Oxygen
+        concentration, by default 'lim_fe_sat'
+    concentration : float | np.ndarray | None, optional
+        impurity concentration in :math:`[wt.\\%]`, mandatory only if
+        `lower_limit` is one of the `lim_*` properties not considering
+        the impurity at saturation. By default, `None`
+    setpoint : str | float, optional
+        policy for computing the set-point: 'arithmetic' for the middle
+        value of the window, 'geometric' for the geometric mean of its
+        limits, or a float in :math:`[0, 1]` for the fraction of the
+        window width above the lower limit. By default, 'arithmetic'
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+
+    Returns
+    -------
+    OxygenWindow
+    """
+    names = ['o_sol', lower_limit]
+    values = batch.evaluate(metal, names, T, p, correlations)
+    masks = batch.validity(metal, names, T, correlations)
+    return _window(values, masks, lower_limit, concentration, setpoint)
+
+
+class SensorReading(NamedTuple):
+    """
+    Oxygen sensor signals converted element-wise, see
+    :func:`sensor_stream`.
+    """
+    T: np.ndarray
+    """Temperature in :math:`[K]`"""
+    p_O2: np.ndarray
+    """Oxygen partial pressure in :math:`[Pa]`"""
+    concentration: np.ndarray
+    """Oxygen concentration in :math:`[wt.\\%]`"""
+    position: np.ndarray
+    """Position of the Oxygen concentration inside the window, i.e.,
+    `0` at the lower limit and `1` at the upper one, being negative
+    below the window and larger than `1` above it, on either the linear
+    or the logarithmic scale"""
+    valid: np.ndarray
+    """`True` where the temperature belongs to the validity range of
+    all the adopted correlations"""
+
+
+def sensor_stream(metal: Type[LiquidMetalInterface],
+                  chunks: Iterable[Tuple[Union[float, np.ndarray],
+                                         Union[float, np.ndarray]]],
+                  signal: str = 'p_O2',
+                  reference: Union[float, Callable[[np.ndarray], np.ndarray],
+                                   None] = None,
+                  p: Union[float, np.ndarray] = atm,
+                  lower_limit: str = 'lim_fe_sat',
+                  concentration: Union[float, np.ndarray, None] = None,
+                  scale: str = 'log',
+                  correlations: Union[Dict[str, str], None] = None,
+                  invalid: str = 'nan') -> Iterator[SensorReading]:
+    """
+    Converts chunks of Oxygen sensor signals into Oxygen concentration
+    and position inside the Oxygen concentration window, one chunk at a
+    time, so that memory stays bounded whatever the length of the time
+    series. Each chunk is converted by vectorized operations, with the
+    properties evaluated by a single batch call. By default, samples
+    whose temperature is outside the liquid range, e.g., because of a
+    sensor dropout, are converted into `numpy.nan` values flagged as not
+    valid, so that the stream goes on.
+
+    The Oxygen partial pressure is either the signal itself, or it is
+    obtained from the electromotive force :math:`E` of a potentiometric
+    sensor by the Nernst equation, i.e.,
+    :math:`p_{O_2} = p_{O_2,ref} \\exp\\left(-4 F E / (R T)\\right)`.
+    The Oxygen concentration then follows from Sieverts' law, i.e.,
+    :math:`C_O = \\sqrt{p_{O_2} / o\\_pp(T)}`, and its position
+    inside the window from the limits computed as done by
+    :func:`oxygen_window`.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, i.e., :class:`.Lead` or :class:`.LBE`
+    chunks : Iterable[Tuple[float | np.ndarray, float | np.ndarray]]
+        chunks of temperature in :math:`[K]` and of sensor signal,
+        broadcastable against each other
+    signal : str, optional
+        kind of sensor signal: 'p_O2' for the Oxygen partial pressure in
+        :math:`[Pa]`, 'emf' for the electromotive force in :math:`[V]`.
+        By default, 'p_O2'
+    reference : float | Callable | None, optional
+        Oxygen partial pressure of the sensor reference in
+        :math:`[Pa]`, either a value or a function of the temperature,
+        mandatory for the 'emf' signal only. By default, `None`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    lower_limit : str, optional
+        name of the property providing the lower limit of Oxygen
+        concentration, see :func:`oxygen_window`. By default,
+        'lim_fe_sat'
+    concentration : float | np.ndarray | None, optional
+        impurity concentration in :math:`[wt.\\%]`, see
+        :func:`oxygen_window`. By default, `None`
+    scale : str, optional
+        scale of the position inside the window, either 'linear' or
+        'log', the latter being suited to windows spanning several
+        orders of magnitude. By default, 'log'
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    invalid : str, optional
+        policy adopted for the temperature values outside the liquid
+        range, see :func:`lbh15.batch.evaluate`: 'raise' to raise an
+        error, stopping the stream, 'nan' to set the converted values to
+        `numpy.nan`, 'clip' to evaluate the properties at the nearest
+        bound of the range. Such values are never valid. By default,
+        'nan'
+
+    Yields
+    ------
+    SensorReading
+        converted signals of each chunk
+    """
+    if signal not in ('p_O2', 'emf'):
+        raise ValueError("Signal must be either 'p_O2' or 'emf', "
+                         f"'{signal}' was provided")
+    if signal == 'emf' and reference is None:
+        raise ValueError("Reference Oxygen partial pressure is needed by "
+                         "'emf' signal")
+    if lower_limit in IMPURITY_EXPONENTS and concentration is None:
+        raise ValueError("Impurity concentration is needed by "
+                         f"'{lower_limit}' lower limit")
+    if scale not in ('linear', 'log'):
+        raise ValueError("Scale must be either 'linear' or 'log', "
+                         f"'{scale}' was provided")
+    if invalid not in ('raise', 'nan', 'clip'):
+        raise ValueError("Policy must be one of 'raise', 'nan' and "
+                         f"'clip', '{invalid}' was provided")
+    names = ['o_pp', 'o_sol', lower_limit]
+    objects = batch.property_objects(metal, names, correlations)
+    correlations = {name: obj.correlation_name
+                    for name, obj in objects.items()}
+    T_m0, T_b0 = batch.liquid_range(metal)
+    for T, value in chunks:
+        T, value = np.broadcast_arrays(np.asarray(T, dtype=float),
+                                       np.asarray(value, dtype=float))
+        values = batch.evaluate(metal, names, T, p, correlations,
+                                invalid=invalid)
+        masks = {name: batch.in_range(obj, T) & (T > T_m0) & (T < T_b0)
+                 for name, obj in objects.items()}
+        # Samples outside the liquid range provide nan values
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if signal == 'emf':
+                p_ref = reference(T) if callable(reference) else reference
+                p_O2 = p_ref * np.exp(-4 * _F / R * value / T)
+            else:
+                p_O2 = value
+            C_O = np.sqrt(p_O2 / values['o_pp'])
+            window = _window(values, masks, lower_limit, concentration)
+            if scale == 'log':
+                position = np.log(C_O / window.lower) \
+                    / np.log(window.upper / window.lower)
+            else:
+                position = (C_O - window.lower) \
+                    / (window.upper - window.lower)
+        yield SensorReading(T, p_O2, C_O, position,
+                            window.valid & masks['o_pp'])
+
+
+def _window(values: Dict[str, np.ndarray], masks: Dict[str, np.ndarray],
+            lower_limit: str,
+            concentration: Union[float, np.ndarray, None],
+            setpoint: Union[str, float] = 'arithmetic') -> OxygenWindow:
+    """
+    Computes the Oxygen concentration window from the values and the
+    validity masks of the Oxygen solubility and of the lower limit.
+    """
+    upper = values['o_sol']
+    lower = values[lower_limit]
+    if lower_limit in IMPURITY_EXPONENTS:
+        if concentration is None:
+            raise ValueError("Impurity concentration is needed by "
+                             f"'{lower_limit}' lower limit")
+        lower = lower / np.power(np.asarray(concentration, dtype=float),
+                                 IMPURITY_EXPONENTS[lower_limit])
+        upper = np.broadcast_to(upper, lower.shape).copy()
+    valid = np.broadcast_to(masks['o_sol'] & masks[lower_limit],
+                            upper.shape).copy()
+    return OxygenWindow(upper, lower, _setpoint(lower, upper, setpoint),
+                        valid)
+
+
+def _setpoint(lower: np.ndarray, upper: np.ndarray,
+              policy: Union[str, float]) -> np.ndarray:
+    """
+    Applies the set-point policy to the Oxygen concentration window.
+    """
+    if policy == 'arithmetic':
+        return (lower + upper) / 2
+    if policy == 'geometric':
+        return np.sqrt(lower * upper)
+    if isinstance(policy, str) or not 0 <= policy <= 1:
+        raise ValueError("Set-point policy must be either 'arithmetic', "
+                         "'geometric' or a float in [0, 1], "
+                         f"{policy} was provided")
+    return lower + policy * (upper - lower)
@@ -0,0 +1,210 @@
+"""Module with the opt-in instrumentation of the liquid metal property
+evaluations, i.e., the statistics collected on correlation calls,
+temperature computations and property registry builds."""
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+from typing import Union
+from .properties.interface import PropertyInterface
+
+# Statistics being collected, if any. Instrumented code checks this
+# attribute only, so that the overhead is negligible when disabled
+_active: Union["Stats", None] = None
+
+
+class Stats:
+    """
+    Statistics collected while profiling is enabled.
+
+    Correlation statistics are keyed by `(module, property, correlation)`,
+    where `module` is the name of the module defining the property object,
+    e.g., 'lead_properties'. Solver statistics are keyed by
+    `(metal, property)`, i.e., by the liquid metal class name and by the
+    property the temperature is computed from. Registry builds are keyed
+    by the liquid metal class name.
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.correlation_calls: Dict[Tuple[str, str, str], int] = \
+            defaultdict(int)
+        """Number of calls of each correlation"""
+        self.correlation_time: Dict[Tuple[str, str, str], float] = \
+            defaultdict(float)
+        """Cumulative time spent in each correlation in :math:`[s]`"""
+        self.correlation_elements: Dict[Tuple[str, str, str], int] = \
+            defaultdict(int)
+        """Number of elements each correlation was evaluated on"""
+        self.solver_calls: Dict[Tuple[str, str], int] = defaultdict(int)
+        """Number of temperature computations"""
+        self.solver_evaluations: Dict[Tuple[str, str], int] = \
+            defaultdict(int)
+        """Number of correlation evaluations performed by the solvers,
+        i.e., by the root finder, by the Newton iterations and by the
+        bisection, the derivative evaluations excluded"""
+        self.solver_failures: Dict[Tuple[str, str], int] = defaultdict(int)
+        """Number of temperature computations the solver did not
+        report convergence of"""
+        self.registry_builds: Dict[str, int] = defaultdict(int)
+        """Number of builds of the available properties registry"""
+
+    def record_call(self, property_object: PropertyInterface,
+                    elapsed: float, elements: int = 1) -> None:
+        """
+        Records a call of a property correlation.
+
+        Parameters
+        ----------
+        property_object : PropertyInterface
+            property object whose correlation was called
+        elapsed : float
+            time spent in the call in :math:`[s]`
+        elements : int, optional
+            number of elements the correlation was evaluated on,
+            by default `1`
+        """
+        key = (type(property_object).__module__.rsplit('.', 1)[-1],
+               property_object.name, property_object.correlation_name)
+        with self.__lock:
+            self.correlation_calls[key] += 1
+            self.correlation_time[key] += elapsed
+            self.correlation_elements[key] += elements
+
+    def record_solver(self, metal: str, property_name: str,
+                      evaluations: int, failed: bool) -> None:
+        """
+        Records a temperature computation.
+
+        Parameters
+        ----------
+        metal : str
+            name of the liquid metal class
+        property_name : str
+            name of the property the temperature is computed from
+        evaluations : int
+            number of correlation evaluations performed by the solver
+        failed : bool
+            `True` if the solver did not report convergence
+        """
+        key = (metal, property_name)
+        with self.__lock:
+            self.solver_calls[key] += 1
+            self.solver_evaluations[key] += evaluations
+            self.solver_failures[key] += int(failed)
+
+    def record_registry_build(self, metal: str) -> None:
+        """
+        Records a build of the available properties registry.
+
+        Parameters
+        ----------
+        metal : str
+            name of the liquid metal class
+        """
+        with self.__lock:
+            self.registry_builds[metal] += 1
+
+    @property
+    def total_time(self) -> float:
+        """
+        float : total time spent in the correlations in :math:`[s]`
+        """
+        return sum(self.correlation_time.values())
+
+    def reset(self) -> None:
+        """
+        Clears all the collected statistics.
+        """
+        with self.__lock:
+            for stats in [self.correlation_calls, self.correlation_time,
+                          self.correlation_elements, self.solver_calls,
+                          self.solver_evaluations, self.solver_failures,
+                          self.registry_builds]:
+                stats.clear()
+
+    def summary(self) -> str:
+        """
+        Returns the collected statistics as a printable table, with the
+        correlations sorted by decreasing cumulative time.
+
+        Returns
+        -------
+        str
+        """
+        rvalue = "Correlations:\n"
+        for key in sorted(self.correlation_time,
+                          key=self.correlation_time.get, reverse=True):
+            rvalue += (f"\t{'.'.join(key)}: "
+                       f"{self.correlation_calls[key]} calls, "
+                       f"{self.correlation_elements[key]} elements, "
+                       f"{self.correlation_time[key]:.6f} [s]\n")
+        rvalue += "Temperature computations:\n"
+        for key, calls in self.solver_calls.items():
+            rvalue += (f"\t{'.'.join(key)}: {calls} calls, "
+                       f"{self.solver_evaluations[key]} evaluations, "
+                       f"{self.solver_failures[key]} failures\n")
+        rvalue += "Registry builds:\n"
+        for metal, builds in self.registry_builds.items():
+            rvalue += f"\t{metal}: {builds}\n"
+        return rvalue
+
+
+def enable(stats: Union[Stats, None] = None) -> Stats:
+    """
+    Enables profiling.
+
+    Parameters
+    ----------
+    stats : Stats | None, optional
+        object collecting the statistics; if `None`, a new one is
+        created. By default, `None`
+
+    Returns
+    -------
+    Stats
+        object collecting the statistics
+    """
+    global _active  # pylint: disable=global-statement
+    _active = stats if stats is not None else Stats()
+    return _active
+
+
+def disable() -> Union[Stats, None]:
+    """
+    Disables profiling.
+
+    Returns
+    -------
+    Stats | None
+        object that was collecting the statistics, if any
+    """
+    global _active  # pylint: disable=global-statement
+    stats, _active = _active, None
+    return stats
+
+
+@contextmanager
+def profile(stats: Union[Stats, None] = None) -> Iterator[Stats]:
+    """
+    Context manager enabling profiling within its scope. The previous
+    profiling state is restored at exit.
+
+    Parameters
+    ----------
+    stats : Stats | None, optional
+        object collecting the statistics; if `None`, a new one is
+        created. By default, `None`
+
+    Yields
+    ------
+    Stats
+        object collecting the statistics
+    """
+    global _active  # pylint: disable=global-statement
+    previous = _active
+    try:
+        yield enable(stats)
+    finally:
+        _active = previous
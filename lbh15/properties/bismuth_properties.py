@@ -4,6 +4,7 @@ from typing import List
 from typing import Union
 import numpy as np
 from scipy.constants import atm
+from scipy.special import expi
 from .tph_common_interface import SaturationVapourPressureInterface
 from .tph_common_interface import SurfaceTensionInterface
 from .tph_common_interface import DensityInterface
@@ -16,6 +17,7 @@ from .tph_common_interface import DynamicViscosityInterface
 from .tph_common_interface import ElectricalResistivityInterface
 from .tph_common_interface import ThermalConductivityInterface
 from .._decorators import range_warning
+from .._scratch import ScratchPool
 from .._commons import BISMUTH_MELTING_TEMPERATURE as T_m0
 from .._commons import BISMUTH_BOILING_TEMPERATURE as T_b0
 
@@ -72,6 +74,26 @@ class p_s(SaturationVapourPressureInterface):
             return 1200
         return 2000
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *saturation vapour pressure* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            saturation vapour pressure antiderivative in :math:`[Pa \\cdot K]`
+        """
+        return 2.67e10 * (T * np.exp(-22858/T) + 22858 * expi(-22858/T))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -138,6 +160,26 @@ class sigma(SurfaceTensionInterface):
         """
         return (420.8 - 0.081*T)*1e-3
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *surface tension* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            surface tension antiderivative in :math:`[N \\cdot K/m]`
+        """
+        return T * (420.8 - 0.0405*T) * 1e-3
+
     @property
     def correlation_name(self) -> str:
         """
@@ -187,6 +229,79 @@ class rho(DensityInterface):
             (1 / u_s_val / u_s_val
              + T * alpha_val * alpha_val / cp().correlation(T, p)) * (p - atm)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *density* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            density derivative in :math:`[kg/(m^3 \\cdot K)]`
+        """
+        u_s_val = u_s().correlation(T, p)
+        alpha_val = alpha().correlation(T, p)
+        cp_val = cp().correlation(T, p)
+        return -1.22 +\
+            (- 2 * u_s().derivative(T, p) / u_s_val / u_s_val / u_s_val
+             + alpha_val * alpha_val / cp_val
+             + 2 * T * alpha_val * alpha().derivative(T, p) / cp_val
+             - T * alpha_val * alpha_val * cp().derivative(T, p)
+             / cp_val / cp_val) * (p - atm)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *density* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -1.22, out=out)
+        out += 10725
+        if np.ndim(p) == 0 and p == atm:
+            return out
+        # Pressure-dependent term
+        u_s_val = u_s().correlation_into(T, p, pool.get(0, out), pool)
+        alpha_val = alpha().correlation_into(T, p, pool.get(1, out), pool)
+        cp_val = cp().correlation_into(
+            T, p, pool.get(2, out), pool.shifted(3))
+        alpha_val *= alpha_val
+        alpha_val *= T
+        alpha_val /= cp_val
+        u_s_val *= u_s_val
+        np.reciprocal(u_s_val, out=u_s_val)
+        u_s_val += alpha_val
+        np.subtract(p, atm, out=alpha_val)
+        u_s_val *= alpha_val
+        out += u_s_val
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -239,6 +354,77 @@ class alpha(ThermalExpansionInterface):
         """
         return 1/(8791 - T)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *thermal expansion coefficient*
+        with respect to the temperature by applying the analytic
+        expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient derivative
+            in :math:`[1/K^2]`
+        """
+        return 1 / (8791 - T) / (8791 - T)
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal expansion coefficient* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient antiderivative in :math:`[-]`
+        """
+        return -np.log(8791 - T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal expansion coefficient* into the
+        array passed as argument by applying the property correlation with
+        in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.subtract(8791, T, out=out)
+        np.reciprocal(out, out=out)
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -284,6 +470,77 @@ class u_s(SpeedOfSoundInterface):
         """
         return 1616 + T * (0.187 - 2.2e-4 * T)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *sound velocity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity derivative in :math:`[m/(s \\cdot K)]`
+        """
+        return 0.187 - 4.4e-4 * T
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *sound velocity* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity antiderivative in :math:`[m \\cdot K/s]`
+        """
+        return T * (1616 + T * (0.187 / 2 - 2.2e-4 / 3 * T))
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *speed of sound* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -2.2e-4, out=out)
+        out += 0.187
+        out *= T
+        out += 1616
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -382,6 +639,79 @@ class cp(SpecificHeatInterface):
         """
         return 118.2 + 5.934e-3*T + 7.183e6/T/T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific heat capacity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity derivative in :math:`[J/(kg \\cdot K^2)]`
+        """
+        return 5.934e-3 - 1.4366e7 / T / T / T
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *specific heat capacity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity antiderivative in :math:`[J/kg]`
+        """
+        return T * (118.2 + 2.967e-3*T) - 7.183e6/T
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *specific heat capacity* into the array
+        passed as argument by applying the property correlation with in-
+        place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        tmp = pool.get(0, out)
+        np.multiply(T, 5.934e-3, out=tmp)
+        np.multiply(T, T, out=out)
+        np.divide(7.183e6, out, out=out)
+        out += tmp
+        out += 118.2
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -435,6 +765,26 @@ class h(SpecificEnthalpyInterface):
         return T * (118.2 + 2.967e-3 * T) - T_m0 * (118.2 + 2.967e-3 * T_m0)\
             - 7.183e6 * (1 / T - 1 / T_m0)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific enthalpy* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific enthalpy derivative in :math:`[J/(kg \\cdot K)]`
+        """
+        return 118.2 + 5.934e-3 * T + 7.183e6 / T / T
+
     @property
     def correlation_name(self) -> str:
         """
@@ -489,6 +839,56 @@ class mu(DynamicViscosityInterface):
         """
         return 4.456e-4*np.exp(780/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *dynamic viscosity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            dynamic viscosity antiderivative in :math:`[Pa \\cdot s \\cdot K]`
+        """
+        return 4.456e-4 * (T * np.exp(780/T) - 780 * expi(780/T))
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *dynamic viscosity* into the array passed
+        as argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.divide(780, T, out=out)
+        np.exp(out, out=out)
+        out *= 4.456e-4
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -541,6 +941,27 @@ class r(ElectricalResistivityInterface):
         """
         return (98.96 + 0.0554*T)*1e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *electrical resistivity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            electrical resistivity antiderivative
+            in :math:`[Ohm \\cdot m \\cdot K]`
+        """
+        return T * (98.96 + 0.0277*T) * 1e-8
+
     @property
     def range(self) -> List[float]:
         """
@@ -586,6 +1007,55 @@ class k(ThermalConductivityInterface):
         """
         return 7.34 + 9.5e-3*T
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal conductivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal conductivity antiderivative in :math:`[W/m]`
+        """
+        return T * (7.34 + 4.75e-3*T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal conductivity* into the array
+        passed as argument by applying the property correlation with in-
+        place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, 9.5e-3, out=out)
+        out += 7.34
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -5,6 +5,7 @@ import numpy as np
 from scipy.constants import atm
 from scipy.constants import R
 from ..tch_common_interface import OxygenDiffusivityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -71,6 +72,26 @@ class OxygenDiffusivityFitzner1980(BismuthOxygenDiffusivityInterface):
         """
         return np.exp(-49229 / R / T) * 1.07e-6
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 1.07e-6, 49229 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -117,6 +138,26 @@ class OxygenDiffusivityHeshmatpour1981(BismuthOxygenDiffusivityInterface):
         """
         return np.exp(-26610 / R / T) * 1.98e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 1.98e-8, 26610 / R)
+
     @property
     def correlation_name(self) -> str:
         """
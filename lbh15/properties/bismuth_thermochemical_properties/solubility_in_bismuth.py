@@ -8,6 +8,7 @@ from ..tch_common_interface import IronSolubilityInterface
 from ..tch_common_interface import NickelSolubilityInterface
 from ..tch_common_interface import ChromiumSolubilityInterface
 from ..tch_common_interface import OxygenSolubilityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -53,6 +54,26 @@ class IronSolubilityGosse2014(BismuthIronSolubilityInterface):
         """
         return np.power(10, 2.20-3930/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.20, 3930 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -99,6 +120,26 @@ class IronSolubilityMassalski1990(BismuthIronSolubilityInterface):
         """
         return np.power(10, 2.18-3980/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.18, 3980 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -145,6 +186,26 @@ class IronSolubilityWeeks1998(BismuthIronSolubilityInterface):
         """
         return np.power(10, 1.832-3589/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**1.832, 3589 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -203,6 +264,26 @@ class NickelSolubilityWeeks1998(BismuthNickelSolubilityInterface):
         """
         return np.power(10, 2.61-1538/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Nickel solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.61, 1538 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -251,6 +332,33 @@ class NickelSolubilityGosse2014(BismuthNickelSolubilityInterface):
                         np.where(T <= 918, np.power(10, 2.05-1131/T),
                                  np.power(10, 1.35-484/T)))[()]
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Nickel solubility* with respect to
+        the temperature by applying the analytic expression. The
+        antiderivatives of the pieces are joined continuously at the
+        breakpoints.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return (arrhenius_antiderivative(np.minimum(T, 738), 10**3.81,
+                                         2429 * np.log(10))
+                + arrhenius_antiderivative(np.clip(T, 738, 918), 10**2.05,
+                                           1131 * np.log(10))
+                + arrhenius_antiderivative(np.maximum(T, 918), 10**1.35,
+                                           484 * np.log(10)))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -309,6 +417,26 @@ class ChromiumSolubilityVenkatraman1988(BismuthChromiumSolubilityInterface):
         """
         return np.power(10, 2.34-3610/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.34, 3610 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -355,6 +483,26 @@ class ChromiumSolubilityWeeks1998(BismuthChromiumSolubilityInterface):
         """
         return np.power(10, 2.5-3717/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.5, 3717 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -401,6 +549,26 @@ class ChromiumSolubilityGosse2014(BismuthChromiumSolubilityInterface):
         """
         return np.power(10, 2.34-3610/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.34, 3610 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -447,6 +615,31 @@ class OxygenSolubility(OxygenSolubilityInterface):
         return np.where(T <= 1002, np.power(10, 2.30-4066/T),
                         np.power(10, 3.04-4810/T))[()]
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen solubility* with respect to
+        the temperature by applying the analytic expression. The
+        antiderivatives of the pieces are joined continuously at the
+        breakpoints.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return (arrhenius_antiderivative(np.minimum(T, 1002), 10**2.30,
+                                         4066 * np.log(10))
+                + arrhenius_antiderivative(np.maximum(T, 1002), 10**3.04,
+                                           4810 * np.log(10)))
+
     @property
     def range(self) -> List[float]:
         """
@@ -2,12 +2,31 @@
 and the thermo-chemical properties, i.e., :class:`.PropertyInterface`."""
 from abc import ABC
 from abc import abstractmethod
+from typing import Callable
 from typing import List
 from typing import Union
+from numpy import absolute
+from numpy import add
+from numpy import arange
+from numpy import broadcast_arrays
+from numpy import broadcast_to
+from numpy import concatenate
 from numpy import nan
+from numpy import ndarray
+from numpy import zeros
+from numpy.polynomial.legendre import leggauss
 from scipy.optimize import minimize_scalar
 from scipy.constants import atm
 from .._decorators import range_warning
+from .._scratch import ScratchPool
+
+# Nodes and weights of the Gauss-Legendre quadrature adopted for
+# integrating the correlations without an analytic antiderivative
+_GL_NODES, _GL_WEIGHTS = leggauss(16)
+# Relative tolerance and maximum number of bisections of the adaptive
+# quadrature
+_QUAD_RTOL = 1e-12
+_QUAD_MAX_LEVELS = 60
 
 
 class PropertyInterface(ABC):
@@ -108,6 +127,142 @@ class PropertyInterface(ABC):
         """
         return None
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the property correlation with respect
+        to the temperature. Derived classes can override this method
+        to provide the analytic expression, otherwise it is computed
+        by central finite differences.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            derivative of the property with respect to the temperature
+            in :math:`[units/K]`
+        """
+        delta = 1e-6 * T
+        return (self.correlation(T + delta, p)
+                - self.correlation(T - delta, p)) / (2 * delta)
+
+    def antiderivative(self, T: float, p: float = atm
+                       ) -> Union[float, None]:
+        """
+        Returns an antiderivative of the property correlation with respect
+        to the temperature, at constant pressure. Derived classes can
+        override this method to provide the analytic expression,
+        otherwise `None` is returned and
+        :func:`~PropertyInterface.integral` adopts the quadrature.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float | None:
+            antiderivative of the property in :math:`[units \\cdot K]`,
+            or `None` if not implemented
+        """
+        return None
+
+    def integral(self, T_1: float, T_2: float, p: float = atm) -> float:
+        """
+        Returns the integral of the property correlation with respect to
+        the temperature from `T_1` to `T_2`, at constant pressure. The
+        antiderivative is adopted, if implemented, otherwise the
+        correlation is integrated by adaptive 16-point Gauss-Legendre
+        quadrature: each panel is compared with the sum over its two
+        halves, and the panels whose difference exceeds the tolerance
+        are bisected again, so that the breakpoints of piecewise
+        correlations are resolved by local refinement only.
+        Arguments can be arrays, e.g., of interval endpoints, to be
+        broadcast against each other.
+
+        Parameters
+        ----------
+        T_1 : float
+            lower integration bound, i.e., temperature in :math:`[K]`
+        T_2 : float
+            upper integration bound, i.e., temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            integral of the property in :math:`[units \\cdot K]`
+        """
+        upper = self.antiderivative(T_2, p)
+        if upper is not None:
+            return upper - self.antiderivative(T_1, p)
+        T_1, T_2, p = broadcast_arrays(T_1, T_2, p)
+        shape = T_1.shape
+        T_1, T_2, p = T_1.ravel(), T_2.ravel(), p.ravel()
+        index = arange(T_1.size)
+        estimate = _gauss_legendre(self.correlation, T_1, T_2, p)
+        tolerance = _QUAD_RTOL * absolute(estimate)
+        result = zeros(T_1.size)
+        for _ in range(_QUAD_MAX_LEVELS):
+            middle = (T_1 + T_2) / 2
+            left = _gauss_legendre(self.correlation, T_1, middle, p)
+            right = _gauss_legendre(self.correlation, middle, T_2, p)
+            refined = left + right
+            # Panels with not finite values are accepted as they are
+            split = absolute(refined - estimate) > tolerance[index]
+            add.at(result, index[~split], refined[~split])
+            if not split.any():
+                return result.reshape(shape)[()]
+            index = concatenate((index[split], index[split]))
+            T_1, T_2 = (concatenate((T_1[split], middle[split])),
+                        concatenate((middle[split], T_2[split])))
+            p = concatenate((p[split], p[split]))
+            estimate = concatenate((left[split], right[split]))
+        add.at(result, index, estimate)
+        return result.reshape(shape)[()]
+
+    def correlation_into(self, T: ndarray, p: ndarray, out: ndarray,
+                         pool: ScratchPool) -> ndarray:
+        """
+        Writes the value of the property into the array passed as
+        argument. Derived classes can override this method to apply the
+        correlation by in-place operations on `out` and on the scratch
+        arrays of `pool`, so that no memory is allocated; otherwise, the
+        value returned by :func:`~PropertyInterface.correlation` is
+        copied into `out`.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        out[...] = self.correlation(T, p)
+        return out
+
     def info(self, T: float, p: float = atm,
              print_info: bool = True, n_tab: int = 0) -> Union[None, str]:
         """
@@ -275,3 +430,15 @@ class PropertyInterface(ABC):
         """
         raise NotImplementedError(f"{type(self).__name__}.description "
                                   "NOT IMPLEMENTED")
+
+
+def _gauss_legendre(correlation: Callable[[ndarray, ndarray], ndarray],
+                    T_1: ndarray, T_2: ndarray, p: ndarray) -> ndarray:
+    """
+    Integrates the correlation over each temperature interval by the
+    16-point Gauss-Legendre quadrature.
+    """
+    half = (T_2 - T_1) / 2
+    T = ((T_2 + T_1) / 2)[..., None] + half[..., None] * _GL_NODES
+    values = broadcast_to(correlation(T, p[..., None]), T.shape)
+    return half * (values @ _GL_WEIGHTS)
@@ -0,0 +1,102 @@
+"""Module with the definition of the thermodynamic property objects
+for *lead-bismuth eutectic* derived from its thermo-physical properties,
+i.e., from the density, the thermal expansion coefficient, the sound
+velocity and the specific heat capacity."""
+from typing import Dict
+from .interface import PropertyInterface
+from .tph_common_interface import IsochoricHeatInterface
+from .tph_common_interface import IsothermalCompressibilityInterface
+from .tph_common_interface import GruneisenParameterInterface
+from .tph_common_interface import VolumetricHeatCapacityInterface
+from . import lbe_properties
+
+# Base property objects
+_BASE_PROPERTIES = {'rho': lbe_properties.rho(),
+                    'alpha': lbe_properties.alpha(),
+                    'u_s': lbe_properties.u_s(),
+                    'cp': lbe_properties.cp()}
+
+
+class cv(IsochoricHeatInterface):
+    """
+    Liquid lead-bismuth eutectic *isochoric specific heat capacity*
+    property class.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES
+
+    @property
+    def description(self) -> str:
+        """
+        str : Isochoric specific heat capacity description
+        """
+        return f"Liquid lbe {self.long_name}"
+
+
+class beta_T(IsothermalCompressibilityInterface):
+    """
+    Liquid lead-bismuth eutectic *isothermal compressibility* property class.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES
+
+    @property
+    def description(self) -> str:
+        """
+        str : Isothermal compressibility description
+        """
+        return f"Liquid lbe {self.long_name}"
+
+
+class gamma_G(GruneisenParameterInterface):
+    """
+    Liquid lead-bismuth eutectic *Gruneisen parameter* property class.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES
+
+    @property
+    def is_injective(self) -> bool:
+        """
+        bool : `True` if the correlation is injective,
+        `False` otherwise.
+        """
+        return False
+
+    @property
+    def description(self) -> str:
+        """
+        str : Gruneisen parameter description
+        """
+        return f"Liquid lbe {self.long_name}"
+
+
+class rho_cp(VolumetricHeatCapacityInterface):
+    """
+    Liquid lead-bismuth eutectic *volumetric heat capacity* property class.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES
+
+    @property
+    def description(self) -> str:
+        """
+        str : Volumetric heat capacity description
+        """
+        return f"Liquid lbe {self.long_name}"
@@ -4,6 +4,7 @@ from typing import List
 from typing import Union
 import numpy as np
 from scipy.constants import atm
+from scipy.special import expi
 from .tph_common_interface import SaturationVapourPressureInterface
 from .tph_common_interface import SurfaceTensionInterface
 from .tph_common_interface import DensityInterface
@@ -16,6 +17,7 @@ from .tph_common_interface import DynamicViscosityInterface
 from .tph_common_interface import ElectricalResistivityInterface
 from .tph_common_interface import ThermalConductivityInterface
 from .._decorators import range_warning
+from .._scratch import ScratchPool
 from .._commons import LBE_MELTING_TEMPERATURE as T_m0
 from .._commons import LBE_BOILING_TEMPERATURE as T_b0
 
@@ -72,6 +74,26 @@ class p_s(SaturationVapourPressureInterface):
             return 1200
         return 2000
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *saturation vapour pressure* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            saturation vapour pressure antiderivative in :math:`[Pa \\cdot K]`
+        """
+        return 1.22e10 * (T * np.exp(-22552/T) + 22552 * expi(-22552/T))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -124,6 +146,26 @@ class sigma(SurfaceTensionInterface):
         """
         return (448.5 - 0.0799*T)*1e-3
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *surface tension* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            surface tension antiderivative in :math:`[N \\cdot K/m]`
+        """
+        return T * (448.5 - 0.03995*T) * 1e-3
+
     @property
     def correlation_name(self) -> str:
         """
@@ -182,6 +224,79 @@ class rho(DensityInterface):
             (1 / u_s_val / u_s_val +
              T * alpha_val * alpha_val / cp().correlation(T, p)) * (p - atm)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *density* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            density derivative in :math:`[kg/(m^3 \\cdot K)]`
+        """
+        u_s_val = u_s().correlation(T, p)
+        alpha_val = alpha().correlation(T, p)
+        cp_val = cp().correlation(T, p)
+        return -1.293 +\
+            (- 2 * u_s().derivative(T, p) / u_s_val / u_s_val / u_s_val
+             + alpha_val * alpha_val / cp_val
+             + 2 * T * alpha_val * alpha().derivative(T, p) / cp_val
+             - T * alpha_val * alpha_val * cp().derivative(T, p)
+             / cp_val / cp_val) * (p - atm)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *density* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -1.293, out=out)
+        out += 11065
+        if np.ndim(p) == 0 and p == atm:
+            return out
+        # Pressure-dependent term
+        u_s_val = u_s().correlation_into(T, p, pool.get(0, out), pool)
+        alpha_val = alpha().correlation_into(T, p, pool.get(1, out), pool)
+        cp_val = cp().correlation_into(
+            T, p, pool.get(2, out), pool.shifted(3))
+        alpha_val *= alpha_val
+        alpha_val *= T
+        alpha_val /= cp_val
+        u_s_val *= u_s_val
+        np.reciprocal(u_s_val, out=u_s_val)
+        u_s_val += alpha_val
+        np.subtract(p, atm, out=alpha_val)
+        u_s_val *= alpha_val
+        out += u_s_val
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -228,6 +343,77 @@ class alpha(ThermalExpansionInterface):
         """
         return 1/(8558 - T)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *thermal expansion coefficient*
+        with respect to the temperature by applying the analytic
+        expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient derivative
+            in :math:`[1/K^2]`
+        """
+        return 1 / (8558 - T) / (8558 - T)
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal expansion coefficient* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient antiderivative in :math:`[-]`
+        """
+        return -np.log(8558 - T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal expansion coefficient* into the
+        array passed as argument by applying the property correlation with
+        in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.subtract(8558, T, out=out)
+        np.reciprocal(out, out=out)
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -273,6 +459,75 @@ class u_s(SpeedOfSoundInterface):
         """
         return 1855 - 0.212*T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *sound velocity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity derivative in :math:`[m/(s \\cdot K)]`
+        """
+        return -0.212
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *sound velocity* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity antiderivative in :math:`[m \\cdot K/s]`
+        """
+        return T * (1855 - 0.106*T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *speed of sound* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -0.212, out=out)
+        out += 1855
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -371,6 +626,81 @@ class cp(SpecificHeatInterface):
         """
         return 164.8 - T * (3.94e-2 - 1.25e-5 * T) - 4.56e5 / T / T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific heat capacity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity derivative in :math:`[J/(kg \\cdot K^2)]`
+        """
+        return - 3.94e-2 + 2.5e-5 * T + 9.12e5 / T / T / T
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *specific heat capacity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity antiderivative in :math:`[J/kg]`
+        """
+        return T * (164.8 - T * (1.97e-2 - 1.25e-5 / 3 * T)) + 4.56e5 / T
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *specific heat capacity* into the array
+        passed as argument by applying the **sobolev2011** correlation
+        with in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        tmp = pool.get(0, out)
+        np.multiply(T, 1.25e-5, out=tmp)
+        tmp += -3.94e-2
+        tmp *= T
+        np.multiply(T, T, out=out)
+        np.divide(-4.56e5, out, out=out)
+        out += tmp
+        out += 164.8
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -425,6 +755,26 @@ class h(SpecificEnthalpyInterface):
             - T_m0 * (164.8 - T_m0 * (1.97e-2 - 4.167e-6 * T_m0))\
             + 4.56e5 * (1 / T - 1 / T_m0)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific enthalpy* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific enthalpy derivative in :math:`[J/(kg \\cdot K)]`
+        """
+        return 164.8 - T * (3.94e-2 - 1.2501e-5 * T) - 4.56e5 / T / T
+
     @property
     def correlation_name(self) -> str:
         """
@@ -479,6 +829,56 @@ class mu(DynamicViscosityInterface):
         """
         return 4.94e-4*np.exp(754.1/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *dynamic viscosity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            dynamic viscosity antiderivative in :math:`[Pa \\cdot s \\cdot K]`
+        """
+        return 4.94e-4 * (T * np.exp(754.1/T) - 754.1 * expi(754.1/T))
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *dynamic viscosity* into the array passed
+        as argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.divide(754.1, T, out=out)
+        np.exp(out, out=out)
+        out *= 4.94e-4
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -524,6 +924,27 @@ class r(ElectricalResistivityInterface):
         """
         return (90.9 + 0.048*T)*1e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *electrical resistivity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            electrical resistivity antiderivative
+            in :math:`[Ohm \\cdot m \\cdot K]`
+        """
+        return T * (90.9 + 0.024*T) * 1e-8
+
     @property
     def range(self) -> List[float]:
         """
@@ -569,6 +990,57 @@ class k(ThermalConductivityInterface):
         """
         return 3.284 + T * (1.617e-2 - 2.305e-6 * T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal conductivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal conductivity antiderivative in :math:`[W/m]`
+        """
+        return T * (3.284 + T * (1.617e-2 / 2 - 2.305e-6 / 3 * T))
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal conductivity* into the array
+        passed as argument by applying the property correlation with in-
+        place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -2.305e-6, out=out)
+        out += 1.617e-2
+        out *= T
+        out += 3.284
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
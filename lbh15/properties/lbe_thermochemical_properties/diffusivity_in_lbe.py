@@ -5,6 +5,7 @@ import numpy as np
 from scipy.constants import atm, R
 from ..tch_common_interface import OxygenDiffusivityInterface
 from ..tch_common_interface import IronDiffusivityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -50,6 +51,26 @@ class OxygenDiffusivityGromov1996(LBEOxygenDiffusivityInterface):
         """
         return np.exp(-43073 / R / T) * 2.39e-6
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 2.39e-6, 43073 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -96,6 +117,26 @@ class OxygenDiffusivityGanesan2006b(LBEOxygenDiffusivityInterface):
         """
         return np.exp(-69069 / R / T) * 0.154e-4
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 0.154e-4, 69069 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -141,6 +182,27 @@ class IronDiffusivity(IronDiffusivityInterface):
         """
         return np.power(10, - 2.31 - 2295 / T) * 1.0e-4
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron diffusivity* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return 1.0e-4 * arrhenius_antiderivative(
+            T, 10**-2.31, 2295 * np.log(10))
+
     @property
     def range(self) -> List[float]:
         """
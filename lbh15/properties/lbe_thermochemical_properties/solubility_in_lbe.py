@@ -8,6 +8,7 @@ from ..tch_common_interface import IronSolubilityInterface
 from ..tch_common_interface import NickelSolubilityInterface
 from ..tch_common_interface import ChromiumSolubilityInterface
 from ..tch_common_interface import OxygenSolubilityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -53,6 +54,26 @@ class IronSolubilityGosse2014(LBEIronSolubilityInterface):
         """
         return np.power(10, 2.00-4399/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.00, 4399 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -99,6 +120,26 @@ class IronSolubilityWeeks1969(LBEIronSolubilityInterface):
         """
         return np.power(10, 1.85-4164/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**1.85, 4164 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -179,6 +220,31 @@ class NickelSolubilityMartinelli2010(LBENickelSolubilityInterface):
         return np.where(T <= 712, np.power(10, 5.2-3500/T),
                         np.power(10, 1.7-1009/T))[()]
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Nickel solubility* with respect to
+        the temperature by applying the analytic expression. The
+        antiderivatives of the pieces are joined continuously at the
+        breakpoints.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return (arrhenius_antiderivative(np.minimum(T, 712), 10**5.2,
+                                         3500 * np.log(10))
+                + arrhenius_antiderivative(np.maximum(T, 712), 10**1.7,
+                                           1009 * np.log(10)))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -226,6 +292,31 @@ class NickelSolubilityGosse2014(LBENickelSolubilityInterface):
         return np.where(T <= 742, np.power(10, 4.32-2933/T),
                         np.power(10, 1.74-1006/T))[()]
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Nickel solubility* with respect to
+        the temperature by applying the analytic expression. The
+        antiderivatives of the pieces are joined continuously at the
+        breakpoints.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return (arrhenius_antiderivative(np.minimum(T, 742), 10**4.32,
+                                         2933 * np.log(10))
+                + arrhenius_antiderivative(np.maximum(T, 742), 10**1.74,
+                                           1006 * np.log(10)))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -305,6 +396,26 @@ class ChromiumSolubilityGosse2014(LBEChromiumSolubilityInterface):
         """
         return np.power(10, 1.12-3056/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**1.12, 3056 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -351,6 +462,26 @@ class ChromiumSolubilityCourouau2004(LBEChromiumSolubilityInterface):
         """
         return np.power(10, 1.07-3022/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**1.07, 3022 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -397,6 +528,26 @@ class ChromiumSolubilityMartynov1998(LBEChromiumSolubilityInterface):
         """
         return np.power(10, -0.02-2280/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**-0.02, 2280 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -442,6 +593,26 @@ class OxygenSolubility(OxygenSolubilityInterface):
         """
         return np.power(10, 2.25-4125/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.25, 4125 * np.log(10))
+
     @property
     def range(self) -> List[float]:
         """
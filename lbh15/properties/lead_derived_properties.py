@@ -0,0 +1,154 @@
+"""Module with the definition of the thermodynamic property objects
+for *lead* derived from its thermo-physical properties, i.e., from the
+density, the thermal expansion coefficient, the sound velocity and the
+specific heat capacity. The derived properties are implemented for both
+the specific heat capacity correlations, and follow the one in use."""
+from typing import Dict
+from .interface import PropertyInterface
+from .tph_common_interface import IsochoricHeatInterface
+from .tph_common_interface import IsothermalCompressibilityInterface
+from .tph_common_interface import GruneisenParameterInterface
+from .tph_common_interface import VolumetricHeatCapacityInterface
+from . import lead_properties
+
+# Base property objects keyed by specific heat capacity correlation
+_BASE_PROPERTIES = {
+    corr_name: {'rho': lead_properties.rho(),
+                'alpha': lead_properties.alpha(),
+                'u_s': lead_properties.u_s(),
+                'cp': cp_object}
+    for corr_name, cp_object in
+    [('sobolev2011', lead_properties.cp_sobolev2011()),
+     ('gurvich1991', lead_properties.cp_gurvich1991())]}
+
+
+class cv(IsochoricHeatInterface):
+    """
+    Liquid lead *isochoric specific heat capacity* property class,
+    derived from the 'sobolev2011' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['sobolev2011']
+
+    @property
+    def description(self) -> str:
+        """
+        str : Isochoric specific heat capacity description
+        """
+        return f"Liquid lead {self.long_name}"
+
+
+class cv_gurvich1991(cv):
+    """
+    Liquid lead *isochoric specific heat capacity* property class,
+    derived from the 'gurvich1991' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['gurvich1991']
+
+
+class beta_T(IsothermalCompressibilityInterface):
+    """
+    Liquid lead *isothermal compressibility* property class, derived
+    from the 'sobolev2011' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['sobolev2011']
+
+    @property
+    def description(self) -> str:
+        """
+        str : Isothermal compressibility description
+        """
+        return f"Liquid lead {self.long_name}"
+
+
+class beta_T_gurvich1991(beta_T):
+    """
+    Liquid lead *isothermal compressibility* property class, derived
+    from the 'gurvich1991' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['gurvich1991']
+
+
+class gamma_G(GruneisenParameterInterface):
+    """
+    Liquid lead *Gruneisen parameter* property class, derived from the
+    'sobolev2011' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['sobolev2011']
+
+    @property
+    def description(self) -> str:
+        """
+        str : Gruneisen parameter description
+        """
+        return f"Liquid lead {self.long_name}"
+
+
+class gamma_G_gurvich1991(gamma_G):
+    """
+    Liquid lead *Gruneisen parameter* property class, derived from the
+    'gurvich1991' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['gurvich1991']
+
+
+class rho_cp(VolumetricHeatCapacityInterface):
+    """
+    Liquid lead *volumetric heat capacity* property class, derived from
+    the 'sobolev2011' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['sobolev2011']
+
+    @property
+    def description(self) -> str:
+        """
+        str : Volumetric heat capacity description
+        """
+        return f"Liquid lead {self.long_name}"
+
+
+class rho_cp_gurvich1991(rho_cp):
+    """
+    Liquid lead *volumetric heat capacity* property class, derived from
+    the 'gurvich1991' specific heat capacity.
+    """
+    @property
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Base property objects
+        """
+        return _BASE_PROPERTIES['gurvich1991']
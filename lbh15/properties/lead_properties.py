@@ -4,6 +4,7 @@ from typing import List
 from typing import Union
 import numpy as np
 from scipy.constants import atm
+from scipy.special import expi
 from .tph_common_interface import SaturationVapourPressureInterface
 from .tph_common_interface import SurfaceTensionInterface
 from .tph_common_interface import DensityInterface
@@ -16,6 +17,7 @@ from .tph_common_interface import DynamicViscosityInterface
 from .tph_common_interface import ElectricalResistivityInterface
 from .tph_common_interface import ThermalConductivityInterface
 from .._decorators import range_warning
+from .._scratch import ScratchPool
 from .._commons import LEAD_MELTING_TEMPERATURE as T_m0
 from .._commons import LEAD_BOILING_TEMPERATURE as T_b0
 
@@ -72,6 +74,26 @@ class p_s(SaturationVapourPressureInterface):
             return 1200
         return 2000
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *saturation vapour pressure* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            saturation vapour pressure antiderivative in :math:`[Pa \\cdot K]`
+        """
+        return 5.76e9 * (T * np.exp(-22131/T) + 22131 * expi(-22131/T))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -124,6 +146,26 @@ class sigma(SurfaceTensionInterface):
         """
         return (525.9 - 0.113*T)*1e-3
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *surface tension* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            surface tension antiderivative in :math:`[N \\cdot K/m]`
+        """
+        return T * (525.9 - 0.0565*T) * 1e-3
+
     @property
     def correlation_name(self) -> str:
         """
@@ -183,6 +225,79 @@ class rho(DensityInterface):
              T * alpha_val * alpha_val /
              cp_sobolev2011().correlation(T, p)) * (p - atm)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *density* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            density derivative in :math:`[kg/(m^3 \\cdot K)]`
+        """
+        u_s_val = u_s().correlation(T, p)
+        alpha_val = alpha().correlation(T, p)
+        cp_val = cp_sobolev2011().correlation(T, p)
+        return -1.2795 +\
+            (- 2 * u_s().derivative(T, p) / u_s_val / u_s_val / u_s_val
+             + alpha_val * alpha_val / cp_val
+             + 2 * T * alpha_val * alpha().derivative(T, p) / cp_val
+             - T * alpha_val * alpha_val * cp_sobolev2011().derivative(T, p)
+             / cp_val / cp_val) * (p - atm)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *density* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -1.2795, out=out)
+        out += 11441
+        if np.ndim(p) == 0 and p == atm:
+            return out
+        # Pressure-dependent term
+        u_s_val = u_s().correlation_into(T, p, pool.get(0, out), pool)
+        alpha_val = alpha().correlation_into(T, p, pool.get(1, out), pool)
+        cp_val = cp_sobolev2011().correlation_into(
+            T, p, pool.get(2, out), pool.shifted(3))
+        alpha_val *= alpha_val
+        alpha_val *= T
+        alpha_val /= cp_val
+        u_s_val *= u_s_val
+        np.reciprocal(u_s_val, out=u_s_val)
+        u_s_val += alpha_val
+        np.subtract(p, atm, out=alpha_val)
+        u_s_val *= alpha_val
+        out += u_s_val
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -235,6 +350,77 @@ class alpha(ThermalExpansionInterface):
         """
         return 1/(8942 - T)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *thermal expansion coefficient*
+        with respect to the temperature by applying the analytic
+        expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient derivative
+            in :math:`[1/K^2]`
+        """
+        return 1 / (8942 - T) / (8942 - T)
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal expansion coefficient* with
+        respect to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal expansion coefficient antiderivative in :math:`[-]`
+        """
+        return -np.log(8942 - T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal expansion coefficient* into the
+        array passed as argument by applying the property correlation with
+        in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.subtract(8942, T, out=out)
+        np.reciprocal(out, out=out)
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -280,6 +466,75 @@ class u_s(SpeedOfSoundInterface):
         """
         return 1953 - 0.246*T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *sound velocity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity derivative in :math:`[m/(s \\cdot K)]`
+        """
+        return -0.246
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *sound velocity* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            sound velocity antiderivative in :math:`[m \\cdot K/s]`
+        """
+        return T * (1953 - 0.123*T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *speed of sound* into the array passed as
+        argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, -0.246, out=out)
+        out += 1953
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -391,6 +646,82 @@ class cp_sobolev2011(LeadCpInterface):
         """
         return 176.2 - T * (4.923e-2 - 1.544e-5 * T) - 1.524e6 / T / T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific heat capacity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity derivative in :math:`[J/(kg \\cdot K^2)]`
+        """
+        return - 4.923e-2 + 3.088e-5 * T + 3.048e6 / T / T / T
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *specific heat capacity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity antiderivative in :math:`[J/kg]`
+        """
+        return T * (176.2 - T * (4.923e-2 / 2 - 1.544e-5 / 3 * T)) \
+            + 1.524e6 / T
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *specific heat capacity* into the array
+        passed as argument by applying the **sobolev2011** correlation
+        with in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        tmp = pool.get(0, out)
+        np.multiply(T, 1.544e-5, out=tmp)
+        tmp += -4.923e-2
+        tmp *= T
+        np.multiply(T, T, out=out)
+        np.divide(-1.524e6, out, out=out)
+        out += tmp
+        out += 176.2
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -445,6 +776,86 @@ class cp_gurvich1991(LeadCpInterface):
         return 175.1 - T * (4.961e-2 - T * (1.985e-5 - 2.099e-9 * T))\
             - 1.524e6 / T / T
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific heat capacity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity derivative in :math:`[J/(kg \\cdot K^2)]`
+        """
+        return - 4.961e-2 + T * (3.970e-5 - 6.297e-9 * T)\
+            + 3.048e6 / T / T / T
+
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *specific heat capacity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific heat capacity antiderivative in :math:`[J/kg]`
+        """
+        return T * (175.1 - T * (4.961e-2 / 2
+                                 - T * (1.985e-5 / 3 - 2.099e-9 / 4 * T))) \
+            + 1.524e6 / T
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *specific heat capacity* into the array
+        passed as argument by applying the **gurvich1991** correlation
+        with in-place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        tmp = pool.get(0, out)
+        np.multiply(T, -2.099e-9, out=tmp)
+        tmp += 1.985e-5
+        tmp *= T
+        tmp += -4.961e-2
+        tmp *= T
+        np.multiply(T, T, out=out)
+        np.divide(-1.524e6, out, out=out)
+        out += tmp
+        out += 175.1
+        return out
+
     @property
     def correlation_name(self) -> str:
         """
@@ -499,6 +910,26 @@ class h(SpecificEnthalpyInterface):
             - T_m0 * (176.2 - T_m0 * (2.4615e-2 - 5.147e-6 * T_m0))\
             + 1.524e6 * (1 / T - 1 / T_m0)
 
+    def derivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns the derivative of the *specific enthalpy* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            specific enthalpy derivative in :math:`[J/(kg \\cdot K)]`
+        """
+        return 176.2 - T * (4.923e-2 - 1.5441e-5 * T) - 1.524e6 / T / T
+
     @property
     def correlation_name(self) -> str:
         """
@@ -574,6 +1005,56 @@ class mu(DynamicViscosityInterface):
             return 800
         return 1600
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *dynamic viscosity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            dynamic viscosity antiderivative in :math:`[Pa \\cdot s \\cdot K]`
+        """
+        return 4.55e-4 * (T * np.exp(1069/T) - 1069 * expi(1069/T))
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *dynamic viscosity* into the array passed
+        as argument by applying the property correlation with in-place
+        operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.divide(1069, T, out=out)
+        np.exp(out, out=out)
+        out *= 4.55e-4
+        return out
+
     @property
     def range(self) -> List[float]:
         """
@@ -619,6 +1100,27 @@ class r(ElectricalResistivityInterface):
         """
         return (67.0 + 0.0471*T)*1e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *electrical resistivity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            electrical resistivity antiderivative
+            in :math:`[Ohm \\cdot m \\cdot K]`
+        """
+        return T * (67.0 + 0.02355*T) * 1e-8
+
     @property
     def range(self) -> List[float]:
         """
@@ -664,6 +1166,55 @@ class k(ThermalConductivityInterface):
         """
         return 9.2 + 0.011*T
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *thermal conductivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            thermal conductivity antiderivative in :math:`[W/m]`
+        """
+        return T * (9.2 + 0.0055*T)
+
+    def correlation_into(self, T: np.ndarray, p: np.ndarray,
+                         out: np.ndarray,
+                         pool: ScratchPool) -> np.ndarray:
+        """
+        Writes the value of the *thermal conductivity* into the array
+        passed as argument by applying the property correlation with in-
+        place operations.
+
+        Parameters
+        ----------
+        T : np.ndarray
+            Temperature in :math:`[K]`
+        p : np.ndarray
+            Pressure in :math:`[Pa]`
+        out : np.ndarray
+            array the property value is written into, having the
+            broadcast shape of `T` and `p`
+        pool : ScratchPool
+            pool providing the scratch arrays
+
+        Returns
+        -------
+        np.ndarray:
+            `out` array
+        """
+        np.multiply(T, 0.011, out=out)
+        out += 9.2
+        return out
+
     @property
     def range(self) -> List[float]:
         """
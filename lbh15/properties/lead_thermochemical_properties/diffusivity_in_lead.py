@@ -7,6 +7,7 @@ from scipy.constants import R
 from ..interface import PropertyInterface
 from ..tch_common_interface import OxygenDiffusivityInterface
 from ..tch_common_interface import IronDiffusivityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -52,6 +53,26 @@ class OxygenDiffusivityArcella1968(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-14979 / R / T) * 6.32e-9
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 6.32e-9, 14979 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -98,6 +119,26 @@ class OxygenDiffusivityHomna1971(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-20083 / R / T) * 9.65e-9
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 9.65e-9, 20083 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -144,6 +185,26 @@ class OxygenDiffusivitySwzarc1972(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-25942 / R / T) * 1.44e-7
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 1.44e-7, 25942 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -190,6 +251,26 @@ class OxygenDiffusivityOtsuka1975(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-19497 / R / T) * 1.48e-7
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 1.48e-7, 19497 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -236,6 +317,26 @@ class OxygenDiffusivityCharle1976(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-20927 / R / T) * 1.90e-7
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 1.90e-7, 20927 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -282,6 +383,26 @@ class OxygenDiffusivityGromov1996(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-16158 / R / T) * 6.6e-9
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 6.6e-9, 16158 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -328,6 +449,26 @@ class OxygenDiffusivityGanesan2006b(LeadOxygenDiffusivityInterface):
         """
         return np.exp(-45587 / R / T) * 2.79e-7
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 2.79e-7, 45587 / R)
+
     @property
     def correlation_name(self) -> str:
         """
@@ -373,6 +514,27 @@ class IronDiffusivity(IronDiffusivityInterface):
         """
         return np.power(10, - 2.31 - 2295 / T) * 1.0e-4
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron diffusivity* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return 1.0e-4 * arrhenius_antiderivative(
+            T, 10**-2.31, 2295 * np.log(10))
+
     @property
     def range(self) -> List[float]:
         """
@@ -418,6 +580,26 @@ class CobaltDiffusivity(PropertyInterface):
         """
         return np.exp(-22154 / R / T) * 4.6e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Cobalt diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 4.6e-8, 22154 / R)
+
     @property
     def name(self) -> str:
         """
@@ -484,6 +666,26 @@ class SeleniumDiffusivity(PropertyInterface):
         """
         return np.exp(-12958 / R / T) * 3.4e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Selenium diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 3.4e-8, 12958 / R)
+
     @property
     def name(self) -> str:
         """
@@ -550,6 +752,26 @@ class IndiumDiffusivity(PropertyInterface):
         """
         return np.exp(-13794 / R / T) * 3.1e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Indium diffusivity* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 3.1e-8, 13794 / R)
+
     @property
     def name(self) -> str:
         """
@@ -616,6 +838,26 @@ class TelluriumDiffusivity(PropertyInterface):
         """
         return np.exp(-15884 / R / T) * 3.1e-8
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Tellurium diffusivity* with respect
+        to the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            diffusivity antiderivative in :math:`[m^2 \\cdot K / s]`
+        """
+        return arrhenius_antiderivative(T, 3.1e-8, 15884 / R)
+
     @property
     def name(self) -> str:
         """
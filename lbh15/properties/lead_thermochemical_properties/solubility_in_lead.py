@@ -8,6 +8,7 @@ from ..tch_common_interface import IronSolubilityInterface
 from ..tch_common_interface import NickelSolubilityInterface
 from ..tch_common_interface import ChromiumSolubilityInterface
 from ..tch_common_interface import OxygenSolubilityInterface
+from ..tch_common_interface import arrhenius_antiderivative
 from ..._decorators import range_warning
 
 
@@ -40,6 +41,26 @@ class IronSolubility(IronSolubilityInterface):
         """
         return np.power(10, 2.11-5225/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Iron solubility* with respect to the
+        temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**2.11, 5225 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -92,6 +113,26 @@ class NickelSolubility(NickelSolubilityInterface):
         """
         return np.power(10, 1.36-1395/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Nickel solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**1.36, 1395 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -157,6 +198,26 @@ class ChromiumSolubilityAlden1958(LeadChromiumSolubilityInterface):
         """
         return np.power(10, 3.74-6750/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**3.74, 6750 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -203,6 +264,26 @@ class ChromiumSolubilityVenkatraman1988(LeadChromiumSolubilityInterface):
         """
         return np.power(10, 3.7-6720/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**3.7, 6720 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -249,6 +330,26 @@ class ChromiumSolubilityGosse2014(LeadChromiumSolubilityInterface):
         """
         return np.power(10, 3.62-6648/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Chromium solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**3.62, 6648 * np.log(10))
+
     @property
     def correlation_name(self) -> str:
         """
@@ -294,6 +395,26 @@ class SiliconSolubility(PropertyInterface):
         """
         return np.power(10, 3.886-7180/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Silicon solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**3.886, 7180 * np.log(10))
+
     @property
     def name(self) -> str:
         """
@@ -360,6 +481,26 @@ class OxygenSolubility(OxygenSolubilityInterface):
         """
         return np.power(10, 3.23-5043/T)
 
+    def antiderivative(self, T: float, p: float = atm) -> float:
+        """
+        Returns an antiderivative of the *Oxygen solubility* with respect to
+        the temperature by applying the analytic expression.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+
+        Returns
+        -------
+        float:
+            solubility antiderivative in :math:`[wt.\\% \\cdot K]`
+        """
+        return arrhenius_antiderivative(T, 10**3.23, 5043 * np.log(10))
+
     @property
     def range(self) -> List[float]:
         """
@@ -1,8 +1,39 @@
 """Module with the definition of common property interfaces
 for thermochemical properties"""
+from typing import Union
+import numpy as np
+from scipy.special import expi
 from .interface import PropertyInterface
 
 
+def arrhenius_antiderivative(T: Union[float, np.ndarray], factor: float,
+                             activation: float) -> Union[float, np.ndarray]:
+    """
+    Returns an antiderivative with respect to the temperature of the
+    Arrhenius-type correlations :math:`A \\cdot e^{-B/T}`, i.e.,
+    :math:`A \\cdot (T \\cdot e^{-B/T} + B \\cdot Ei(-B/T))`, where
+    :math:`Ei` is the exponential integral. The correlations in the form
+    :math:`10^{a - b/T}` have :math:`A = 10^a` and
+    :math:`B = b \\cdot \\ln 10`.
+
+    Parameters
+    ----------
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    factor : float
+        pre-exponential factor :math:`A`
+    activation : float
+        activation temperature :math:`B` in :math:`[K]`
+
+    Returns
+    -------
+    float | np.ndarray
+        antiderivative in :math:`[units \\cdot K]`
+    """
+    return factor * (T * np.exp(-activation / T)
+                     + activation * expi(-activation / T))
+
+
 class OxygenDiffusivityInterface(PropertyInterface):
     """
     Liquid metal *Oxygen diffusivity* property abstract class.
@@ -1,6 +1,11 @@
 """Module with the definition of common property interfaces
 for thermophysical properties"""
+from abc import abstractmethod
+from typing import Dict
+from typing import List
+from scipy.constants import atm
 from .interface import PropertyInterface
+from .._decorators import range_warning
 
 
 class SaturationVapourPressureInterface(PropertyInterface):
@@ -226,3 +231,236 @@ class ThermalConductivityInterface(PropertyInterface):
         str : Thermal conductivity long name
         """
         return "thermal conductivity"
+
+
+class DerivedPropertyInterface(PropertyInterface):
+    """
+    Liquid metal property abstract class for the thermodynamic quantities
+    derived from the density, the thermal expansion coefficient, the sound
+    velocity and the specific heat capacity correlations. Derived classes
+    must override :attr:`base_properties` and :func:`combine`; the
+    correlation name is the one of the specific heat capacity, and the
+    validity range is the intersection of the ones of the base properties.
+    """
+    @range_warning
+    def correlation(self, T: float, p: float = atm,
+                    verbose: bool = False) -> float:
+        """
+        Returns the value of the property by applying the base property
+        correlations and combining their values.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        p : float, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+        verbose : bool, optional
+            `True` to tell the decorator to print a warning message in case of
+            range check failing, `False` otherwise. By default, `False`
+
+        Returns
+        -------
+        float:
+            property value
+        """
+        return self.combine(T, **{name: obj.correlation(T, p)
+                                  for name, obj
+                                  in self.base_properties.items()})
+
+    @abstractmethod
+    def combine(self, T: float, rho: float, alpha: float, u_s: float,
+                cp: float) -> float:
+        """
+        Returns the value of the property from the values of the base
+        properties, which can be shared by several derived properties.
+
+        Parameters
+        ----------
+        T : float
+            Temperature in :math:`[K]`
+        rho : float
+            density in :math:`[kg/m^3]`
+        alpha : float
+            thermal expansion coefficient in :math:`[1/K]`
+        u_s : float
+            sound velocity in :math:`[m/s]`
+        cp : float
+            specific heat capacity in :math:`[J/(kg \\cdot K)]`
+
+        Returns
+        -------
+        float:
+            property value
+        """
+
+    @property
+    @abstractmethod
+    def base_properties(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : Property objects of the density,
+        the thermal expansion coefficient, the sound velocity and the
+        specific heat capacity, keyed by 'rho', 'alpha', 'u_s' and 'cp'
+        """
+
+    @property
+    def correlation_name(self) -> str:
+        """
+        str : Name of the correlation, i.e., the one of the specific heat
+        capacity
+        """
+        return self.base_properties['cp'].correlation_name
+
+    @property
+    def range(self) -> List[float]:
+        """
+        List[float] : Temperature validity range, i.e., the intersection of
+        the ones of the base properties
+        """
+        ranges = [obj.range for obj in self.base_properties.values()]
+        return [max(lim[0] for lim in ranges), min(lim[1] for lim in ranges)]
+
+
+class IsochoricHeatInterface(DerivedPropertyInterface):
+    """
+    Liquid metal *isochoric specific heat capacity* property abstract
+    class, i.e., :math:`c_v = c_p / (1 + T \\alpha^2 u_s^2 / c_p)`.
+    """
+    def combine(self, T: float, rho: float, alpha: float, u_s: float,
+                cp: float) -> float:
+        """
+        Returns the value of the *isochoric specific heat capacity* from the
+        values of the base properties, see
+        :func:`DerivedPropertyInterface.combine`.
+        """
+        return cp / (1 + T * alpha * alpha * u_s * u_s / cp)
+
+    @property
+    def name(self) -> str:
+        """
+        str : Name of the property
+        """
+        return "cv"
+
+    @property
+    def units(self) -> str:
+        """
+        str : Isochoric specific heat capacity unit
+        """
+        return "[J/(kg*K)]"
+
+    @property
+    def long_name(self) -> str:
+        """
+        str : Isochoric specific heat capacity long name
+        """
+        return "isochoric specific heat capacity"
+
+
+class IsothermalCompressibilityInterface(DerivedPropertyInterface):
+    """
+    Liquid metal *isothermal compressibility* property abstract class,
+    i.e., :math:`\\beta_T = \\beta_s + T \\alpha^2 / (\\rho c_p)`.
+    """
+    def combine(self, T: float, rho: float, alpha: float, u_s: float,
+                cp: float) -> float:
+        """
+        Returns the value of the *isothermal compressibility* from the
+        values of the base properties, see
+        :func:`DerivedPropertyInterface.combine`.
+        """
+        return (1 + T * alpha * alpha * u_s * u_s / cp) / (rho * u_s * u_s)
+
+    @property
+    def name(self) -> str:
+        """
+        str : Name of the property
+        """
+        return "beta_T"
+
+    @property
+    def units(self) -> str:
+        """
+        str : Isothermal compressibility unit
+        """
+        return "[1/Pa]"
+
+    @property
+    def long_name(self) -> str:
+        """
+        str : Isothermal compressibility long name
+        """
+        return "isothermal compressibility"
+
+
+class GruneisenParameterInterface(DerivedPropertyInterface):
+    """
+    Liquid metal *Gruneisen parameter* property abstract class, i.e.,
+    :math:`\\gamma_G = \\alpha / (\\rho c_v \\beta_T) = \\alpha u_s^2 / c_p`.
+    """
+    def combine(self, T: float, rho: float, alpha: float, u_s: float,
+                cp: float) -> float:
+        """
+        Returns the value of the *Gruneisen parameter* from the
+        values of the base properties, see
+        :func:`DerivedPropertyInterface.combine`.
+        """
+        return alpha * u_s * u_s / cp
+
+    @property
+    def name(self) -> str:
+        """
+        str : Name of the property
+        """
+        return "gamma_G"
+
+    @property
+    def units(self) -> str:
+        """
+        str : Gruneisen parameter unit
+        """
+        return "[-]"
+
+    @property
+    def long_name(self) -> str:
+        """
+        str : Gruneisen parameter long name
+        """
+        return "Gruneisen parameter"
+
+
+class VolumetricHeatCapacityInterface(DerivedPropertyInterface):
+    """
+    Liquid metal *volumetric heat capacity* property abstract class, i.e.,
+    :math:`\\rho c_p`.
+    """
+    def combine(self, T: float, rho: float, alpha: float, u_s: float,
+                cp: float) -> float:
+        """
+        Returns the value of the *volumetric heat capacity* from the
+        values of the base properties, see
+        :func:`DerivedPropertyInterface.combine`.
+        """
+        return rho * cp
+
+    @property
+    def name(self) -> str:
+        """
+        str : Name of the property
+        """
+        return "rho_cp"
+
+    @property
+    def units(self) -> str:
+        """
+        str : Volumetric heat capacity unit
+        """
+        return "[J/(m^3*K)]"
+
+    @property
+    def long_name(self) -> str:
+        """
+        str : Volumetric heat capacity long name
+        """
+        return "volumetric heat capacity"
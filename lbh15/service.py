@@ -0,0 +1,317 @@
+"""Module with the local property service, i.e., an asyncio server
+evaluating liquid metal properties and computing temperatures on behalf
+of other processes running on the same node. The server listens on a
+Unix socket or on a localhost TCP port and exchanges newline-delimited
+JSON messages with :class:`lbh15.client.Client` and
+:class:`lbh15.client.AsyncClient`. Concurrent requests of the same kind,
+i.e., same operation, liquid metal, properties and correlations, that
+arrive within a small time window are coalesced into a single
+vectorized call of :mod:`lbh15.batch`."""
+import asyncio
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from .cli import METALS
+from . import batch
+
+# Supported operations
+OPERATIONS = {'evaluate', 'temperature'}
+
+
+class PropertyServer:
+    """
+    Asyncio server of the liquid metal properties. Requests are queued
+    by kind and each queue is flushed, by a single call of
+    :func:`lbh15.batch.evaluate` or :func:`lbh15.batch.temperature`,
+    when the time window elapses or when the number of queued values
+    exceeds the maximum batch size. If the coalesced call fails, the
+    requests are processed one by one, so that each error is reported
+    to the request that caused it only. Calls are run in the default
+    executor of the event loop, so that the server keeps accepting
+    requests meanwhile.
+
+    Parameters
+    ----------
+    path : str | None, optional
+        path of the Unix socket to listen on; if `None`, the server
+        listens on `host` and `port`. By default, `None`
+    host : str, optional
+        host to listen on, by default '127.0.0.1'
+    port : int, optional
+        port to listen on; if `0`, a free port is chosen. By default, `0`
+    window : float, optional
+        time window requests are coalesced within in :math:`[s]`,
+        by default `0.002`
+    max_batch_size : int, optional
+        number of queued values triggering the flush of a queue,
+        by default `1000000`
+    """
+    def __init__(self, path: Union[str, None] = None,
+                 host: str = '127.0.0.1', port: int = 0,
+                 window: float = 0.002, max_batch_size: int = 1000000):
+        if window < 0:
+            raise ValueError("Time window must be non-negative, "
+                             f"{window} was provided")
+        self.__path = path
+        self.__host = host
+        self.__port = port
+        self.__window = window
+        self.__max_batch_size = max_batch_size
+        self.__server: Union[asyncio.AbstractServer, None] = None
+        self.__queues: Dict[Tuple, List[Tuple[Dict[str, Any],
+                                              asyncio.Future]]] = {}
+        self.__queued_sizes: Dict[Tuple, int] = {}
+        self.__timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self.__running = set()
+        self.requests: int = 0
+        """Number of requests received"""
+        self.batches: int = 0
+        """Number of coalesced calls performed"""
+
+    async def __aenter__(self) -> "PropertyServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """
+        str | Tuple[str, int] : path of the Unix socket or host and port
+        the server listens on
+        """
+        if self.__path is not None:
+            return self.__path
+        return self.__server.sockets[0].getsockname()[:2]
+
+    async def start(self) -> None:
+        """
+        Starts listening.
+        """
+        if self.__path is not None:
+            self.__server = await asyncio.start_unix_server(
+                self.__handle, path=self.__path)
+        else:
+            self.__server = await asyncio.start_server(
+                self.__handle, host=self.__host, port=self.__port)
+
+    async def serve_forever(self) -> None:
+        """
+        Starts listening, if not yet done, and serves until cancelled.
+        """
+        if self.__server is None:
+            await self.start()
+        await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops listening and flushes the queued requests.
+        """
+        for key in list(self.__timers):
+            self.__timers.pop(key).cancel()
+            self.__flush(key)
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    async def __handle(self, reader: asyncio.StreamReader,
+                       writer: asyncio.StreamWriter) -> None:
+        """
+        Serves the requests of a connection. Requests are processed
+        concurrently and each response is sent as soon as it is ready.
+        """
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self.__respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            writer.close()
+
+    async def __respond(self, line: bytes,
+                        writer: asyncio.StreamWriter) -> None:
+        """
+        Processes a request and writes its response.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            response = {'id': request_id,
+                        'result': await self.__submit(request)}
+        except Exception as error:  # pylint: disable=broad-except
+            response = {'id': request_id,
+                        'error': f"{type(error).__name__}: {error}"}
+        writer.write(json.dumps(response).encode() + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    async def __submit(self, request: Dict[str, Any]) -> Any:
+        """
+        Queues the request and waits for its result.
+        """
+        self.requests += 1
+        key = _request_key(request)
+        size = int(np.size(request.get('T', request.get('values'))))
+        future = asyncio.get_running_loop().create_future()
+        self.__queues.setdefault(key, []).append((request, future))
+        self.__queued_sizes[key] = self.__queued_sizes.get(key, 0) + size
+        if self.__queued_sizes[key] >= self.__max_batch_size:
+            timer = self.__timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self.__flush(key)
+        elif key not in self.__timers:
+            self.__timers[key] = asyncio.get_running_loop().call_later(
+                self.__window, self.__flush, key)
+        return await future
+
+    def __flush(self, key: Tuple) -> None:
+        """
+        Runs the coalesced call of the queued requests of a kind.
+        """
+        self.__timers.pop(key, None)
+        self.__queued_sizes.pop(key, None)
+        items = self.__queues.pop(key, [])
+        if items:
+            self.batches += 1
+            task = asyncio.ensure_future(self.__run(key, items))
+            self.__running.add(task)
+            task.add_done_callback(self.__running.discard)
+
+    async def __run(self, key: Tuple,
+                    items: List[Tuple[Dict[str, Any], asyncio.Future]]
+                    ) -> None:
+        """
+        Computes the results of the requests in the default executor and
+        sets them to the corresponding futures.
+        """
+        requests = [request for request, _ in items]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, _compute, key, requests)
+        except Exception as error:  # pylint: disable=broad-except
+            results = [error] * len(items)
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def serve(path: Union[str, None] = None, host: str = '127.0.0.1',
+                port: int = 0, window: float = 0.002,
+                max_batch_size: int = 1000000) -> None:
+    """
+    Runs the property server until cancelled, see :class:`PropertyServer`
+    for the meaning of the arguments.
+    """
+    server = PropertyServer(path, host, port, window, max_batch_size)
+    await server.start()
+    print(f"lbh15: serving on {server.address}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def _request_key(request: Dict[str, Any]) -> Tuple:
+    """
+    Returns the key identifying the kind of the request, i.e., the
+    requests that can be coalesced together.
+    """
+    operation = request.get('op', 'evaluate')
+    if operation not in OPERATIONS:
+        raise ValueError(f"Operation must be one of {sorted(OPERATIONS)}, "
+                         f"'{operation}' was provided")
+    metal = request.get('metal', 'lead')
+    if metal not in METALS:
+        raise ValueError(f"Metal must be one of {sorted(METALS)}, "
+                         f"'{metal}' was provided")
+    correlations = tuple(sorted((request.get('correlations') or {})
+                                .items()))
+    if operation == 'evaluate':
+        names = request.get('properties')
+        if isinstance(names, list):
+            names = tuple(names)
+        if 'T' not in request:
+            raise ValueError("Temperature 'T' is missing")
+        return operation, metal, names, correlations
+    if 'property' not in request or 'values' not in request:
+        raise ValueError("Both 'property' and 'values' are needed to "
+                         "compute the temperature")
+    return (operation, metal, request['property'], correlations,
+            request.get('T_guess') is not None)
+
+
+def _compute(key: Tuple, requests: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Computes the results of requests of the same kind by a single call,
+    or one by one if the single call fails, so that the error of a
+    malformed or invalid request is returned to that request only.
+    """
+    try:
+        return _call(key, requests)
+    except Exception as error:  # pylint: disable=broad-except
+        if len(requests) == 1:
+            return [error]
+    results = []
+    for request in requests:
+        try:
+            results += _call(key, [request])
+        except Exception as error:  # pylint: disable=broad-except
+            results.append(error)
+    return results
+
+
+def _call(key: Tuple, requests: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Concatenates the values of the requests, performs the batch call
+    and splits its results among the requests.
+    """
+    operation, metal = key[0], METALS[key[1]]
+    correlations = dict(key[3])
+    variable = 'T' if operation == 'evaluate' else 'values'
+    shapes, columns = [], {variable: [], 'p': [], 'T_guess': []}
+    for request in requests:
+        values = np.asarray(request[variable], dtype=float)
+        p = np.asarray(request.get('p', atm), dtype=float)
+        arrays = [values, p]
+        if operation == 'temperature' and key[4]:
+            arrays.append(np.asarray(request['T_guess'], dtype=float))
+        arrays = np.broadcast_arrays(*arrays)
+        shapes.append(arrays[0].shape)
+        for name, array in zip([variable, 'p', 'T_guess'], arrays):
+            columns[name].append(array.ravel())
+    flat = {name: np.concatenate(arrays)
+            for name, arrays in columns.items() if arrays}
+    if operation == 'evaluate':
+        results = batch.evaluate(metal, key[2], flat['T'], flat['p'],
+                                 correlations)
+    else:
+        results = {'T': batch.temperature(metal, key[2], flat['values'],
+                                          flat['p'], flat.get('T_guess'),
+                                          correlations)}
+    split, start = [], 0
+    for shape in shapes:
+        stop = start + int(np.prod(shape))
+        split.append({name: array[start:stop].reshape(shape).tolist()
+                      for name, array in results.items()})
+        start = stop
+    return split
@@ -0,0 +1,278 @@
+"""Module with the evaluation of the liquid metal properties over arrays
+stored in shared memory, i.e., in blocks of
+:mod:`multiprocessing.shared_memory`, by a pool of worker processes.
+Producers write the temperature values into a shared array, the workers
+write the property values directly into shared output arrays, and only
+small descriptors of the arrays cross the process boundaries, so that
+no array is pickled."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+from typing import Union
+import numpy as np
+from numpy.typing import DTypeLike
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+
+class ArrayDescriptor(NamedTuple):
+    """
+    Picklable description of a shared array, allowing other processes
+    to attach to it.
+    """
+    name: str
+    """Name of the shared memory block"""
+    shape: Tuple[int, ...]
+    """Shape of the array"""
+    dtype: str
+    """Data type of the array"""
+
+
+class SharedArray:
+    """
+    Array stored in a shared memory block. Arrays are built by either
+    :meth:`create` or :meth:`attach`; the process creating the array is
+    in charge of releasing the block by :meth:`unlink` once all the
+    processes are done with it. Instances can be used as context
+    managers, closing the array, and unlinking it if created, at exit.
+
+    With Python versions older than 3.13, processes attaching to an
+    array should be started by the :mod:`multiprocessing` module of the
+    process that created it, since the block is otherwise released when
+    the first attached process exits.
+    """
+    def __init__(self, memory: SharedMemory, shape: Tuple[int, ...],
+                 dtype: DTypeLike, owner: bool):
+        self.__memory = memory
+        self.__owner = owner
+        self.__array = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+
+    @classmethod
+    def create(cls, shape: Union[int, Tuple[int, ...]],
+               dtype: DTypeLike = np.float64) -> "SharedArray":
+        """
+        Creates a new shared array, whose values are not initialized.
+
+        Parameters
+        ----------
+        shape : int | Tuple[int, ...]
+            shape of the array
+        dtype : DTypeLike, optional
+            data type of the array, by default `numpy.float64`
+
+        Returns
+        -------
+        SharedArray
+        """
+        shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        memory = SharedMemory(create=True, size=max(nbytes, 1))
+        return cls(memory, shape, dtype, True)
+
+    @classmethod
+    def attach(cls, descriptor: ArrayDescriptor) -> "SharedArray":
+        """
+        Attaches to an existing shared array.
+
+        Parameters
+        ----------
+        descriptor : ArrayDescriptor
+            descriptor of the array, see :attr:`descriptor`
+
+        Returns
+        -------
+        SharedArray
+        """
+        return cls(_open(descriptor.name), descriptor.shape,
+                   descriptor.dtype, False)
+
+    def __enter__(self) -> "SharedArray":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        if self.__owner:
+            self.unlink()
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        np.ndarray : view of the shared values
+        """
+        return self.__array
+
+    @property
+    def descriptor(self) -> ArrayDescriptor:
+        """
+        ArrayDescriptor : descriptor of the array
+        """
+        return ArrayDescriptor(self.__memory.name, self.__array.shape,
+                               self.__array.dtype.str)
+
+    def close(self) -> None:
+        """
+        Closes the access of the current process to the array. The
+        arrays returned by :attr:`array` must not be used afterwards.
+        """
+        self.__array = None
+        self.__memory.close()
+
+    def unlink(self) -> None:
+        """
+        Releases the shared memory block.
+        """
+        self.__memory.unlink()
+
+
+class SharedEvaluator:
+    """
+    Pool of worker processes evaluating the liquid metal properties over
+    shared arrays. Each call splits the arrays into contiguous chunks,
+    which are evaluated concurrently by the workers. Instances can be
+    used as context managers, shutting the pool down at exit.
+
+    Parameters
+    ----------
+    max_workers : int | None, optional
+        number of worker processes; if `None`, the number of processors
+        is adopted. By default, `None`
+    chunk_size : int, optional
+        maximum number of values evaluated by a task, by default
+        `262144`
+    """
+    def __init__(self, max_workers: Union[int, None] = None,
+                 chunk_size: int = 262144):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be strictly positive, "
+                             f"{chunk_size} was provided")
+        self.__max_workers = max_workers or os.cpu_count() or 1
+        self.__chunk_size = chunk_size
+        self.__executor = ProcessPoolExecutor(self.__max_workers)
+
+    def __enter__(self) -> "SharedEvaluator":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Shuts the pool of workers down.
+        """
+        self.__executor.shutdown()
+
+    def evaluate(self, metal: Type[LiquidMetalInterface],
+                 T: Union[SharedArray, ArrayDescriptor],
+                 out: Dict[str, Union[SharedArray, ArrayDescriptor]],
+                 p: Union[float, SharedArray, ArrayDescriptor] = atm,
+                 correlations: Union[Dict[str, str], None] = None) -> None:
+        """
+        Evaluates the properties over the shared temperature array,
+        writing them into the shared output arrays, see
+        :func:`lbh15.batch.evaluate`. The correlations in use are the
+        ones of the calling process, i.e., the ones set at class level
+        in it, unless otherwise specified.
+
+        Parameters
+        ----------
+        metal : Type[LiquidMetalInterface]
+            liquid metal class, e.g., :class:`.Lead`
+        T : SharedArray | ArrayDescriptor
+            shared array of the temperature values in :math:`[K]`
+        out : Dict[str, SharedArray | ArrayDescriptor]
+            shared output arrays keyed by the names of the properties to
+            evaluate, each one with the shape of `T`
+        p : float | SharedArray | ArrayDescriptor, optional
+            Pressure in :math:`[Pa]`, either a single value or a shared
+            array with the shape of `T`. By default, the atmospheric
+            pressure value, i.e., :math:`101325.0 Pa`
+        correlations : Dict[str, str] | None, optional
+            dictionary defining the correlation to use for the
+            corresponding property, by default `None`
+        """
+        T = _descriptor(T)
+        out = {name: _descriptor(array) for name, array in out.items()}
+        p = _descriptor(p) if isinstance(p, (SharedArray, ArrayDescriptor)) \
+            else float(p)
+        for descriptor in list(out.values()) + [p]:
+            if isinstance(descriptor, ArrayDescriptor) \
+                    and tuple(descriptor.shape) != tuple(T.shape):
+                raise ValueError("Shared arrays must have the shape of "
+                                 f"temperature, i.e., {T.shape}, "
+                                 f"{descriptor.shape} was provided")
+        objects = batch.property_objects(metal, list(out), correlations)
+        correlations = {name: obj.correlation_name
+                        for name, obj in objects.items()}
+        futures = [self.__executor.submit(_evaluate_chunk, metal, T, out, p,
+                                          correlations, start, stop)
+                   for start, stop in self.__chunks(int(np.prod(T.shape)))]
+        for future in futures:
+            future.result()
+
+    def __chunks(self, size: int) -> List[Tuple[int, int]]:
+        """
+        Returns the bounds of the chunks the flattened arrays are split
+        into, at least one per worker if enough values are available.
+        """
+        n_chunks = max(-(-size // self.__chunk_size),
+                       min(self.__max_workers, size), 1)
+        bounds = np.linspace(0, size, n_chunks + 1).astype(int)
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _descriptor(array: Union[SharedArray, ArrayDescriptor]
+                ) -> ArrayDescriptor:
+    """
+    Returns the descriptor of the shared array.
+    """
+    if isinstance(array, SharedArray):
+        return array.descriptor
+    if isinstance(array, ArrayDescriptor):
+        return array
+    raise ValueError("Shared arrays or their descriptors must be "
+                     f"provided, {type(array).__name__} was provided")
+
+
+def _open(name: str) -> SharedMemory:
+    """
+    Attaches to the shared memory block, without letting the resource
+    tracker of the current process release it, if supported.
+    """
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        return SharedMemory(name)
+
+
+def _evaluate_chunk(metal: Type[LiquidMetalInterface],
+                    T: ArrayDescriptor, out: Dict[str, ArrayDescriptor],
+                    p: Union[float, ArrayDescriptor],
+                    correlations: Dict[str, str], start: int,
+                    stop: int) -> None:
+    """
+    Evaluates the properties over a chunk of the flattened shared arrays,
+    run by the worker processes. Blocks are attached for the duration of
+    the task only, so that workers do not keep the released ones alive.
+    """
+    descriptors = dict(out, __T=T)
+    if isinstance(p, ArrayDescriptor):
+        descriptors['__p'] = p
+    memories = {name: _open(descriptor.name)
+                for name, descriptor in descriptors.items()}
+    try:
+        chunks = {name: np.ndarray((int(np.prod(descriptor.shape)),),
+                                   dtype=descriptor.dtype,
+                                   buffer=memories[name].buf)[start:stop]
+                  for name, descriptor in descriptors.items()}
+        batch.evaluate(metal, list(out), chunks.pop('__T'),
+                       chunks.pop('__p', p), correlations, out=chunks)
+    finally:
+        chunks = None
+        for memory in memories.values():
+            memory.close()
@@ -0,0 +1,184 @@
+"""Module with the structured NumPy records storing the state of the
+liquid metal, i.e., temperature, pressure and property values, as
+returned by :meth:`lbh15._lbh15.LiquidMetalInterface.snapshot` and by
+:func:`lbh15.batch.snapshot`. Units, long names and correlations of the
+fields are stored in the metadata of the record data type. Records can
+be appended to a growing log and serialized to a binary file."""
+import json
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import Tuple
+from typing import Union
+import numpy as np
+from numpy.typing import DTypeLike
+from .properties.interface import PropertyInterface
+
+# Units and long names of the fields that are not properties
+_STATE_FIELDS = {'T': ('[K]', 'temperature'), 'p': ('[Pa]', 'pressure')}
+
+
+def record_dtype(property_objects: Dict[str, PropertyInterface],
+                 dtype: DTypeLike = np.float64) -> np.dtype:
+    """
+    Returns the structured data type of the records storing temperature,
+    pressure and the values of the properties passed as argument. Its
+    metadata store the units, the long names and the correlations of the
+    fields, keyed by field name, as 'units', 'long_names' and
+    'correlations' dictionaries respectively.
+
+    Parameters
+    ----------
+    property_objects : Dict[str, PropertyInterface]
+        property objects keyed by property name
+    dtype : DTypeLike, optional
+        floating point data type of the fields, by default
+        `numpy.float64`
+
+    Returns
+    -------
+    np.dtype
+    """
+    return _record_dtype(tuple((name, obj.units, obj.long_name,
+                                obj.correlation_name)
+                               for name, obj in property_objects.items()),
+                         np.dtype(dtype).str)
+
+
+@lru_cache(maxsize=64)
+def _record_dtype(fields: Tuple[Tuple[str, str, str, str], ...],
+                  dtype: str) -> np.dtype:
+    """
+    Builds the structured data type from the field descriptions, which
+    are hashable so that the data type is built once.
+    """
+    metadata = {'units': {}, 'long_names': {}, 'correlations': {}}
+    for name, (units, long_name) in _STATE_FIELDS.items():
+        metadata['units'][name] = units
+        metadata['long_names'][name] = long_name
+    for name, units, long_name, corr_name in fields:
+        metadata['units'][name] = units
+        metadata['long_names'][name] = long_name
+        metadata['correlations'][name] = corr_name
+    return np.dtype([(name, dtype) for name in metadata['units']],
+                    metadata=metadata)
+
+
+class SnapshotLog:
+    """
+    Log of records, e.g., one per time step, stored in a preallocated
+    structured array whose capacity is doubled when full, so that
+    appending a record costs a copy of its values only.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        structured data type of the records, e.g., the one of a
+        snapshot or the one returned by :func:`record_dtype`
+    capacity : int, optional
+        number of records initially allocated, by default `1024`
+    """
+    def __init__(self, dtype: np.dtype, capacity: int = 1024):
+        if dtype.names is None:
+            raise ValueError("Structured data type must be provided, "
+                             f"{dtype} was provided")
+        self.__data = np.empty(max(capacity, 1), dtype=dtype)
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    @property
+    def records(self) -> np.ndarray:
+        """
+        np.ndarray : view of the appended records
+        """
+        return self.__data[:self.__size]
+
+    @property
+    def capacity(self) -> int:
+        """
+        int : number of records allocated
+        """
+        return len(self.__data)
+
+    def append(self, records: np.ndarray) -> None:
+        """
+        Appends a record, i.e., a snapshot, or an array of records,
+        whose fields must match the ones of the log.
+
+        Parameters
+        ----------
+        records : np.ndarray
+            record or array of records
+        """
+        if records.dtype.names != self.__data.dtype.names:
+            raise ValueError("Record fields must be "
+                             f"{self.__data.dtype.names}, "
+                             f"{records.dtype.names} were provided")
+        size = self.__size + records.size
+        if size > len(self.__data):
+            data = np.empty(max(size, 2 * len(self.__data)),
+                            dtype=self.__data.dtype)
+            data[:self.__size] = self.__data[:self.__size]
+            self.__data = data
+        self.__data[self.__size:size] = records.ravel()
+        self.__size = size
+
+    def save(self, file: Union[str, IO]) -> None:
+        """
+        Writes the appended records to a binary file, see :func:`save`.
+
+        Parameters
+        ----------
+        file : str | IO
+            file name or binary file object
+        """
+        save(file, self.records)
+
+
+def save(file: Union[str, IO], records: np.ndarray) -> None:
+    """
+    Writes the records, together with the metadata of their data type,
+    to a binary file in NumPy `.npz` format.
+
+    Parameters
+    ----------
+    file : str | IO
+        file name or binary file object
+    records : np.ndarray
+        record or array of records
+    """
+    metadata = records.dtype.metadata or {}
+    np.savez(file, records=records,
+             metadata=np.array(json.dumps(_plain(metadata))))
+
+
+def load(file: Union[str, IO]) -> np.ndarray:
+    """
+    Reads the records written by :func:`save`, restoring the metadata of
+    their data type.
+
+    Parameters
+    ----------
+    file : str | IO
+        file name or binary file object
+
+    Returns
+    -------
+    np.ndarray
+    """
+    with np.load(file, allow_pickle=False) as data:
+        records = data['records']
+        metadata = json.loads(str(data['metadata']))
+    return records.view(np.dtype(records.dtype, metadata=metadata))
+
+
+def _plain(metadata: Any) -> Any:
+    """
+    Converts the metadata into JSON serializable dictionaries.
+    """
+    if hasattr(metadata, 'items'):
+        return {key: _plain(value) for key, value in metadata.items()}
+    return metadata
@@ -0,0 +1,261 @@
+"""Module with the columnar table of the liquid metal properties over a
+temperature (and pressure) axis. Property columns are computed at their
+first access only, then cached and returned as read-only views, so that
+tables built for reports or solver inputs never compute the properties
+that are not used."""
+import copy
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from .properties.interface import PropertyInterface
+from .snapshot import record_dtype
+from . import batch
+
+
+class PropertyTable:
+    """
+    Table of the liquid metal properties over a one-dimensional axis of
+    temperature values, with pressure being either a single value or
+    one value per temperature. Columns are accessed by name, i.e., 'T',
+    'p' or the name of a property, e.g., `table['rho']`; property
+    columns are computed at first access and cached. Columns are stored
+    in buffers whose capacity is doubled when full, so that appending
+    temperature values is cheap, and only the cached columns are
+    extended, by evaluating the new values only.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T : float | np.ndarray
+        Temperature in :math:`[K]`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`, i.e., the ones set at class level
+        when the table is built
+    """
+    def __init__(self, metal: Type[LiquidMetalInterface],
+                 T: Union[float, np.ndarray],
+                 p: Union[float, np.ndarray] = atm,
+                 correlations: Union[Dict[str, str], None] = None):
+        T, p = _axis(metal, T, p)
+        self.__metal = metal
+        self.__objects = batch.property_objects(metal, None, correlations)
+        self.__T = T.copy()
+        self.__p = p.copy()
+        self.__size = len(T)
+        self.__columns: Dict[str, np.ndarray] = {}
+        self.__sorted = bool(np.all(T[1:] >= T[:-1]))
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __contains__(self, name: str) -> bool:
+        return name in ('T', 'p') or name in self.__objects
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == 'T':
+            return _view(self.__T, self.__size)
+        if name == 'p':
+            return _view(self.__p, self.__size)
+        if name not in self.__objects:
+            raise KeyError(f"'{name}' property not found for "
+                           f"{self.__metal.__name__}")
+        if name not in self.__columns:
+            column = np.empty(len(self.__T))
+            self.__evaluate(name, column, 0)
+            self.__columns[name] = column
+        return _view(self.__columns[name], self.__size)
+
+    @property
+    def metal(self) -> Type[LiquidMetalInterface]:
+        """
+        Type[LiquidMetalInterface] : liquid metal class
+        """
+        return self.__metal
+
+    @property
+    def names(self) -> List[str]:
+        """
+        List[str] : names of the available columns, i.e., temperature,
+        pressure and the available properties
+        """
+        return ['T', 'p'] + list(self.__objects)
+
+    @property
+    def computed(self) -> List[str]:
+        """
+        List[str] : names of the property columns computed so far
+        """
+        return list(self.__columns)
+
+    @property
+    def units(self) -> Dict[str, str]:
+        """
+        Dict[str, str] : units of the columns keyed by column name
+        """
+        return dict(record_dtype(self.__objects).metadata['units'])
+
+    @property
+    def long_names(self) -> Dict[str, str]:
+        """
+        Dict[str, str] : long names of the columns keyed by column name
+        """
+        return dict(record_dtype(self.__objects).metadata['long_names'])
+
+    @property
+    def property_objects(self) -> Dict[str, PropertyInterface]:
+        """
+        Dict[str, PropertyInterface] : property objects keyed by property
+        name, implementing the correlations adopted by the table
+        """
+        return dict(self.__objects)
+
+    def select(self, T_min: float = -np.inf,
+               T_max: float = np.inf) -> "PropertyTable":
+        """
+        Returns the table restricted to the temperature values between
+        `T_min` and `T_max`, both included. If the temperature values
+        are sorted, the returned table shares the values of the cached
+        columns by views, found by binary search; otherwise, the values
+        are copied.
+
+        Parameters
+        ----------
+        T_min : float, optional
+            minimum temperature in :math:`[K]`, by default no minimum
+        T_max : float, optional
+            maximum temperature in :math:`[K]`, by default no maximum
+
+        Returns
+        -------
+        PropertyTable
+        """
+        T = self.__T[:self.__size]
+        if self.__sorted:
+            index = slice(np.searchsorted(T, T_min, 'left'),
+                          np.searchsorted(T, T_max, 'right'))
+        else:
+            index = np.flatnonzero((T >= T_min) & (T <= T_max))
+        table = copy.copy(self)
+        table.__T = T[index]
+        table.__p = self.__p[:self.__size][index]
+        table.__size = len(table.__T)
+        table.__columns = {name: column[:self.__size][index]
+                           for name, column in self.__columns.items()}
+        return table
+
+    def append(self, T: Union[float, np.ndarray],
+               p: Union[float, np.ndarray] = atm) -> None:
+        """
+        Appends temperature values, evaluating the cached columns only
+        over the appended values. Views returned before appending do not
+        include the appended values.
+
+        Parameters
+        ----------
+        T : float | np.ndarray
+            Temperature in :math:`[K]`
+        p : float | np.ndarray, optional
+            Pressure in :math:`[Pa]`, by default the atmospheric pressure
+            value, i.e., :math:`101325.0 Pa`
+        """
+        T, p = _axis(self.__metal, T, p)
+        start, stop = self.__size, self.__size + len(T)
+        if stop > len(self.__T):
+            capacity = max(stop, 2 * len(self.__T))
+            self.__T = _grow(self.__T, start, capacity)
+            self.__p = _grow(self.__p, start, capacity)
+            for name, column in self.__columns.items():
+                self.__columns[name] = _grow(column, start, capacity)
+        if start > 0 and len(T) > 0:
+            self.__sorted = self.__sorted and bool(
+                T[0] >= self.__T[start - 1] and np.all(T[1:] >= T[:-1]))
+        self.__T[start:stop] = T
+        self.__p[start:stop] = p
+        self.__size = stop
+        for name, column in self.__columns.items():
+            self.__evaluate(name, column, start)
+
+    def to_records(self, properties: Union[List[str], None] = None
+                   ) -> np.ndarray:
+        """
+        Returns the table as a structured array of records, see
+        :func:`lbh15.batch.snapshot`, computing the missing columns.
+
+        Parameters
+        ----------
+        properties : List[str] | None, optional
+            names of the properties to include; if `None`, the computed
+            ones are included. By default, `None`
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if properties is None:
+            properties = self.computed
+        objects = {name: self.__objects[name] for name in properties}
+        records = np.empty(self.__size, dtype=record_dtype(objects))
+        for name in records.dtype.names:
+            records[name] = self[name]
+        return records
+
+    def __evaluate(self, name: str, column: np.ndarray, start: int) -> None:
+        """
+        Evaluates the property over the temperature values from `start`
+        on, writing the values into the column.
+        """
+        if start == self.__size:
+            return
+        batch.evaluate(self.__metal, name, self.__T[start:self.__size],
+                       self.__p[start:self.__size],
+                       {name: self.__objects[name].correlation_name},
+                       out=column[start:self.__size])
+
+
+def _axis(metal: Type[LiquidMetalInterface], T: Union[float, np.ndarray],
+          p: Union[float, np.ndarray]) -> List[np.ndarray]:
+    """
+    Checks the temperature and pressure values, returning them as
+    one-dimensional arrays of the same length.
+    """
+    T, p = batch.as_arrays(np.atleast_1d(T), p, np.float64)
+    if T.ndim != 1:
+        raise ValueError("Temperature must be a one-dimensional array, "
+                         f"{T.ndim} dimensions were provided")
+    if p.ndim > 1 or (p.ndim == 1 and len(p) != len(T)):
+        raise ValueError("Pressure must be a single value or one value per "
+                         f"temperature, {p.shape} shape was provided")
+    batch.check_temperature(metal, T)
+    return [T, np.broadcast_to(p, T.shape)]
+
+
+def _view(buffer: np.ndarray, size: int) -> np.ndarray:
+    """
+    Returns the read-only view of the first `size` values of the buffer.
+    """
+    view = buffer[:size]
+    view.flags.writeable = False
+    return view
+
+
+def _grow(buffer: np.ndarray, size: int, capacity: int) -> np.ndarray:
+    """
+    Returns a buffer with the given capacity storing the first `size`
+    values of the one passed as argument.
+    """
+    grown = np.empty(capacity, dtype=buffer.dtype)
+    grown[:size] = buffer[:size]
+    return grown
@@ -0,0 +1,135 @@
+"""Module with the functions integrating in time the heat balance
+equation of liquid metal volumes, i.e.,
+:math:`\\rho c_p \\, dT/dt = Q_{in} + Q_{out}`, for a single lumped
+volume or for many nodes at once."""
+from typing import Dict
+from typing import NamedTuple
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from . import batch
+
+
+class TransientResult(NamedTuple):
+    """
+    Time series computed by :func:`integrate`.
+    """
+    time: np.ndarray
+    """Time instants in :math:`[s]`"""
+    T: np.ndarray
+    """Temperature in :math:`[K]`; the first axis runs over time, the
+    remaining ones over the nodes"""
+    iterations: np.ndarray
+    """Number of Newton iterations performed at each time step"""
+
+
+def integrate(metal: Type[LiquidMetalInterface],
+              T0: Union[float, np.ndarray], time: np.ndarray,
+              Qin: Union[float, np.ndarray],
+              Qout: Union[float, np.ndarray] = 0.0,
+              p: Union[float, np.ndarray] = atm,
+              correlations: Union[Dict[str, str], None] = None,
+              xtol: float = 1e-10, max_iter: int = 50) -> TransientResult:
+    """
+    Integrates in time the heat balance equation
+    :math:`\\rho c_p \\, dT/dt = Q_{in} + Q_{out}` of one or more
+    liquid metal volumes. The time derivative is discretized by the
+    backward Euler scheme with the heat capacity per unit volume,
+    :math:`\\rho c_p`, evaluated at the mean temperature of the time step.
+    The resulting equations are solved by Newton iterations performed on
+    all the nodes at once, exploiting the analytic derivative of
+    :math:`\\rho c_p` with respect to the temperature.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    T0 : float | np.ndarray
+        Initial temperature of the nodes in :math:`[K]`
+    time : np.ndarray
+        Increasing time instants in :math:`[s]`, the first one
+        corresponding to the initial condition
+    Qin : float | np.ndarray
+        Heat load in :math:`[W/m^3]`. Either a scalar, or an array whose
+        first axis runs over the time instants and whose remaining axes
+        are broadcastable against `T0`. The value at each time instant
+        is applied to the time step ending at that instant
+    Qout : float | np.ndarray, optional
+        Dissipated heat power in :math:`[W/m^3]`, negative if removed
+        from the volume, with the same layout of `Qin`. By default, `0.0`
+    p : float | np.ndarray, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    correlations : Dict[str, str] | None, optional
+        dictionary defining the correlation to use for the corresponding
+        property, by default `None`
+    xtol : float, optional
+        Relative tolerance on the temperature increment of the Newton
+        iterations, by default `1e-10`
+    max_iter : int, optional
+        Maximum number of Newton iterations per time step, by default `50`
+
+    Returns
+    -------
+    TransientResult
+    """
+    time = np.asarray(time, dtype=float)
+    T0 = np.asarray(T0, dtype=float)
+    p = np.asarray(p, dtype=float)
+    batch.check_temperature(metal, T0)
+    objects = batch.property_objects(metal, ['rho', 'cp'], correlations)
+    rho, cp = objects['rho'], objects['cp']
+    source = _history(Qin, time, T0) + _history(Qout, time, T0)
+
+    T = np.empty((len(time),) + T0.shape)
+    T[0] = T0
+    iterations = np.zeros(len(time) - 1, dtype=int)
+    for i, delta_t in enumerate(np.diff(time)):
+        T_old = T[i]
+        # Explicit predictor
+        T_new = T_old + delta_t * source[i + 1] \
+            / (rho.correlation(T_old, p) * cp.correlation(T_old, p))
+        for it in range(1, max_iter + 1):
+            T_avg = (T_old + T_new) / 2
+            rho_val = rho.correlation(T_avg, p)
+            cp_val = cp.correlation(T_avg, p)
+            capacity = rho_val * cp_val
+            d_capacity = rho.derivative(T_avg, p) * cp_val \
+                + rho_val * cp.derivative(T_avg, p)
+            residual = capacity * (T_new - T_old) / delta_t \
+                - source[i + 1]
+            jacobian = (capacity + d_capacity * (T_new - T_old) / 2) \
+                / delta_t
+            increment = residual / jacobian
+            T_new = T_new - increment
+            if np.all(np.abs(increment) <= xtol * np.abs(T_new)):
+                break
+        else:
+            raise RuntimeError("Error when integrating heat balance "
+                               f"equation from time = {time[i]} s to "
+                               f"time = {time[i + 1]} s. Newton iterations "
+                               f"did not converge within {max_iter} "
+                               "iterations")
+        T[i + 1] = T_new
+        iterations[i] = it
+    batch.check_temperature(metal, T)
+    return TransientResult(time, T, iterations)
+
+
+def _history(Q: Union[float, np.ndarray], time: np.ndarray,
+             T0: np.ndarray) -> np.ndarray:
+    """
+    Broadcasts the heat source time history to the (time, nodes) shape.
+    """
+    Q = np.asarray(Q, dtype=float)
+    shape = (len(time),) + T0.shape
+    if Q.ndim == 0:
+        return np.broadcast_to(Q, shape)
+    if Q.shape[0] != len(time):
+        raise ValueError("Heat source time history must have "
+                         f"{len(time)} values along the first axis, "
+                         f"{Q.shape[0]} were provided")
+    Q = Q.reshape(Q.shape + (1,) * (T0.ndim + 1 - Q.ndim))
+    return np.broadcast_to(Q, shape)
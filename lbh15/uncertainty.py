@@ -0,0 +1,229 @@
+"""Module with the functions propagating the uncertainty on temperature
+and on the choice of the property correlations into the liquid metal
+properties and into the quantities derived from them, by means of the
+Monte Carlo method."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Sequence
+from typing import Type
+from typing import Union
+import numpy as np
+from scipy.constants import atm
+from ._lbh15 import LiquidMetalInterface
+from .properties.interface import PropertyInterface
+from . import batch
+
+# Temperature distributions that can be sampled, i.e., the
+# corresponding methods of numpy.random.Generator
+DISTRIBUTIONS: List[str] = ['normal', 'uniform', 'triangular']
+
+
+class UncertaintyResult(NamedTuple):
+    """
+    Samples of the propagated quantity and their statistics, computed
+    along the first axis, i.e., the one running over the samples.
+    """
+    samples: np.ndarray
+    """Values of the quantity for each sample"""
+    mean: np.ndarray
+    """Mean value of the quantity"""
+    std: np.ndarray
+    """Standard deviation of the quantity"""
+    percentiles: Dict[float, np.ndarray]
+    """Percentiles of the quantity, keyed by the required percentage"""
+
+
+def sample_temperature(rng: np.random.Generator, distribution: str,
+                       size: int, **params) -> np.ndarray:
+    """
+    Samples the temperature from the required distribution.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        random number generator
+    distribution : str
+        name of the distribution, i.e., one of 'normal' (parameters `loc`
+        and `scale`), 'uniform' (parameters `low` and `high`) and
+        'triangular' (parameters `left`, `mode` and `right`)
+    size : int
+        number of samples
+    **params : dict
+        parameters of the distribution in :math:`[K]`. Arrays can be
+        provided for sampling a temperature field, in which case the
+        samples have shape `(size,) + field shape`
+
+    Returns
+    -------
+    np.ndarray
+        Temperature samples in :math:`[K]`
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution must be one of {DISTRIBUTIONS}, "
+                         f"'{distribution}' was provided")
+    shape = np.broadcast_shapes(*[np.shape(v) for v in params.values()])
+    return getattr(rng, distribution)(size=(size,) + shape, **params)
+
+
+def sample_correlations(rng: np.random.Generator, n_correlations: int,
+                        size: int,
+                        weights: Union[Sequence[float], None] = None
+                        ) -> np.ndarray:
+    """
+    Samples the index of the correlation to use for each sample.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        random number generator
+    n_correlations : int
+        number of candidate correlations
+    size : int
+        number of samples
+    weights : Sequence[float] | None, optional
+        probability of each correlation; if `None`, all the correlations
+        are equally probable. By default, `None`
+
+    Returns
+    -------
+    np.ndarray
+        indices of the sampled correlations
+    """
+    if weights is None:
+        return rng.integers(n_correlations, size=size)
+    return rng.choice(n_correlations, size=size, p=weights)
+
+
+def propagate(metal: Type[LiquidMetalInterface],
+              properties: Union[str, List[str]], n_samples: int,
+              T_distribution: str,
+              T_params: Dict[str, Union[float, np.ndarray]],
+              function: Union[Callable[[Dict[str, np.ndarray]],
+                                       np.ndarray], None] = None,
+              correlations: Union[Dict[str, List[str]], None] = None,
+              p: float = atm, seed: Union[int, None] = None,
+              q: Sequence[float] = (5, 50, 95), chunk_size: int = 2**18,
+              workers: Union[int, None] = None) -> UncertaintyResult:
+    """
+    Propagates the uncertainty on temperature and on the choice of the
+    property correlations into the quantity computed from the properties.
+    Samples are processed in chunks of fixed size, each one with its own
+    random stream spawned from `seed`, so that results are reproducible
+    whatever the number of workers. Chunks are evaluated in parallel by a
+    pool of threads, as *numpy* releases the GIL while operating
+    on large arrays.
+
+    Parameters
+    ----------
+    metal : Type[LiquidMetalInterface]
+        liquid metal class, e.g., :class:`.Lead`
+    properties : str | List[str]
+        name(s) of the property(ies) the quantity is computed from
+    n_samples : int
+        number of samples
+    T_distribution : str
+        temperature distribution, see :func:`sample_temperature`
+    T_params : Dict[str, float | np.ndarray]
+        parameters of the temperature distribution,
+        see :func:`sample_temperature`
+    function : Callable | None, optional
+        function computing the quantity from the dictionary of the
+        property values; if `None`, the only required property is
+        returned. By default, `None`
+    correlations : Dict[str, List[str]] | None, optional
+        candidate correlations of each property, among which the one to
+        use is sampled uniformly for each sample. Properties not
+        specified here consider all their available correlations.
+        By default, `None`
+    p : float, optional
+        Pressure in :math:`[Pa]`, by default the atmospheric pressure
+        value, i.e., :math:`101325.0 Pa`
+    seed : int | None, optional
+        seed of the random streams, by default `None`
+    q : Sequence[float], optional
+        percentages of the percentiles to compute, by default
+        `(5, 50, 95)`
+    chunk_size : int, optional
+        number of samples per chunk, by default `2**18`
+    workers : int | None, optional
+        maximum number of threads; if `None`, the default of
+        :class:`concurrent.futures.ThreadPoolExecutor` is adopted.
+        By default, `None`
+
+    Returns
+    -------
+    UncertaintyResult
+    """
+    if n_samples < 1:
+        raise ValueError("Number of samples must be strictly positive, "
+                         f"{n_samples} was provided")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be strictly positive, "
+                         f"{chunk_size} was provided")
+    if isinstance(properties, str):
+        properties = [properties]
+    if function is None:
+        if len(properties) != 1:
+            raise ValueError("A function is needed for computing the "
+                             "quantity from more than one property")
+        name = properties[0]
+
+        def function(values: Dict[str, np.ndarray]) -> np.ndarray:
+            return values[name]
+
+    candidates = _candidates(metal, properties, correlations)
+    T_m0, T_b0 = batch.liquid_range(metal)
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    def run_chunk(seed_seq: np.random.SeedSequence,
+                  size: int) -> np.ndarray:
+        rng = np.random.default_rng(seed_seq)
+        T = sample_temperature(rng, T_distribution, size, **T_params)
+        if np.any((T <= T_m0) | (T >= T_b0)):
+            batch.check_temperature(metal, T)
+        values = {}
+        for prop_name, objects in candidates.items():
+            if len(objects) == 1:
+                values[prop_name] = batch.apply(objects[0], T,
+                                                np.asarray(p))
+                continue
+            choice = sample_correlations(rng, len(objects), size)
+            values[prop_name] = np.empty(T.shape)
+            for index, obj in enumerate(objects):
+                selected = choice == index
+                values[prop_name][selected] = \
+                    batch.apply(obj, T[selected], np.asarray(p))
+        return np.asarray(function(values), dtype=float)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        samples = np.concatenate(list(executor.map(run_chunk, seeds,
+                                                   sizes)))
+    return UncertaintyResult(samples, np.mean(samples, axis=0),
+                             np.std(samples, axis=0),
+                             dict(zip(q, np.percentile(samples, q, axis=0))))
+
+
+def _candidates(metal: Type[LiquidMetalInterface], properties: List[str],
+                correlations: Union[Dict[str, List[str]], None]
+                ) -> Dict[str, List[PropertyInterface]]:
+    """
+    Returns the candidate property objects of each property.
+    """
+    correlations = correlations or {}
+    candidates = {}
+    for name in properties:
+        available = batch.property_correlations(metal, name)
+        corr_names = correlations.get(name, list(available))
+        not_found = [c for c in corr_names if c not in available]
+        if len(not_found) > 0:
+            raise ValueError(f"'{name}' property implementing "
+                             f"'{not_found}' correlations not among "
+                             "the available ones")
+        candidates[name] = [available[c] for c in corr_names]
+    return candidates
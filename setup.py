@@ -40,6 +40,7 @@ if __name__ == '__main__':
         python_requires='>=3.8.10',
         install_requires=['scipy>=1.8.1', 'numpy>=1.22.3', 'sphinx>=6.2.1',
                           'sphinx-rtd-theme>=1.3.0', 'myst-parser>=1.0.0', 'sphinxcontrib-bibtex>=2.5.0'],
+        entry_points={'console_scripts': ['lbh15 = lbh15.cli:main']},
         classifiers=[
             "Development Status :: 5 - Production/Stable",
             "Intended Audience :: Education",
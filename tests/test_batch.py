@@ -0,0 +1,270 @@
+# This test is used to check the batch evaluation of the properties
+# against the values returned by the liquid metal instances
+import unittest
+import sys
+import os
+import warnings
+import tracemalloc
+import numpy as np
+from scipy.constants import atm
+from scipy.integrate import quad
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import Bismuth
+from lbh15 import batch
+from lbh15.properties.interface import PropertyInterface
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+Ts = np.linspace(700.0, 1300.0, 13)
+
+
+class BatchTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        for metal in [Lead, LBE, Bismuth]:
+            values = batch.evaluate(metal, None, Ts)
+            for i, T in enumerate(Ts):
+                liquid_metal = metal(T=T)
+                for name, array in values.items():
+                    self.assertAlmostEqual(
+                        array[i] / getattr(liquid_metal, name), 1.0, tol,
+                        f"{metal.__name__}.{name} FAILED")
+
+    def test_correlations(self):
+        values = batch.evaluate(Lead, 'cp', Ts,
+                                correlations={'cp': 'gurvich1991'})
+        Lead.set_correlation_to_use('cp', 'gurvich1991')
+        ref = [Lead(T=T).cp for T in Ts]
+        Lead.set_correlation_to_use('cp', 'sobolev2011')
+        np.testing.assert_allclose(values['cp'], ref, rtol=1e-12)
+
+    def test_shape(self):
+        T = Ts.reshape(13, 1)
+        p = np.array([1e5, 2e5, 3e5])
+        values = batch.evaluate(Lead, ['rho', 'k'], T, p)
+        self.assertEqual(values['rho'].shape, (13, 3))
+        self.assertEqual(values['k'].shape, (13, 3))
+
+    def test_derivatives(self):
+        for metal in [Lead, LBE, Bismuth]:
+            values = batch.derivatives(metal, ['rho', 'cp', 'h', 'mu'], Ts,
+                                       p=5e6)
+            delta = 1e-3
+            upper = batch.evaluate(metal, ['rho', 'cp', 'h', 'mu'],
+                                   Ts + delta, p=5e6)
+            lower = batch.evaluate(metal, ['rho', 'cp', 'h', 'mu'],
+                                   Ts - delta, p=5e6)
+            for name, array in values.items():
+                np.testing.assert_allclose(
+                    array, (upper[name] - lower[name]) / 2 / delta,
+                    rtol=1e-6, err_msg=f"{metal.__name__}.{name} FAILED")
+
+    def test_temperature(self):
+        for metal in [Lead, LBE, Bismuth]:
+            for name in ['h', 'rho', 'mu', 'p_s']:
+                values = batch.evaluate(metal, name, Ts)[name]
+                T = batch.temperature(metal, name, values)
+                for i, value in enumerate(values):
+                    self.assertAlmostEqual(
+                        T[i], metal(**{name: value}).T, tol,
+                        metal.__name__ + " " + name + " FAILED")
+                T_new = batch.temperature(metal, name, values * 1.0001,
+                                          T_guess=T)
+                np.testing.assert_allclose(
+                    batch.evaluate(metal, name, T_new)[name],
+                    values * 1.0001, rtol=1e-9)
+        self.assertRaises(ValueError, batch.temperature, Lead, 'rho', 10801.0)
+
+    def test_temperature_fallback(self):
+        T_ref = np.linspace(650.0, 1900.0, 50)
+        for name in ['h', 'rho', 'mu', 'p_s']:
+            values = batch.evaluate(Lead, name, T_ref)[name]
+            for kwargs in [{'max_iter': 1}, {'T_guess': 3000.0}]:
+                T = batch.temperature(Lead, name, values, **kwargs)
+                np.testing.assert_allclose(T, T_ref, rtol=1e-9,
+                                           err_msg=f"{name} {kwargs}")
+        for T_ref in [700.0, 1500.0]:
+            value = batch.evaluate(Lead, 'cp', T_ref)['cp']
+            self.assertAlmostEqual(
+                batch.temperature(Lead, 'cp', value, max_iter=1) / T_ref,
+                1.0, tol)
+        self.assertRaises(RuntimeError, batch.temperature, Lead, 'p_s',
+                          1e12, max_iter=2)
+
+    def test_out(self):
+        names = ['rho', 'alpha', 'u_s', 'cp', 'mu', 'k', 'h']
+        p = np.linspace(1e5, 1e7, len(Ts))
+        for metal in [Lead, LBE, Bismuth]:
+            for pressure in [atm, p]:
+                ref = batch.evaluate(metal, names, Ts, pressure)
+                out = {name: np.empty(Ts.shape) for name in names}
+                values = batch.evaluate(metal, names, Ts, pressure, out=out)
+                for name in names:
+                    self.assertIs(values[name], out[name])
+                    np.testing.assert_allclose(out[name], ref[name],
+                                               rtol=1e-14)
+        out = np.empty(Ts.shape)
+        batch.evaluate(Lead, 'cp', Ts, correlations={'cp': 'gurvich1991'},
+                       out=out)
+        np.testing.assert_allclose(
+            out, batch.evaluate(Lead, 'cp', Ts,
+                                correlations={'cp': 'gurvich1991'})['cp'],
+            rtol=1e-14)
+        self.assertRaises(ValueError, batch.evaluate, Lead, ['rho', 'k'],
+                          Ts, out=out)
+        self.assertRaises(ValueError, batch.evaluate, Lead, ['rho', 'k'],
+                          Ts, out={'rho': out})
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'rho', Ts,
+                          out=np.empty(3))
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'rho', out,
+                          out=out)
+
+    def test_out_no_allocation(self):
+        T = np.linspace(700.0, 1300.0, 100000)
+        names = ['rho', 'cp', 'k', 'mu']
+        out = {name: np.empty(T.shape) for name in names}
+        pool = batch.ScratchPool()
+        batch.evaluate(LBE, names, T, 2e5, out=out, pool=pool)
+        tracemalloc.start()
+        batch.evaluate(LBE, names, T, 2e5, out=out, pool=pool)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.assertLess(peak, T.nbytes / 10)
+        self.assertGreater(pool.nbytes, 0)
+        pool.clear()
+        self.assertEqual(pool.nbytes, 0)
+
+    def test_float32(self):
+        T = np.linspace(700.0, 1300.0, 1000)
+        for metal in [Lead, LBE, Bismuth]:
+            ref = batch.evaluate(metal, None, T, 2e5)
+            values = batch.evaluate(metal, None, T.astype(np.float32), 2e5)
+            for name, array in values.items():
+                self.assertEqual(array.dtype, np.float32, name)
+                scale = np.max(np.abs(ref[name]))
+                self.assertLess(np.max(np.abs(array - ref[name])) / scale,
+                                5e-6, f"{metal.__name__}.{name} FAILED")
+        values = batch.evaluate(Lead, 'rho', T, dtype=np.float32)
+        self.assertEqual(values['rho'].dtype, np.float32)
+        values = batch.derivatives(Lead, ['rho', 'cp'], T.astype('f4'))
+        self.assertEqual(values['cp'].dtype, np.float32)
+        out = np.empty(T.shape, dtype=np.float32)
+        batch.evaluate(Lead, 'cp', T.astype(np.float32), 2e5, out=out)
+        np.testing.assert_allclose(
+            out, batch.evaluate(Lead, 'cp', T, 2e5)['cp'], rtol=1e-6)
+        self.assertEqual(batch.evaluate(Lead, 'k', [700, 800])['k'].dtype,
+                         np.float64)
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'k', T,
+                          dtype=int)
+
+    def test_integral(self):
+        T_1 = np.array([[700.0, 800.0], [900.0, 1000.0]])
+        T_2 = T_1 + np.array([50.0, 0.0])
+        for metal in [Lead, LBE]:
+            for name, obj in metal._properties_to_use().items():
+                if obj.antiderivative(800.0) is None:
+                    continue
+                ref = _Quadrature(obj).integral(T_1, T_2)
+                np.testing.assert_allclose(
+                    batch.integral(metal, name, T_1, T_2)[name], ref,
+                    rtol=1e-9, err_msg=name)
+        values = batch.integral(Lead, 'cp', 700.0, 800.0,
+                                correlations={'cp': 'gurvich1991'})
+        h = batch.evaluate(Lead, 'h', [700.0, 800.0])['h']
+        self.assertAlmostEqual(values['cp'] / (h[1] - h[0]), 1, 2)
+        averages = batch.average(Lead, ['rho', 'k'], T_1, T_2)
+        np.testing.assert_allclose(
+            averages['rho'][:, 0],
+            batch.evaluate(Lead, 'rho', T_1[:, 0] + 25)['rho'])
+        np.testing.assert_array_equal(
+            averages['k'][:, 1], batch.evaluate(Lead, 'k', T_1[:, 1])['k'])
+        self.assertRaises(ValueError, batch.integral, Lead, 'cp', 500.0,
+                          700.0)
+
+    def test_integral_vs_quad(self):
+        # Intervals crossing the breakpoints of the piecewise correlations
+        for metal in [Lead, LBE, Bismuth]:
+            T_m0 = batch.liquid_range(metal)[0]
+            T_1 = np.array([T_m0 + 5.0, 700.0, 900.0])
+            T_2 = np.array([1200.0, 760.0, 1010.0])
+            values = batch.integral(metal, None, T_1, T_2)
+            for name, obj in batch.property_objects(metal).items():
+                ref = [quad(obj.correlation, a, b, epsabs=0, epsrel=1e-12,
+                            limit=200)[0] for a, b in zip(T_1, T_2)]
+                np.testing.assert_allclose(values[name], ref, rtol=1e-9,
+                                           err_msg=f"{metal.__name__} {name}")
+
+    def test_validity(self):
+        masks = batch.validity(Lead, 'k', [700.0, 1400.0])
+        np.testing.assert_array_equal(masks['k'], [True, False])
+
+    def test_liquid_range(self):
+        T_m0, T_b0 = batch.liquid_range(Lead)
+        T = np.array([[500.0, 700.0], [800.0, 2500.0]])
+        np.testing.assert_array_equal(
+            batch.validate_temperature(Lead, T, 'index'), [0, 3])
+        np.testing.assert_array_equal(
+            batch.validate_temperature(Lead, T, 'clip'),
+            [[T_m0, 700.0], [800.0, T_b0]])
+        values = batch.evaluate(Lead, ['rho', 'cp'], T, invalid='nan')
+        for name in ['rho', 'cp']:
+            self.assertTrue(np.all(np.isnan(values[name][[0, 1], [0, 1]])))
+            np.testing.assert_allclose(
+                values[name][[0, 1], [1, 0]],
+                batch.evaluate(Lead, name, [700.0, 800.0])[name])
+        out = np.empty(2, dtype=np.float32)
+        batch.evaluate(Lead, 'rho', np.array([700.0, 500.0], np.float32),
+                       out=out, invalid='clip')
+        self.assertAlmostEqual(out[1], Lead(T=T_m0 + 1e-9).rho, 2)
+        valid = np.array([700.0, 800.0])
+        self.assertIs(batch.validate_temperature(Lead, valid, 'nan'), valid)
+        self.assertEqual(
+            len(batch.validate_temperature(Lead, valid, 'index')), 0)
+        self.assertRaises(ValueError, batch.validate_temperature, Lead, T)
+        self.assertRaises(ValueError, batch.validate_temperature, Lead, T,
+                          'foo')
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'rho', T,
+                          invalid='index')
+
+    def test_errors(self):
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'rho', [500.0])
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'rho', 700.0, -1)
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'foo', 700.0)
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'cp', 700.0,
+                          correlations={'cp': 'foo'})
+
+
+class _Quadrature(PropertyInterface):
+    """
+    Property object integrating the correlation of the wrapped one by
+    quadrature only.
+    """
+    def __init__(self, wrapped):
+        super().__init__()
+        self.wrapped = wrapped
+
+    def correlation(self, T, p=atm, verbose=False):
+        return self.wrapped.correlation(T, p)
+
+    @property
+    def range(self):
+        return self.wrapped.range
+
+    @property
+    def units(self):
+        return self.wrapped.units
+
+    @property
+    def long_name(self):
+        return self.wrapped.long_name
+
+    @property
+    def description(self):
+        return self.wrapped.description
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# This test is used to check the cache of the property values against
+# the values returned by the liquid metal instances
+import unittest
+import sys
+import os
+import timeit
+import warnings
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15 import cache
+from lbh15.cache import PropertyCache
+
+warnings.filterwarnings("ignore")
+
+tol = 10
+
+
+class CacheTester(unittest.TestCase):
+
+    def test_values(self):
+        values = PropertyCache()
+        for T in [700.0, 800.0, 700.0]:
+            self.assertAlmostEqual(values.value(Lead, 'rho', T),
+                                   Lead(T=T).rho, tol)
+            self.assertAlmostEqual(values.value(LBE, 'k', T, 1e6),
+                                   LBE(T=T, p=1e6).k, tol)
+        Lead.set_correlation_to_use('cp', 'gurvich1991')
+        ref = Lead(T=800.0).cp
+        self.assertAlmostEqual(values.value(Lead, 'cp', 800.0), ref, tol)
+        Lead.set_correlation_to_use('cp', 'sobolev2011')
+        self.assertAlmostEqual(values.value(Lead, 'cp', 800.0),
+                               Lead(T=800.0).cp, tol)
+        self.assertAlmostEqual(values.value(Lead, 'cp', 800.0,
+                                            correlation='gurvich1991'),
+                               ref, tol)
+        self.assertEqual(values.info(), (3, 6, 0, 0, 6, 4096))
+
+    def test_quantization(self):
+        values = PropertyCache(T_resolution=0.1, T_tolerance=0.01)
+        ref = Lead(T=800.1).mu
+        self.assertAlmostEqual(values.value(Lead, 'mu', 800.1000001), ref,
+                               tol)
+        self.assertAlmostEqual(values.value(Lead, 'mu', 800.095), ref, tol)
+        self.assertAlmostEqual(values.value(Lead, 'mu', 800.05),
+                               Lead(T=800.05).mu, tol)
+        self.assertEqual(values.info()[:3], (1, 1, 1))
+        # Temperature above the melting one snapping below it
+        step = 0.5
+        T = batch.liquid_range(Lead)[0] + step / 4
+        values = PropertyCache(T_resolution=step)
+        self.assertLess(round(T / step) * step, T - step / 4)
+        self.assertAlmostEqual(values.value(Lead, 'mu', T), Lead(T=T).mu,
+                               tol)
+        self.assertEqual(values.info()[:3], (0, 0, 1))
+        values = PropertyCache(p_resolution=1e5)
+        self.assertAlmostEqual(values.value(Lead, 'rho', 800.0, 1.43e6),
+                               Lead(T=800.0, p=1.4e6).rho, tol)
+
+    def test_eviction(self):
+        values = PropertyCache(maxsize=3)
+        for T in [700.0, 710.0, 720.0, 700.0, 730.0, 740.0]:
+            values.value(Lead, 'k', T)
+        self.assertEqual(values.info(), (1, 5, 0, 2, 3, 3))
+        values.value(Lead, 'k', 700.0)
+        self.assertEqual(values.info().hits, 2)
+        values.resize(1)
+        self.assertEqual(values.info().evictions, 4)
+        values.clear()
+        self.assertEqual(values.info(), (0, 0, 0, 0, 0, 1))
+
+    def test_module_cache(self):
+        cache.configure(maxsize=10, T_resolution=0.5)
+        self.assertAlmostEqual(cache.value(Lead, 'rho', 700.2),
+                               Lead(T=700.0).rho, tol)
+        self.assertEqual(cache.info().misses, 1)
+        hit = timeit.timeit(lambda: cache.value(Lead, 'rho', 700.0),
+                            number=100)
+        instance = timeit.timeit(lambda: Lead(T=700.0).rho, number=100)
+        self.assertLess(hit, instance / 5)
+        cache.clear()
+        self.assertEqual(cache.info().currsize, 0)
+        cache.configure()
+
+    def test_errors(self):
+        values = PropertyCache()
+        self.assertRaises(ValueError, values.value, Lead, 'rho', 500.0)
+        self.assertRaises(ValueError, values.value, Lead, 'rho', 700.0, -1)
+        self.assertRaises(ValueError, values.value, Lead, 'foo', 700.0)
+        self.assertRaises(ValueError, values.value, Lead, 'cp', 700.0,
+                          correlation='foo')
+        self.assertRaises(ValueError, PropertyCache, -1)
+        self.assertRaises(ValueError, PropertyCache, 1, -0.1)
+        self.assertRaises(ValueError, PropertyCache, 1, 0.1, -0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
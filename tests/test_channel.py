@@ -0,0 +1,70 @@
+# This test is used to check the axial marching of many parallel channels
+# against the liquid metal instances initialized from specific enthalpy
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.channel import march
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+q = np.outer([0.5, 1.0, 1.5], np.sin(np.linspace(0.1, 3.0, 12))) * 1e6
+dz = 0.1
+perimeter = 0.05
+mass_flow = np.array([1.0, 2.0, 3.0])
+T_in = np.array([650.0, 700.0, 750.0])
+
+
+class ChannelTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        for metal in [Lead, LBE]:
+            with self.subTest(metal=metal.__name__):
+                result = march(metal, q, dz, perimeter, mass_flow, T_in)
+                self.assertEqual(result.T.shape, (3, 13))
+                for i in range(3):
+                    liquid_metal = metal(T=T_in[i])
+                    h = liquid_metal.h
+                    for j in range(12):
+                        h += q[i, j] * perimeter * dz / mass_flow[i]
+                        liquid_metal = metal(h=h)
+                        self.assertAlmostEqual(result.h[i, j + 1] / h, 1.0,
+                                               tol)
+                        self.assertAlmostEqual(result.T[i, j + 1],
+                                               liquid_metal.T, tol)
+                        for name, values in result.properties.items():
+                            self.assertAlmostEqual(
+                                values[i, j + 1] /
+                                getattr(liquid_metal, name), 1.0, tol)
+
+    def test_energy_balance(self):
+        dz_nodes = np.linspace(0.05, 0.15, 12)
+        result = march(Lead, q, dz_nodes, perimeter, mass_flow, T_in,
+                       properties=[])
+        power = (q * dz_nodes).sum(axis=1) * perimeter
+        np.testing.assert_allclose(
+            mass_flow * (result.h[:, -1] - result.h[:, 0]), power)
+        np.testing.assert_allclose(result.T[:, 0], T_in)
+        self.assertAlmostEqual(result.z[-1], dz_nodes.sum(), tol)
+        self.assertEqual(result.properties, {})
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            march(Lead, q[0], dz, perimeter, mass_flow[0], T_in[0])
+        with self.assertRaises(ValueError):
+            march(Lead, q, dz, perimeter, [1.0, 2.0], T_in)
+        with self.assertRaises(ValueError):
+            march(Lead, q, dz, perimeter, [1.0, 0.0, 2.0], T_in)
+        with self.assertRaises(ValueError):
+            march(Lead, q, dz, perimeter, mass_flow, 500.0)
+        with self.assertRaises(ValueError):
+            march(Lead, 1e3 * q, dz, perimeter, mass_flow, T_in)
+
+
+if __name__ == "__main__":
+    unittest.main()
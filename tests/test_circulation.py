@@ -0,0 +1,156 @@
+# This test is used to check the natural circulation solver against the
+# momentum balance solved by brentq with the liquid metal instances, and
+# the transient solver against the steady-state one
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+from scipy.constants import g
+from scipy.optimize import brentq
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.circulation import solve
+from lbh15.circulation import transient
+from lbh15.heat_transfer import friction_factor
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+# Rectangular loop, 4 m high and 1 m wide, heated at the bottom of the
+# rising leg and cooled at the top of the descending one
+elevation = np.concatenate([np.full(10, 0.4), np.zeros(5),
+                            np.full(10, -0.4), np.zeros(5)])
+length = np.abs(elevation) + np.concatenate([np.zeros(10), np.full(5, 0.2),
+                                             np.zeros(10), np.full(5, 0.2)])
+heated = np.zeros(30)
+heated[:3] = 1
+cooled = np.zeros(30)
+cooled[15:18] = 1
+diameter = 0.05
+area = np.pi * diameter**2 / 4
+K = np.zeros(30)
+K[[9, 14, 24, 29]] = 0.5
+
+
+def residual(m_dot, metal, power, T_in):
+    Q = power * (heated / heated.sum() - cooled / cooled.sum())
+    h = metal(T=T_in).h + (np.cumsum(Q) - Q / 2) / m_dot
+    rvalue = 0.0
+    for i in range(30):
+        liquid_metal = metal(h=h[i])
+        Re = m_dot * diameter / area / liquid_metal.mu
+        f = friction_factor(Re)[0]
+        rvalue += -g * liquid_metal.rho * elevation[i] \
+            - m_dot**2 * (f * length[i] / diameter + K[i]) \
+            / 2 / liquid_metal.rho / area**2
+    return rvalue
+
+
+class CirculationTester(unittest.TestCase):
+
+    def test_vs_brentq(self):
+        for metal in [Lead, LBE]:
+            with self.subTest(metal=metal.__name__):
+                result = solve(metal, length, elevation, diameter, area,
+                               1e4, heated, cooled, 673.0, K)
+                m_dot = brentq(residual, 0.1, 100.0,
+                               args=(metal, 1e4, 673.0), xtol=1e-12)
+                self.assertAlmostEqual(result.mass_flow / m_dot, 1.0, tol)
+                self.assertAlmostEqual(result.T[0],
+                                       metal(h=metal(T=673.0).h + 1e4 / 6
+                                             / m_dot).T, 6)
+
+    def test_sweep(self):
+        power = np.linspace(1e3, 5e4, 50)
+        T_in = np.array([[673.0], [773.0]])
+        result = solve(Lead, length, elevation, diameter, area, power,
+                       heated, cooled, T_in, K)
+        self.assertEqual(result.mass_flow.shape, (2, 50))
+        self.assertEqual(result.T.shape, (2, 50, 30))
+        self.assertTrue(np.all(np.diff(result.mass_flow, axis=-1) > 0))
+        for i, j in [(0, 0), (1, 49)]:
+            single = solve(Lead, length, elevation, diameter, area,
+                           power[j], heated, cooled, T_in[i, 0], K)
+            self.assertAlmostEqual(result.mass_flow[i, j] /
+                                   single.mass_flow, 1.0, tol)
+        np.testing.assert_allclose(result.T[..., -1],
+                                   np.broadcast_to(T_in, (2, 50)))
+        np.testing.assert_allclose(
+            result.velocity, result.mass_flow[..., None] / result.rho / area)
+        self.assertTrue(np.all(result.buoyancy > 0))
+
+    def test_transient(self):
+        power = np.array([5e3, 2e4])
+        initial = solve(Lead, length, elevation, diameter, area, 1e4, heated,
+                        cooled, 673.0, K)
+        final = solve(Lead, length, elevation, diameter, area, power, heated,
+                      cooled, 673.0, K)
+        result = transient(Lead, length, elevation, diameter, area, power,
+                           heated, cooled, 673.0, initial.mass_flow, 5.0,
+                           200, K)
+        self.assertEqual(result.mass_flow.shape, (200, 2))
+        self.assertEqual(result.T.shape, (200, 2, 30))
+        np.testing.assert_allclose(result.time[[0, -1]], [5.0, 1000.0])
+        # Monotonic approach to the new steady state
+        self.assertTrue(np.all(np.diff(result.mass_flow[:20, 0]) < 0))
+        self.assertTrue(np.all(np.diff(result.mass_flow[:20, 1]) > 0))
+        np.testing.assert_allclose(result.mass_flow[-1], final.mass_flow,
+                                   rtol=1e-6)
+        np.testing.assert_allclose(result.T[-1], final.T, rtol=1e-6)
+        np.testing.assert_allclose(result.buoyancy[-1], final.buoyancy,
+                                   rtol=1e-6)
+        # Single time step much longer than the loop time constant
+        result = transient(Lead, length, elevation, diameter, area, power,
+                           heated, cooled, 673.0, initial.mass_flow, 1e9, 1,
+                           K)
+        np.testing.assert_allclose(result.mass_flow[0], final.mass_flow,
+                                   rtol=1e-8)
+        # Steady state preserved
+        result = transient(Lead, length, elevation, diameter, area, 1e4,
+                           heated, cooled, 673.0, initial.mass_flow, 1.0, 5,
+                           K)
+        np.testing.assert_allclose(result.mass_flow, initial.mass_flow,
+                                   rtol=1e-8)
+
+    def test_transient_order(self):
+        # First order convergence of the implicit Euler method
+        initial = solve(Lead, length, elevation, diameter, area, 1e4, heated,
+                        cooled, 673.0, K)
+        values = [transient(Lead, length, elevation, diameter, area, 2e4,
+                            heated, cooled, 673.0, initial.mass_flow,
+                            10.0 / n, n, K).mass_flow[-1]
+                  for n in [10, 20, 40]]
+        ratio = (values[1] - values[0]) / (values[2] - values[1])
+        self.assertLess(abs(ratio - 2.0), 0.1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            solve(Lead, length, elevation, diameter, area, 1e4, cooled,
+                  heated, 673.0)
+        with self.assertRaises(ValueError):
+            solve(Lead, length, elevation + 0.1, diameter, area, 1e4, heated,
+                  cooled, 673.0)
+        with self.assertRaises(ValueError):
+            solve(Lead, length, elevation, diameter, area, 0.0, heated,
+                  cooled, 673.0)
+        with self.assertRaises(ValueError):
+            solve(Lead, length, elevation, diameter, area, 1e4, heated,
+                  cooled, 673.0, correlation='unknown')
+        with self.assertRaises(RuntimeError):
+            solve(Lead, length, elevation, diameter, area, 1e4, heated,
+                  cooled, 673.0, max_iter=1)
+        for mass_flow, time_step, n_steps in [(0.0, 1.0, 1), (1.0, 0.0, 1),
+                                              (1.0, 1.0, 0)]:
+            with self.assertRaises(ValueError):
+                transient(Lead, length, elevation, diameter, area, 1e4,
+                          heated, cooled, 673.0, mass_flow, time_step,
+                          n_steps)
+        with self.assertRaises(RuntimeError):
+            transient(Lead, length, elevation, diameter, area, 1e4, heated,
+                      cooled, 673.0, 1.0, 1.0, 1, max_iter=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# This test is used to check the tables and the streams written by the
+# command line interface against the batch evaluation of the properties
+import unittest
+import sys
+import os
+import io
+import tempfile
+import warnings
+import numpy as np
+from scipy.constants import convert_temperature
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import batch
+from lbh15 import cli
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+
+
+class CliTester(unittest.TestCase):
+
+    def test_table(self):
+        output = io.StringIO()
+        cli.write_table(Lead, ['rho', 'cp'], 700.0, 800.0, 0.5, output,
+                        correlations={'cp': 'gurvich1991'}, chunk_size=17)
+        table = np.loadtxt(io.StringIO(output.getvalue()))
+        np.testing.assert_allclose(table[:, 0], np.linspace(700, 800, 201))
+        values = batch.evaluate(Lead, ['rho', 'cp'], table[:, 0],
+                                correlations={'cp': 'gurvich1991'})
+        np.testing.assert_allclose(table[:, 1], values['rho'], rtol=1e-9)
+        np.testing.assert_allclose(table[:, 2], values['cp'], rtol=1e-9)
+        self.assertIn("gurvich1991", output.getvalue())
+
+    def test_stream(self):
+        data = np.loadtxt('data.dat')
+        outputs = []
+        for chunk_size in [5, 1000]:
+            output = io.StringIO()
+            with open('data.dat', 'r', encoding='utf-8') as source:
+                cli.stream(Lead, ['rho', 'k'], source, output, unit='C',
+                           chunk_size=chunk_size)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        result = np.loadtxt(io.StringIO(outputs[0]))
+        np.testing.assert_array_equal(result[:, :5], data)
+        values = batch.evaluate(Lead, ['rho', 'k'],
+                                convert_temperature(data[:, 0], 'C', 'K'))
+        np.testing.assert_allclose(result[:, 5], values['rho'], rtol=1e-9)
+        np.testing.assert_allclose(result[:, 6], values['k'], rtol=1e-9)
+
+    def test_stream_csv(self):
+        source = io.StringIO("# time,T\n0.0,700.0\n\n1.0,710.0\n")
+        output = io.StringIO()
+        cli.stream(Lead, ['rho'], source, output, column=1)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[1], "# time,T")
+        self.assertEqual(lines[2], "0.0,700.0,10545.35")
+        self.assertEqual(lines[3], "")
+        self.assertAlmostEqual(float(lines[4].split(',')[2]),
+                               Lead(T=710.0).rho, tol)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, 'table.dat')
+            status = cli.main(['table', '400', '500', '10', '-u', 'C',
+                               '-m', 'bismuth', '-p', 'mu', '-o',
+                               file_name])
+            self.assertEqual(status, 0)
+            self.assertEqual(np.loadtxt(file_name).shape, (11, 2))
+        self.assertEqual(cli.main(['stream', 'data.dat', '-p', 'rho']), 1)
+        self.assertEqual(cli.main(['table', '700', '800', '1', '-c',
+                                   'cp']), 1)
+        self.assertEqual(cli.main(['table', '700', '800', '1', '-p',
+                                   'foo']), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# This test is used to check the comparative evaluation of several liquid
+# metals against the batch evaluation of each one of them
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import Bismuth
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15.comparison import compare
+from lbh15.comparison import common_properties
+
+warnings.filterwarnings("ignore")
+
+T = np.linspace(450.0, 1900.0, 300).reshape(3, 100)
+
+
+class ComparisonTester(unittest.TestCase):
+
+    def test_vs_batch(self):
+        for workers in [1, 3]:
+            with self.subTest(workers=workers):
+                result = compare(T, workers=workers)
+                self.assertEqual(result.metals, ['Lead', 'Bismuth', 'LBE'])
+                self.assertEqual(list(result.values),
+                                 common_properties([Lead, Bismuth, LBE]))
+                for i, metal in enumerate([Lead, Bismuth, LBE]):
+                    T_m0, T_b0 = batch.liquid_range(metal)
+                    liquid = (T > T_m0) & (T < T_b0)
+                    np.testing.assert_array_equal(result.liquid[i], liquid)
+                    expected = batch.evaluate(metal, list(result.values),
+                                              T[liquid])
+                    validity = batch.validity(metal, list(result.values),
+                                              T[liquid])
+                    for name, values in result.values.items():
+                        self.assertEqual(values.shape, (3,) + T.shape)
+                        np.testing.assert_allclose(values[i][liquid],
+                                                   expected[name], 1e-12)
+                        self.assertTrue(np.all(np.isnan(values[i][~liquid])))
+                        np.testing.assert_array_equal(
+                            result.valid[name][i][liquid], validity[name])
+                        self.assertFalse(np.any(
+                            result.valid[name][i][~liquid]))
+
+    def test_selection(self):
+        result = compare(800.0, ['rho', 'cp'], 2e5, [LBE, Lead],
+                         {'Lead': {'cp': 'gurvich1991'}})
+        self.assertEqual(result.metals, ['LBE', 'Lead'])
+        self.assertEqual(result.values['rho'].shape, (2,))
+        lead = Lead(T=800.0, p=2e5)
+        lead.change_correlation_to_use('cp', 'gurvich1991')
+        lbe = LBE(T=800.0, p=2e5)
+        for name in ['rho', 'cp']:
+            self.assertAlmostEqual(result.values[name][1] /
+                                   getattr(lead, name), 1.0, 10)
+            self.assertAlmostEqual(result.values[name][0] /
+                                   getattr(lbe, name), 1.0, 10)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            compare(T, 'fe_dif')
+        with self.assertRaises(ValueError):
+            compare(T, 'rho', p=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
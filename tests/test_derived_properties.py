@@ -0,0 +1,97 @@
+# This test is used to check the thermodynamic properties derived from
+# the thermo-physical ones, for both instances and batch evaluation
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import Bismuth
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15 import profiling
+
+warnings.filterwarnings("ignore")
+
+DERIVED = ['cv', 'beta_T', 'gamma_G', 'rho_cp']
+
+
+class DerivedPropertiesTester(unittest.TestCase):
+
+    def test_identities(self):
+        for metal in [Lead, Bismuth, LBE]:
+            for T in [700.0, 900.0, 1000.0]:
+                liquid_metal = metal(T=T)
+                cp, cv = liquid_metal.cp, liquid_metal.cv
+                self.assertLess(cv, cp)
+                self.assertAlmostEqual(liquid_metal.beta_T * cv,
+                                       liquid_metal.beta_s * cp, 20)
+                self.assertAlmostEqual(
+                    liquid_metal.beta_T - liquid_metal.beta_s,
+                    T * liquid_metal.alpha**2 / liquid_metal.rho / cp, 20)
+                self.assertAlmostEqual(
+                    liquid_metal.gamma_G,
+                    liquid_metal.alpha / liquid_metal.rho / cv
+                    / liquid_metal.beta_T, 10)
+                self.assertAlmostEqual(liquid_metal.rho_cp,
+                                       liquid_metal.rho * cp, 6)
+
+    def test_correlations(self):
+        self.assertEqual(Lead(T=800.0).cv,
+                         batch.evaluate(Lead, 'cv', 800.0)['cv'])
+        # Derived properties follow the specific heat capacity correlation
+        gurvich = batch.evaluate(Lead, ['rho', 'cp', 'beta_s'] + DERIVED,
+                                 800.0, correlations={'cp': 'gurvich1991'})
+        self.assertNotAlmostEqual(gurvich['cp'], Lead(T=800.0).cp, 6)
+        self.assertAlmostEqual(gurvich['rho_cp'],
+                               gurvich['rho'] * gurvich['cp'], 6)
+        self.assertAlmostEqual(gurvich['beta_T'] * gurvich['cv'],
+                               gurvich['beta_s'] * gurvich['cp'], 20)
+        Lead.set_correlation_to_use('cp', 'gurvich1991')
+        lead = Lead(T=800.0)
+        self.assertRaises(ValueError, Lead.set_correlation_to_use, 'cv',
+                          'sobolev2011')
+        Lead.set_correlation_to_use('cp', 'sobolev2011')
+        for name in DERIVED:
+            self.assertEqual(getattr(lead, name), gurvich[name], name)
+        lead = Lead(T=800.0)
+        lead.change_correlation_to_use('cp', 'gurvich1991')
+        for name in DERIVED:
+            self.assertEqual(getattr(lead, name), gurvich[name], name)
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'cv', 800.0,
+                          correlations={'cp': 'gurvich1991',
+                                        'cv': 'sobolev2011'})
+        self.assertRaises(ValueError, batch.evaluate, Lead, 'cv', 800.0,
+                          correlations={'cv': 'gurvich1991'})
+
+    def test_init_fromX(self):
+        for metal in [Lead, Bismuth, LBE]:
+            for T in [700.0, 900.0]:
+                liquid_metal = metal(T=T)
+                for name in DERIVED:
+                    value = getattr(liquid_metal, name)
+                    fromX = metal(**{name: value})
+                    # Non-injective properties may provide another root
+                    self.assertAlmostEqual(getattr(fromX, name) / value, 1,
+                                           8, name + " FAILED")
+                    if name in ['beta_T', 'rho_cp']:
+                        self.assertAlmostEqual(fromX.T, T, 6,
+                                               name + " FAILED")
+
+    def test_batch(self):
+        T = np.linspace(700.0, 1000.0, 31)
+        with profiling.profile() as stats:
+            values = batch.evaluate(LBE, DERIVED + ['rho'], T)
+        self.assertEqual(sum(stats.correlation_calls.values()), 4)
+        out = {name: np.empty_like(T) for name in DERIVED}
+        batch.evaluate(LBE, DERIVED, T, out=out)
+        for name in DERIVED:
+            np.testing.assert_array_equal(out[name], values[name])
+            for i in [0, 15, 30]:
+                self.assertAlmostEqual(values[name][i] / getattr(
+                    LBE(T=T[i]), name), 1, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# This test is used to check the collection of the validity diagnostics
+# and that the package does not change the warnings filters
+import unittest
+import sys
+import os
+import subprocess
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import batch
+from lbh15 import diagnostics
+
+warnings.filterwarnings("ignore")
+
+MU_KEY = ('lead_properties', 'mu', 'lbh15')
+
+
+class DiagnosticsTester(unittest.TestCase):
+
+    def test_collect(self):
+        with diagnostics.collect() as collector:
+            for T in [1500.0, 1700.0, 1000.0]:
+                Lead(T=T).mu
+            batch.evaluate(Lead, ['mu', 'rho'], np.linspace(1400, 1900, 6))
+            Lead(T=1000.0).change_correlation_to_use('foo', 'bar')
+        self.assertIsNone(diagnostics._active)
+        violation = collector.violations[MU_KEY]
+        self.assertEqual(violation.calls, 3)
+        self.assertEqual(violation.count, 7)
+        self.assertEqual(violation.T_min, 1500.0)
+        self.assertEqual(violation.T_max, 1900.0)
+        self.assertEqual(violation.range, (600.6, 1473.0))
+        self.assertEqual(len(collector.violations), 1)
+        self.assertEqual(list(collector.messages.values()), [1])
+        self.assertIn('lead_properties.mu.lbh15: 7 values in 3 calls',
+                      collector.summary())
+        collector.reset()
+        self.assertEqual(collector.violations, {})
+
+    def test_policies(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with diagnostics.collect('warn_once') as collector:
+                for T in [1500.0, 1600.0, 1700.0]:
+                    Lead(T=T).mu
+            with diagnostics.collect('ignore') as ignored:
+                Lead(T=1500.0).mu
+            with diagnostics.collect('raise'):
+                self.assertRaises(ValueError, getattr, Lead(T=1500.0), 'mu')
+                self.assertRaises(ValueError, batch.evaluate, Lead, 'mu',
+                                  [1000.0, 1500.0])
+                batch.evaluate(Lead, 'mu', [1000.0, 1400.0])
+        self.assertEqual(len(caught), 1)
+        self.assertIn('1500.00 K', str(caught[0].message))
+        self.assertEqual(collector.violations[MU_KEY].calls, 3)
+        self.assertEqual(ignored.violations, {})
+        self.assertRaises(ValueError, diagnostics.Diagnostics, 'foo')
+
+    def test_warnings(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.assertAlmostEqual(Lead(T=1500.0).mu,
+                                   batch.evaluate(Lead, 'mu', 1500.0)['mu'])
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(caught[0].filename, __file__)
+
+    def test_filters(self):
+        code = ("import warnings; warnings.simplefilter('ignore'); "
+                "from lbh15 import Lead; Lead(T=1500.0).mu")
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=os.path.abspath('..'),
+                                capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stderr, b'')
+
+
+if __name__ == "__main__":
+    unittest.main()
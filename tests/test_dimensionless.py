@@ -0,0 +1,51 @@
+# This test is used to check the dimensionless groups computed
+# over arrays against the values returned by the liquid metal instances
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+from scipy.constants import g
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.dimensionless import dimensionless_groups
+
+warnings.filterwarnings("ignore")
+
+tol = 10
+Ts = np.linspace(700.0, 1100.0, 9)
+velocity = 1.5
+length = 0.01
+delta_T = 50.0
+
+
+class DimensionlessTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        for metal in [Lead, LBE]:
+            groups = dimensionless_groups(metal, Ts, velocity, length,
+                                          delta_T)
+            for i, T in enumerate(Ts):
+                liquid_metal = metal(T=T)
+                Re = liquid_metal.rho * velocity * length / liquid_metal.mu
+                Gr = (g * liquid_metal.alpha * delta_T * length**3
+                      * liquid_metal.rho**2 / liquid_metal.mu**2)
+                refs = {'Re': Re, 'Pr': liquid_metal.Pr,
+                        'Pe': Re * liquid_metal.Pr, 'Gr': Gr,
+                        'Ra': Gr * liquid_metal.Pr, 'Ri': Gr / Re**2}
+                for name, ref in refs.items():
+                    self.assertAlmostEqual(getattr(groups, name)[i] / ref,
+                                           1.0, tol, name + " FAILED")
+
+    def test_broadcast(self):
+        velocity_field = np.linspace(0.5, 2.0, 4).reshape(4, 1)
+        groups = dimensionless_groups(Lead, Ts, velocity_field, length)
+        self.assertEqual(groups.Re.shape, (4, len(Ts)))
+        self.assertEqual(groups.Pr.shape, (len(Ts),))
+        self.assertIsNone(groups.Gr)
+        self.assertIsNone(groups.Ri)
+
+
+if __name__ == "__main__":
+    unittest.main()
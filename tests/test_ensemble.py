@@ -0,0 +1,56 @@
+# This test is used to check the evaluation of all the correlations
+# of a property against the values returned by the liquid metal instances
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import Bismuth
+from lbh15.ensemble import ensemble
+
+warnings.filterwarnings("ignore")
+
+tol = 10
+Ts = np.linspace(750.0, 1500.0, 16)
+
+
+class EnsembleTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        for metal, name in [(Lead, 'o_pp'), (Lead, 'o_dif'),
+                            (Bismuth, 'fe_sol')]:
+            result = ensemble(metal, name, Ts)
+            default = metal.correlations_to_use()[name]
+            self.assertEqual(
+                sorted(metal.available_correlations(name)[name]),
+                result.correlations)
+            for i, corr_name in enumerate(result.correlations):
+                metal.set_correlation_to_use(name, corr_name)
+                for j, T in enumerate(Ts):
+                    self.assertAlmostEqual(
+                        result.values[i, j]
+                        / getattr(metal(T=T), name), 1.0, tol,
+                        f"{name} {corr_name} FAILED")
+            metal.set_correlation_to_use(name, default)
+
+    def test_envelopes(self):
+        result = ensemble(Lead, 'o_pp', Ts)
+        masked = np.ma.masked_array(result.values, ~result.valid)
+        any_valid = np.any(result.valid, axis=0)
+        np.testing.assert_allclose(result.min[any_valid],
+                                   masked.min(axis=0)[any_valid])
+        np.testing.assert_allclose(result.max[any_valid],
+                                   masked.max(axis=0)[any_valid])
+        self.assertTrue(np.all(np.isnan(result.spread[~any_valid])))
+        result = ensemble(Lead, 'o_pp', Ts, valid_only=False)
+        np.testing.assert_allclose(result.spread,
+                                   np.ptp(result.values, axis=0))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, ensemble, Lead, 'foo', Ts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# This test is used to check the heat transfer coefficients and the
+# pressure drops computed over arrays against the reference correlations
+# applied to the values returned by the liquid metal instances
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.heat_transfer import nusselt
+from lbh15.heat_transfer import friction_factor
+from lbh15.heat_transfer import heat_transfer
+from lbh15.heat_transfer import pressure_drop
+
+warnings.filterwarnings("ignore")
+
+tol = 10
+Ts = np.linspace(700.0, 1100.0, 9)
+velocity = 1.5
+diameter = 0.01
+length = 2.0
+
+
+class HeatTransferTester(unittest.TestCase):
+
+    def test_heat_transfer_vs_instances(self):
+        for metal in [Lead, LBE]:
+            result = heat_transfer(metal, Ts, velocity, diameter)
+            for i, T in enumerate(Ts):
+                liquid_metal = metal(T=T)
+                Pe = liquid_metal.rho * velocity * diameter \
+                    / liquid_metal.mu * liquid_metal.Pr
+                Nu = 7.0 + 0.025 * Pe**0.8
+                self.assertAlmostEqual(result.Nu[i] / Nu, 1.0, tol,
+                                       "Nu FAILED")
+                self.assertAlmostEqual(
+                    result.htc[i] / (Nu * liquid_metal.k / diameter),
+                    1.0, tol, "htc FAILED")
+            self.assertTrue(np.all(result.valid))
+
+    def test_pressure_drop_vs_instances(self):
+        result = pressure_drop(LBE, Ts, velocity, diameter, length)
+        for i, T in enumerate(Ts):
+            liquid_metal = LBE(T=T)
+            Re = liquid_metal.rho * velocity * diameter / liquid_metal.mu
+            f = 0.316 * Re**-0.25
+            dp = f * length / diameter * liquid_metal.rho * velocity**2 / 2
+            self.assertAlmostEqual(result.f[i] / f, 1.0, tol, "f FAILED")
+            self.assertAlmostEqual(result.dp[i] / dp, 1.0, tol, "dp FAILED")
+        reverse = pressure_drop(LBE, Ts, -velocity, diameter, length)
+        np.testing.assert_allclose(reverse.dp, -result.dp)
+
+    def test_bundle_validity(self):
+        Pe = np.array([10.0, 500.0, 500.0, 6000.0])
+        x = np.array([1.3, 1.3, 2.5, 1.3])
+        Nu, valid = nusselt(Pe, 'mikityuk', x)
+        np.testing.assert_array_equal(valid, [False, True, False, False])
+        self.assertAlmostEqual(
+            Nu[1], 0.047 * (1 - np.exp(-3.8 * 0.3)) * (500**0.77 + 250),
+            tol)
+        _, valid = nusselt(Pe, 'ushakov', x)
+        np.testing.assert_array_equal(valid, [True, True, False, False])
+        self.assertRaises(ValueError, nusselt, Pe, 'ushakov')
+        self.assertRaises(ValueError, nusselt, Pe, 'unknown')
+
+    def test_friction_factor(self):
+        f, valid = friction_factor([1e3, 1e4], 'laminar')
+        np.testing.assert_allclose(f, [0.064, 0.0064])
+        np.testing.assert_array_equal(valid, [True, False])
+        smooth, _ = friction_factor(1e5, 'haaland')
+        rough, _ = friction_factor(1e5, 'haaland', 1e-3)
+        self.assertGreater(rough, smooth)
+        self.assertAlmostEqual(smooth / 0.0178, 1.0, 1)
+
+    def test_broadcast(self):
+        x = np.linspace(1.2, 1.5, 4).reshape(4, 1)
+        result = heat_transfer(Lead, Ts, velocity, diameter, 'ushakov', x)
+        self.assertEqual(result.Nu.shape, (4, len(Ts)))
+        np.testing.assert_array_equal(result.valid[0], False)
+        self.assertTrue(np.all(result.valid[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import sys
 import os
 import json
 import inspect
+import importlib
 sys.path.insert(0, os.path.abspath('..'))
 import lbh15
 from lbh15.properties.interface import PropertyInterface
@@ -12,7 +13,7 @@ from lbh15.properties.interface import PropertyInterface
 def load_prop(module_name):
     propertyObjectList = []
     module = module_name
-    for name, obj in inspect.getmembers(sys.modules[module]):
+    for name, obj in inspect.getmembers(importlib.import_module(module)):
         if (inspect.isclass(obj) and obj is not PropertyInterface
                 and not inspect.isabstract(obj)):
             if issubclass(obj, PropertyInterface):
@@ -3,10 +3,13 @@ import unittest
 import sys
 import os
 import inspect
+import numpy as np
 sys.path.insert(0, os.path.abspath('..'))
 from lbh15.properties.interface import PropertyInterface
 from lbh15 import Lead
 from lbh15 import lead_properties
+from lbh15 import profiling
+from lbh15 import batch
 from scipy.constants import convert_temperature
 
 
@@ -111,5 +114,43 @@ class LeadLimitsTester(unittest.TestCase):
                 self.assertAlmostEqual(leadP.T, fromX.T, tol, name+" FAILED")
 
 
+class LeadWarmStartTester(unittest.TestCase):
+
+    def test_T_guess(self):
+        for leadP in leadPs:
+            for name in ['h', 'rho', 'mu', 'k']:
+                init_dict = {name: getattr(leadP, name)}
+                with profiling.profile() as stats:
+                    fromX = Lead(T_guess=leadP.T + 1.0, **init_dict)
+                self.assertAlmostEqual(leadP.T, fromX.T, tol,
+                                       name+" FAILED")
+                # Warm start converging within two correlation evaluations
+                self.assertEqual(stats.solver_calls['Lead', name], 1)
+                self.assertEqual(stats.solver_failures['Lead', name], 0)
+                self.assertLessEqual(stats.solver_evaluations['Lead', name],
+                                     2, name+" FAILED")
+
+    def test_T_guess_root(self):
+        # The guess lies on the other branch than the selected root
+        for root_index, T, T_guess in [(0, 1200.0, 1900.0),
+                                       (1, 1900.0, 1200.0)]:
+            Lead.set_root_to_use('cp', root_index)
+            cp = Lead(T=T).cp
+            fromX = Lead(T_guess=T_guess, cp=cp)
+            self.assertAlmostEqual(fromX.T, Lead(cp=cp).T, tol)
+            self.assertEqual(fromX.T > T_change_sobolev2011, root_index == 1)
+            np.testing.assert_allclose(
+                batch.temperature(Lead, 'cp', cp, T_guess=T_guess), T,
+                rtol=1e-10)
+        Lead.set_root_to_use('cp', 0)
+
+    def test_update(self):
+        lead = Lead(T=700.0)
+        for T in [700.5, 701.0, 750.0, 1200.0]:
+            lead.update(h=Lead(T=T).h)
+            self.assertAlmostEqual(lead.T, T, tol, "update FAILED")
+        self.assertRaises(ValueError, lead.update, h=1e5, rho=1e4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+# This test is used to check the mass transfer estimator against the
+# properties of the liquid metal instances
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import Bismuth
+from lbh15.mass_transfer import mass_transfer
+from lbh15.mass_transfer import sherwood
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+T = np.linspace(700.0, 1100.0, 9)
+area = np.linspace(1.0, 2.0, 9)
+velocity = 1.5
+diameter = 0.02
+
+
+class MassTransferTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        result = mass_transfer(Lead, T, velocity, diameter, ['fe', 'o'],
+                               correlation='harriott_hamilton')
+        for i, T_i in enumerate(T):
+            lead = Lead(T=T_i)
+            Re = lead.rho * velocity * diameter / lead.mu
+            self.assertAlmostEqual(result.Re[i] / Re, 1.0, tol)
+            for name in ['fe', 'o']:
+                D = getattr(lead, f"{name}_dif")
+                Sc = lead.mu / lead.rho / D
+                Sh = 0.0096 * Re**0.913 * Sc**0.346
+                self.assertAlmostEqual(result.Sc[name][i] / Sc, 1.0, tol)
+                self.assertAlmostEqual(result.K[name][i] /
+                                       (Sh * D / diameter), 1.0, tol)
+                self.assertAlmostEqual(
+                    result.C_sat[name][i] / getattr(lead, f"{name}_sol"),
+                    1.0, tol)
+
+    def test_balance(self):
+        for metal in [Lead, LBE, Bismuth]:
+            with self.subTest(metal=metal.__name__):
+                result = mass_transfer(metal, T, velocity, diameter,
+                                       area=area,
+                                       diffusivities={'ni': 1e-9})
+                self.assertIn('ni', result.flux)
+                for name, flux in result.flux.items():
+                    scale = np.abs(flux * area).sum()
+                    self.assertAlmostEqual((flux * area).sum() / scale, 0.0,
+                                           tol)
+                    self.assertLess(flux[0], 0.0)
+                    self.assertGreater(flux[-1], 0.0)
+
+    def test_concentration(self):
+        result = mass_transfer(LBE, T, velocity, diameter, ['fe'],
+                               concentration={'fe': 1e-4})
+        rho = np.array([LBE(T=T_i).rho for T_i in T])
+        np.testing.assert_allclose(
+            result.flux['fe'],
+            result.K['fe'] * rho * (result.C_sat['fe'] - 1e-4) / 100)
+
+    def test_validity(self):
+        result = mass_transfer(Lead, T, velocity, diameter, ['fe', 'o'],
+                               correlation='harriott_hamilton')
+        np.testing.assert_array_equal(result.property_valid['fe_dif'],
+                                      (T >= 973.0) & (T <= 1273.0))
+        np.testing.assert_array_equal(result.property_valid['fe_sol'],
+                                      (T >= 600.0) & (T <= 1173.0))
+        _, valid = sherwood(result.Re, result.Sc['fe'], 'harriott_hamilton')
+        np.testing.assert_array_equal(
+            result.valid['fe'], valid & (T >= 973.0) & (T <= 1173.0))
+        result = mass_transfer(Lead, T, velocity, diameter, ['o'],
+                               correlation='harriott_hamilton',
+                               diffusivities={'o': 1e-10})
+        self.assertNotIn('o_dif', result.property_valid)
+        self.assertTrue(np.all(result.valid['o']))
+        _, valid = sherwood([5e3, 5e4, 5e5], 1e3, 'harriott_hamilton')
+        np.testing.assert_array_equal(valid, [False, True, False])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            mass_transfer(Lead, T, velocity, diameter, ['co'])
+        with self.assertRaises(ValueError):
+            mass_transfer(Lead, T, velocity, diameter, ['ni'])
+        with self.assertRaises(ValueError):
+            mass_transfer(Bismuth, T, velocity, diameter, ['fe'])
+        with self.assertRaises(ValueError):
+            sherwood(1e4, 1e3, 'unknown')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# This test is used to check the Oxygen concentration window
+# computed over arrays of temperature values
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+from scipy.constants import R
+from scipy.constants import physical_constants
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.oxygen import oxygen_window
+from lbh15.oxygen import sensor_stream
+
+warnings.filterwarnings("ignore")
+
+tol = 10
+Ts = np.linspace(650.0, 1100.0, 10)
+
+
+class OxygenWindowTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        for metal in [Lead, LBE]:
+            window = oxygen_window(metal, Ts)
+            for i, T in enumerate(Ts):
+                liquid_metal = metal(T=T)
+                setpoint = (liquid_metal.o_sol + liquid_metal.lim_fe_sat) / 2
+                self.assertAlmostEqual(window.setpoint[i] / setpoint, 1.0,
+                                       tol, metal.__name__ + " FAILED")
+
+    def test_valid(self):
+        window = oxygen_window(Lead, Ts)
+        np.testing.assert_array_equal(window.valid,
+                                      (Ts >= 673) & (Ts <= 1000))
+
+    def test_setpoint_policies(self):
+        window = oxygen_window(Lead, Ts, setpoint='geometric')
+        np.testing.assert_allclose(window.setpoint,
+                                   np.sqrt(window.lower * window.upper))
+        window = oxygen_window(Lead, Ts, setpoint=0.0)
+        np.testing.assert_allclose(window.setpoint, window.lower)
+        self.assertRaises(ValueError, oxygen_window, Lead, Ts,
+                          setpoint='foo')
+        self.assertRaises(ValueError, oxygen_window, Lead, Ts, setpoint=2.0)
+
+    def test_impurity_concentration(self):
+        conc = np.array([1e-4, 1e-3])
+        window = oxygen_window(LBE, Ts.reshape(-1, 1), lower_limit='lim_fe',
+                               concentration=conc)
+        self.assertEqual(window.lower.shape, (10, 2))
+        liquid_lbe = LBE(T=Ts[3])
+        self.assertAlmostEqual(window.lower[3, 1]
+                               / (liquid_lbe.lim_fe / 1e-3**0.75), 1.0, tol)
+        self.assertRaises(ValueError, oxygen_window, LBE, Ts,
+                          lower_limit='lim_fe')
+
+
+class SensorStreamTester(unittest.TestCase):
+
+    def test_vs_instances(self):
+        p_O2 = np.logspace(-28, -20, 10)
+        for metal in [Lead, LBE]:
+            chunks = [(Ts[:4], p_O2[:4]), (Ts[4:], p_O2[4:])]
+            readings = list(sensor_stream(metal, chunks, scale='linear'))
+            self.assertEqual(len(readings), 2)
+            C_O = np.concatenate([r.concentration for r in readings])
+            position = np.concatenate([r.position for r in readings])
+            for i, T in enumerate(Ts):
+                liquid_metal = metal(T=T)
+                expected = np.sqrt(p_O2[i] / liquid_metal.o_pp)
+                self.assertAlmostEqual(C_O[i] / expected, 1.0, tol,
+                                       metal.__name__ + " FAILED")
+                self.assertAlmostEqual(
+                    position[i], (expected - liquid_metal.lim_fe_sat)
+                    / (liquid_metal.o_sol - liquid_metal.lim_fe_sat), tol,
+                    metal.__name__ + " FAILED")
+
+    def test_emf(self):
+        T = 800.0
+        p_O2 = oxygen_window(Lead, T).setpoint**2 * Lead(T=T).o_pp
+        reading = next(sensor_stream(Lead, [(T, p_O2)], scale='linear'))
+        self.assertAlmostEqual(reading.position, 0.5, tol)
+        p_O2 = oxygen_window(Lead, T, setpoint='geometric').setpoint**2 \
+            * Lead(T=T).o_pp
+        # Air reference electrode
+        p_ref = 0.21 * 101325.0
+        emf = R * T / 4 / physical_constants['Faraday constant'][0] \
+            * np.log(p_ref / p_O2)
+        for reference in [p_ref, lambda T: np.full(np.shape(T), p_ref)]:
+            reading = next(sensor_stream(Lead, [(T, emf)], 'emf',
+                                         reference))
+            self.assertAlmostEqual(reading.p_O2 / p_O2, 1.0, tol)
+            self.assertAlmostEqual(reading.position, 0.5, tol)
+
+    def test_lazy(self):
+        def chunks():
+            yield Ts, 1e-24
+            raise AssertionError("Chunk consumed too early")
+        stream = sensor_stream(Lead, chunks())
+        reading = next(stream)
+        self.assertEqual(reading.concentration.shape, Ts.shape)
+        np.testing.assert_array_equal(
+            reading.valid, oxygen_window(Lead, Ts).valid
+            & (Ts >= 783.0) & (Ts <= 973.0))
+
+    def test_dropout(self):
+        T = np.array([800.0, 0.0, 850.0, 2500.0])
+        chunks = [(T, 1e-24), (Ts, 1e-24)]
+        for signal in ['p_O2', 'emf']:
+            kwargs = {'reference': 1e-20} if signal == 'emf' else {}
+            readings = list(sensor_stream(Lead, chunks, signal, **kwargs))
+            self.assertEqual(len(readings), 2)
+            ref = next(sensor_stream(Lead, [(T[[0, 2]], 1e-24)], signal,
+                                     **kwargs))
+            np.testing.assert_array_equal(readings[0].valid,
+                                          [True, False, True, False])
+            self.assertTrue(np.all(np.isnan(
+                readings[0].concentration[[1, 3]])))
+            np.testing.assert_array_equal(
+                readings[0].concentration[[0, 2]], ref.concentration)
+            np.testing.assert_array_equal(readings[0].position[[0, 2]],
+                                          ref.position)
+        readings = list(sensor_stream(Lead, chunks, invalid='clip'))
+        np.testing.assert_array_equal(readings[0].valid,
+                                      [True, False, True, False])
+        with self.assertRaises(ValueError):
+            list(sensor_stream(Lead, chunks, invalid='raise'))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            next(sensor_stream(Lead, [(Ts, 1e-24)], invalid='index'))
+        with self.assertRaises(ValueError):
+            next(sensor_stream(Lead, [(Ts, 1e-24)], 'current'))
+        with self.assertRaises(ValueError):
+            next(sensor_stream(Lead, [(Ts, 0.1)], 'emf'))
+        with self.assertRaises(ValueError):
+            next(sensor_stream(Lead, [(Ts, 1e-24)], lower_limit='lim_fe'))
+        with self.assertRaises(ValueError):
+            next(sensor_stream(Lead, [(Ts, 1e-24)], scale='exp'))
+
+
+if __name__ == "__main__":
+    unittest.main()
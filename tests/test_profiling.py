@@ -0,0 +1,79 @@
+# This test is used to check the statistics collected on correlation
+# calls, temperature computations and registry builds
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15 import profiling
+
+warnings.filterwarnings("ignore")
+
+Ts = np.linspace(700.0, 1100.0, 9)
+
+
+class ProfilingTester(unittest.TestCase):
+
+    def test_disabled(self):
+        stats = profiling.Stats()
+        lead = Lead(T=700.0)
+        _ = lead.rho
+        batch.evaluate(Lead, 'rho', Ts)
+        self.assertIsNone(profiling._active)
+        self.assertEqual(len(stats.correlation_calls), 0)
+
+    def test_correlation_calls(self):
+        with profiling.profile() as stats:
+            lead = Lead(T=700.0)
+            _ = lead.rho
+            _ = lead.Pr
+            batch.evaluate(Lead, ['rho', 'k'], Ts)
+        key = ('lead_properties', 'rho', 'sobolev2008a')
+        self.assertEqual(stats.correlation_calls[key], 2)
+        self.assertEqual(stats.correlation_elements[key], 1 + len(Ts))
+        self.assertGreater(stats.correlation_time[key], 0.0)
+        self.assertEqual(stats.correlation_calls[
+            ('lead_properties', 'k', 'lbh15')], 2)
+        self.assertGreater(stats.total_time, 0.0)
+        self.assertIsNone(profiling._active)
+
+    def test_solver(self):
+        with profiling.profile() as stats:
+            LBE(h=1e5)
+            LBE(h=2e5)
+        self.assertEqual(stats.solver_calls[('LBE', 'h')], 2)
+        self.assertGreater(stats.solver_evaluations[('LBE', 'h')], 2)
+        self.assertEqual(stats.solver_failures[('LBE', 'h')], 0)
+        self.assertIn("LBE.h: 2 calls", stats.summary())
+
+    def test_registry_builds(self):
+        # Invalidate the registry, as done when adding custom properties
+        Lead._available_properties_dict = {}
+        Lead._available_correlations_dict = {}
+        with profiling.profile() as stats:
+            Lead(T=700.0)
+        self.assertEqual(stats.registry_builds['Lead'], 1)
+        with profiling.profile() as stats:
+            Lead(T=700.0)
+            Lead(T=800.0)
+        self.assertEqual(stats.registry_builds['Lead'], 0)
+
+    def test_nesting(self):
+        outer = profiling.enable()
+        with profiling.profile() as inner:
+            Lead(T=700.0).cp
+        self.assertIs(profiling._active, outer)
+        self.assertIs(profiling.disable(), outer)
+        self.assertEqual(len(outer.correlation_calls), 0)
+        self.assertEqual(len(inner.correlation_calls), 1)
+        inner.reset()
+        self.assertEqual(len(inner.correlation_calls), 0)
+        self.assertEqual(inner.summary().count("\t"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
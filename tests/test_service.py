@@ -0,0 +1,116 @@
+# This test is used to check the local property service and its clients
+# against the batch evaluation of the properties
+import unittest
+import sys
+import os
+import asyncio
+import subprocess
+import tempfile
+import threading
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15.service import PropertyServer
+from lbh15.client import AsyncClient
+from lbh15.client import Client
+from lbh15.client import ServiceError
+
+warnings.filterwarnings("ignore")
+
+
+class ServiceTester(unittest.TestCase):
+
+    def test_coalescing(self):
+        async def run():
+            async with PropertyServer(window=0.05) as server:
+                client = await AsyncClient.connect(port=server.address[1])
+                results = await asyncio.gather(
+                    *[client.evaluate('lead', ['rho', 'cp'], 700.0 + 10 * i)
+                      for i in range(20)],
+                    client.evaluate('lead', ['rho', 'cp'], [800.0, 900.0],
+                                    p=[1e5, 2e5]))
+                await client.close()
+                return results, server.requests, server.batches
+        results, requests, batches = asyncio.run(run())
+        self.assertEqual(requests, 21)
+        self.assertEqual(batches, 1)
+        ref = batch.evaluate(Lead, ['rho', 'cp'], 700.0 + 10 * np.arange(20))
+        for i, result in enumerate(results[:-1]):
+            self.assertAlmostEqual(result['rho'], ref['rho'][i], 8)
+            self.assertAlmostEqual(result['cp'], ref['cp'][i], 8)
+        ref = batch.evaluate(Lead, 'rho', [800.0, 900.0], [1e5, 2e5])
+        np.testing.assert_allclose(results[-1]['rho'], ref['rho'])
+
+    def test_errors(self):
+        async def run():
+            async with PropertyServer(window=0.05) as server:
+                client = await AsyncClient.connect(port=server.address[1])
+                results = await asyncio.gather(
+                    client.evaluate('lead', 'rho', 700.0),
+                    client.evaluate('lead', 'rho', 300.0),
+                    client.evaluate('lead', 'foo', 700.0),
+                    client.evaluate('tin', 'rho', 700.0),
+                    return_exceptions=True)
+                await client.close()
+                return results
+        results = asyncio.run(run())
+        self.assertAlmostEqual(results[0]['rho'], Lead(T=700.0).rho, 8)
+        for result in results[1:]:
+            self.assertIsInstance(result, ServiceError)
+
+    def test_malformed_request(self):
+        async def run():
+            async with PropertyServer(window=0.05) as server:
+                client = await AsyncClient.connect(port=server.address[1])
+                results = await asyncio.gather(
+                    client.evaluate('lead', 'rho', {'T': 700.0}),
+                    client.evaluate('lead', 'rho', 700.0),
+                    return_exceptions=True)
+                await client.close()
+                return results, server.batches
+        results, batches = asyncio.run(run())
+        self.assertEqual(batches, 1)
+        self.assertIsInstance(results[0], ServiceError)
+        self.assertAlmostEqual(results[1]['rho'], Lead(T=700.0).rho, 8)
+
+    def test_blocking_client(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lbh15.sock')
+            loop = asyncio.new_event_loop()
+            server = PropertyServer(path)
+            loop.run_until_complete(server.start())
+            thread = threading.Thread(target=loop.run_forever)
+            thread.start()
+            try:
+                with Client(path) as client:
+                    values = client.evaluate('lbe', 'h', np.array([600.0,
+                                                                   700.0]))
+                    T = client.temperature('lbe', 'h', values['h'])
+                    self.assertRaises(ServiceError, client.temperature,
+                                      'lbe', 'rho', 1.0)
+            finally:
+                asyncio.run_coroutine_threadsafe(server.close(),
+                                                 loop).result()
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+        np.testing.assert_allclose(values['h'],
+                                   batch.evaluate(LBE, 'h', [600.0,
+                                                             700.0])['h'])
+        np.testing.assert_allclose(T, [600.0, 700.0])
+
+    def test_client_imports(self):
+        code = ("import sys, lbh15.client; "
+                "assert 'scipy' not in sys.modules; "
+                "assert 'numpy' not in sys.modules")
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=os.path.abspath('..'),
+                                capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# This test is used to check the evaluation of the properties over shared
+# arrays against the batch evaluation
+import unittest
+import sys
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15.shared import SharedArray
+from lbh15.shared import SharedEvaluator
+
+warnings.filterwarnings("ignore")
+
+T_values = np.linspace(700.0, 1300.0, 1001).reshape(7, 143)
+
+
+def read_sum(descriptor):
+    with SharedArray.attach(descriptor) as array:
+        return float(np.sum(array.array))
+
+
+class SharedTester(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.evaluator = SharedEvaluator(2, chunk_size=300)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.evaluator.shutdown()
+
+    def test_evaluate(self):
+        with SharedArray.create(T_values.shape) as T, \
+                SharedArray.create(T_values.shape) as p, \
+                SharedArray.create(T_values.shape) as rho, \
+                SharedArray.create(T_values.shape, np.float32) as k:
+            T.array[...] = T_values
+            p.array[...] = np.linspace(1e5, 5e6, T_values.size) \
+                .reshape(T_values.shape)
+            self.evaluator.evaluate(LBE, T.descriptor,
+                                    {'rho': rho, 'k': k.descriptor}, p)
+            ref = batch.evaluate(LBE, ['rho', 'k'], T_values, p.array)
+            np.testing.assert_allclose(rho.array, ref['rho'], rtol=1e-14)
+            np.testing.assert_allclose(k.array, ref['k'], rtol=1e-6)
+            self.evaluator.evaluate(Lead, T, {'cp': rho},
+                                    correlations={'cp': 'gurvich1991'})
+            ref = batch.evaluate(Lead, 'cp', T_values,
+                                 correlations={'cp': 'gurvich1991'})
+            np.testing.assert_allclose(rho.array, ref['cp'], rtol=1e-14)
+
+    def test_attach(self):
+        with SharedArray.create(4) as array, ProcessPoolExecutor(1) as pool:
+            array.array[:] = [1.0, 2.0, 3.0, 4.0]
+            self.assertEqual(pool.submit(read_sum, array.descriptor)
+                             .result(), 10.0)
+
+    def test_errors(self):
+        with SharedArray.create(3) as T, SharedArray.create(4) as rho:
+            T.array[:] = [700.0, 800.0, 300.0]
+            self.assertRaises(ValueError, self.evaluator.evaluate, Lead, T,
+                              {'rho': rho})
+            self.assertRaises(ValueError, self.evaluator.evaluate, Lead, T,
+                              {'rho': np.empty(3)})
+            self.assertRaises(ValueError, self.evaluator.evaluate, Lead, T,
+                              {'foo': T})
+            with SharedArray.create(3) as out:
+                self.assertRaises(ValueError, self.evaluator.evaluate, Lead,
+                                  T, {'rho': out})
+        self.assertRaises(ValueError, SharedEvaluator, 1, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
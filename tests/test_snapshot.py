@@ -0,0 +1,94 @@
+# This test is used to check the state snapshots against the values
+# returned by the liquid metal instances
+import unittest
+import sys
+import os
+import io
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import Bismuth
+from lbh15 import batch
+from lbh15.snapshot import SnapshotLog
+from lbh15.snapshot import load
+from lbh15.snapshot import record_dtype
+
+tol = 10
+Ts = np.linspace(700.0, 1300.0, 7)
+
+
+class SnapshotTester(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings("ignore")
+
+    def test_instance(self):
+        for metal in [Lead, LBE, Bismuth]:
+            liquid_metal = metal(T=800.0, p=2e5)
+            record = liquid_metal.snapshot()
+            self.assertEqual(record.shape, ())
+            self.assertEqual(record['T'], 800.0)
+            self.assertEqual(record['p'], 2e5)
+            names = record.dtype.names[2:]
+            self.assertEqual(list(names), sorted(names))
+            for name in names:
+                self.assertAlmostEqual(record[name],
+                                       getattr(liquid_metal, name), tol)
+            units = record.dtype.metadata['units']
+            self.assertEqual(units['T'], '[K]')
+            self.assertEqual(units['rho'], '[kg/m^3]')
+            self.assertEqual(
+                record.dtype.metadata['correlations']['rho'],
+                batch.property_objects(metal, 'rho')['rho']
+                .correlation_name)
+        record = Lead(T=800.0).snapshot(['rho', 'cp'])
+        self.assertEqual(record.dtype.names, ('T', 'p', 'rho', 'cp'))
+        self.assertRaises(ValueError, Lead(T=800.0).snapshot, ['foo'])
+
+    def test_batch(self):
+        records = batch.snapshot(LBE, Ts.reshape(7, 1), [1e5, 1e6])
+        self.assertEqual(records.shape, (7, 2))
+        self.assertEqual(records.dtype, LBE(T=800.0).snapshot().dtype)
+        values = batch.evaluate(LBE, None, Ts.reshape(7, 1), [1e5, 1e6])
+        for name, array in values.items():
+            np.testing.assert_allclose(records[name], array, rtol=1e-14)
+        np.testing.assert_array_equal(records['p'][:, 1], 1e6)
+        records = batch.snapshot(Lead, Ts.astype(np.float32),
+                                 properties=['k'],
+                                 correlations={'k': 'lbh15'})
+        self.assertEqual(records.dtype['k'], np.float32)
+
+    def test_log(self):
+        liquid_metal = Lead(T=700.0)
+        log = SnapshotLog(liquid_metal.snapshot().dtype, capacity=4)
+        for T in Ts:
+            liquid_metal.T = T
+            log.append(liquid_metal.snapshot())
+        log.append(batch.snapshot(Lead, Ts))
+        self.assertEqual(len(log), 14)
+        self.assertEqual(log.capacity, 16)
+        np.testing.assert_array_equal(log.records['T'][:7], Ts)
+        np.testing.assert_allclose(log.records['cp'][:7],
+                                   log.records['cp'][7:], rtol=1e-14)
+        self.assertRaises(ValueError, log.append,
+                          Lead(T=700.0).snapshot(['rho']))
+        self.assertRaises(ValueError, SnapshotLog, np.dtype(float))
+        buffer = io.BytesIO()
+        log.save(buffer)
+        buffer.seek(0)
+        records = load(buffer)
+        np.testing.assert_array_equal(records, log.records)
+        self.assertEqual(records.dtype.metadata['units']['mu'], '[Pa*s]')
+
+    def test_dtype(self):
+        objects = batch.property_objects(Bismuth, ['rho', 'k'])
+        dtype = record_dtype(objects)
+        self.assertIs(dtype, record_dtype(objects))
+        self.assertEqual(dtype.metadata['long_names']['k'],
+                         objects['k'].long_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
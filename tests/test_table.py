@@ -0,0 +1,90 @@
+# This test is used to check the property tables against the batch
+# evaluation of the properties
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15 import batch
+from lbh15.table import PropertyTable
+
+warnings.filterwarnings("ignore")
+
+Ts = np.linspace(700.0, 1300.0, 61)
+
+
+class TableTester(unittest.TestCase):
+
+    def test_lazy_columns(self):
+        table = PropertyTable(LBE, Ts, 2e5)
+        self.assertEqual(table.computed, [])
+        self.assertEqual(len(table), 61)
+        self.assertIn('rho', table)
+        self.assertEqual(table.names[:2], ['T', 'p'])
+        values = batch.evaluate(LBE, ['rho', 'k'], Ts, 2e5)
+        np.testing.assert_allclose(table['rho'], values['rho'], rtol=1e-14)
+        np.testing.assert_allclose(table['k'], values['k'], rtol=1e-14)
+        self.assertEqual(table.computed, ['rho', 'k'])
+        self.assertTrue(np.shares_memory(table['rho'], table['rho']))
+        self.assertFalse(table['rho'].flags.writeable)
+        self.assertEqual(table.units['rho'], '[kg/m^3]')
+        self.assertEqual(table.long_names['T'], 'temperature')
+        self.assertRaises(KeyError, table.__getitem__, 'foo')
+
+    def test_correlations(self):
+        table = PropertyTable(Lead, Ts, correlations={'cp': 'gurvich1991'})
+        Lead.set_correlation_to_use('cp', 'sobolev2011')
+        ref = batch.evaluate(Lead, 'cp', Ts,
+                             correlations={'cp': 'gurvich1991'})['cp']
+        np.testing.assert_allclose(table['cp'], ref, rtol=1e-14)
+        self.assertEqual(table.property_objects['cp'].correlation_name,
+                         'gurvich1991')
+
+    def test_select(self):
+        table = PropertyTable(Lead, Ts)
+        rho = table['rho']
+        selected = table.select(800.0, 900.0)
+        np.testing.assert_array_equal(selected['T'], Ts[10:21])
+        self.assertTrue(np.shares_memory(selected['rho'], rho))
+        np.testing.assert_allclose(selected['mu'],
+                                   batch.evaluate(Lead, 'mu',
+                                                  Ts[10:21])['mu'])
+        self.assertEqual(table.computed, ['rho'])
+        shuffled = PropertyTable(Lead, Ts[::-1], np.linspace(1e5, 2e5, 61))
+        selected = shuffled.select(T_max=710.0)
+        np.testing.assert_array_equal(selected['T'], [710.0, 700.0])
+        np.testing.assert_allclose(selected['p'], [1.9833333e5, 2e5])
+
+    def test_append(self):
+        table = PropertyTable(Lead, Ts[:10])
+        table['h']
+        for T in Ts[10:]:
+            table.append(T)
+        table.append(Ts[:3], [1e5, 2e5, 3e5])
+        np.testing.assert_array_equal(table['T'][:61], Ts)
+        ref = batch.evaluate(Lead, ['h', 'k'], Ts)
+        np.testing.assert_allclose(table['h'][:61], ref['h'], rtol=1e-14)
+        np.testing.assert_allclose(table['k'][:61], ref['k'], rtol=1e-14)
+        np.testing.assert_allclose(
+            table['h'][61:],
+            batch.evaluate(Lead, 'h', Ts[:3], [1e5, 2e5, 3e5])['h'])
+        self.assertEqual(table.select(700.0, 700.0)['T'].tolist(),
+                         [700.0, 700.0])
+        records = table.to_records(['rho'])
+        self.assertEqual(records.dtype.names, ('T', 'p', 'rho'))
+        np.testing.assert_array_equal(records['rho'], table['rho'])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, PropertyTable, Lead, [500.0])
+        self.assertRaises(ValueError, PropertyTable, Lead, [[700.0]])
+        self.assertRaises(ValueError, PropertyTable, Lead, Ts, [1e5, 2e5])
+        table = PropertyTable(Lead, Ts)
+        self.assertRaises(ValueError, table.append, 3000.0)
+        self.assertEqual(len(table), 61)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# This test is used to check the time integration of the heat balance
+# equation against the fsolve-based scheme of the oxygen control tutorial
+import unittest
+import sys
+import os
+import copy
+import warnings
+import numpy as np
+from scipy.optimize import fsolve
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import LBE
+from lbh15.transient import integrate
+
+warnings.filterwarnings("ignore")
+
+tol = 8
+time, delta_t = np.linspace(0, 20, 101, retstep=True)
+Qin = 2.1e6 * np.heaviside(time - 10, 0.5)
+Qout = -1e6
+
+
+def eqn_to_solve(T_new, lead, Q):
+    T_old = lead.T
+    lead_avg = copy.deepcopy(lead)
+    lead_avg.T = (T_old + T_new[0]) / 2.0
+    return lead_avg.rho * lead_avg.cp * (T_new - T_old) / delta_t - Q
+
+
+class TransientTester(unittest.TestCase):
+
+    def test_vs_fsolve(self):
+        result = integrate(Lead, 800.0, time, Qin, Qout)
+        lead = Lead(T=800.0)
+        for i in range(1, len(time)):
+            T_new = fsolve(eqn_to_solve, x0=[lead.T],
+                           args=(lead, Qin[i] + Qout), xtol=1e-10)[0]
+            self.assertAlmostEqual(result.T[i], T_new, tol)
+            lead.T = T_new
+
+    def test_nodes(self):
+        T0 = np.array([700.0, 800.0, 900.0])
+        Q = np.outer(Qin, [1.0, 2.0, 3.0])
+        result = integrate(LBE, T0, time, Q, Qout)
+        self.assertEqual(result.T.shape, (len(time), 3))
+        for j in range(3):
+            single = integrate(LBE, T0[j], time, Q[:, j], Qout)
+            np.testing.assert_allclose(result.T[:, j], single.T, rtol=1e-12)
+        self.assertTrue(np.all(result.iterations <= 3))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, integrate, Lead, 800.0, time,
+                          Qin[:-1])
+        self.assertRaises(ValueError, integrate, Lead, 500.0, time, Qin)
+
+
+if __name__ == "__main__":
+    unittest.main()
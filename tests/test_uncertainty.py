@@ -0,0 +1,80 @@
+# This test is used to check the Monte Carlo propagation of the
+# uncertainty on temperature and on the choice of the correlations
+import unittest
+import sys
+import os
+import warnings
+import numpy as np
+sys.path.insert(0, os.path.abspath('..'))
+from lbh15 import Lead
+from lbh15 import batch
+from lbh15.uncertainty import propagate
+
+warnings.filterwarnings("ignore")
+
+
+def prandtl(values):
+    return values['cp'] * values['mu'] / values['k']
+
+
+class UncertaintyTester(unittest.TestCase):
+
+    def test_reproducibility(self):
+        args = (Lead, ['cp', 'mu', 'k'], 100000, 'normal',
+                {'loc': 800.0, 'scale': 10.0}, prandtl)
+        res_1 = propagate(*args, seed=7, chunk_size=30000, workers=1)
+        res_2 = propagate(*args, seed=7, chunk_size=30000, workers=4)
+        np.testing.assert_array_equal(res_1.samples, res_2.samples)
+        res_3 = propagate(*args, seed=8, chunk_size=30000)
+        self.assertFalse(np.array_equal(res_1.samples, res_3.samples))
+
+    def test_statistics(self):
+        result = propagate(Lead, 'k', 200000, 'uniform',
+                           {'low': 800.0, 'high': 1200.0}, seed=0)
+        self.assertAlmostEqual(result.mean, 9.2 + 0.011 * 1000, 2)
+        self.assertAlmostEqual(result.percentiles[5],
+                               9.2 + 0.011 * 820, 1)
+        self.assertAlmostEqual(result.percentiles[95],
+                               9.2 + 0.011 * 1180, 1)
+
+    def test_correlations(self):
+        T = 1100.0
+        result = propagate(Lead, 'o_pp', 10000, 'uniform',
+                           {'low': T, 'high': T}, seed=0,
+                           correlations={'o_pp': ['otsuka1979',
+                                                  'fisher1966']})
+        refs = [batch.evaluate(Lead, 'o_pp', T,
+                               correlations={'o_pp': c})['o_pp']
+                for c in ['otsuka1979', 'fisher1966']]
+        for ref in refs:
+            self.assertTrue(np.any(np.isclose(result.samples, ref)))
+        self.assertTrue(np.all(np.isclose(result.samples, refs[0])
+                               | np.isclose(result.samples, refs[1])))
+
+    def test_field(self):
+        loc = np.array([750.0, 850.0, 950.0])
+        result = propagate(Lead, 'rho', 1000, 'normal',
+                           {'loc': loc, 'scale': 1.0}, seed=0)
+        self.assertEqual(result.samples.shape, (1000, 3))
+        self.assertEqual(result.percentiles[50].shape, (3,))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, propagate, Lead, ['cp', 'k'], 10,
+                          'normal', {'loc': 800.0, 'scale': 1.0})
+        self.assertRaises(ValueError, propagate, Lead, 'k', 10,
+                          'foo', {'loc': 800.0, 'scale': 1.0})
+        self.assertRaises(ValueError, propagate, Lead, 'k', 10,
+                          'uniform', {'low': 400.0, 'high': 800.0})
+        self.assertRaises(ValueError, propagate, Lead, 'cp', 10,
+                          'uniform', {'low': 700.0, 'high': 800.0},
+                          correlations={'cp': ['foo']})
+        for n_samples in [0, -10]:
+            self.assertRaises(ValueError, propagate, Lead, 'cp', n_samples,
+                              'uniform', {'low': 700.0, 'high': 800.0})
+        self.assertRaises(ValueError, propagate, Lead, 'cp', 10,
+                          'uniform', {'low': 700.0, 'high': 800.0},
+                          chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
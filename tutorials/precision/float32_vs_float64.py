@@ -0,0 +1,59 @@
+"""
+Benchmark comparing the batch evaluation of the liquid metal properties
+in single and double precision on a large temperature field.
+
+For each liquid metal, the script prints the throughput of both
+precisions, in millions of elements per second, together with the
+maximum deviation of the single precision values from the double
+precision ones for each property, normalized by the maximum absolute
+value of the property over the field. The double precision reference is evaluated on
+the single precision temperatures, so that the deviation is not affected
+by the rounding of the temperature values, which may switch the branch
+of the piecewise correlations close to their breakpoints.
+"""
+import time
+import warnings
+import numpy as np
+from lbh15 import Lead, LBE, Bismuth # LBH15 package
+from lbh15 import batch
+
+warnings.filterwarnings("ignore")
+
+######
+# Data
+n_elements: int = 2_000_000 # Number of elements of the field [-]
+T_min: float = 700.0 # Minimum temperature of the field [K]
+T_max: float = 1300.0 # Maximum temperature of the field [K]
+repeats: int = 3 # Number of timed evaluations, the fastest is kept [-]
+
+
+def throughput(metal, T, out):
+    """Returns the evaluation throughput in millions of elements per second"""
+    batch.evaluate(metal, list(out), T, out=out)
+    elapsed = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        batch.evaluate(metal, list(out), T, out=out)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return T.size / elapsed / 1e6
+
+
+T64 = np.linspace(T_min, T_max, n_elements)
+T32 = T64.astype(np.float32)
+for metal in [Lead, LBE, Bismuth]:
+    names = ['rho', 'cp', 'mu', 'k']
+    out64 = {name: np.empty(n_elements) for name in names}
+    out32 = {name: np.empty(n_elements, dtype=np.float32) for name in names}
+    print(f"{metal.__name__}: {', '.join(names)} on {n_elements} elements")
+    print(f"\tfloat64: {throughput(metal, T64, out64):.1f} Melements/s")
+    print(f"\tfloat32: {throughput(metal, T32, out32):.1f} Melements/s")
+    ref = batch.evaluate(metal, None, T32.astype(np.float64))
+    values = batch.evaluate(metal, None, T32)
+    deviations = {name: np.max(np.abs(values[name] - ref[name]))
+                  / np.max(np.abs(ref[name])) for name in ref}
+    worst = max(deviations, key=deviations.get)
+    print(f"\tmaximum normalized deviation: {deviations[worst]:.1e} "
+          f"({worst})")
+    # Deviations of all the properties, as reported in the documentation
+    for name in sorted(deviations, key=deviations.get, reverse=True):
+        print(f"\t\t{name}: {deviations[name]:.2e}")